@@ -0,0 +1,62 @@
+module SamplerServer
+
+using GenerateLinext: generate_linext!
+using GenerateWeakOrder: PartialSumType, generate_partial_sum, random_ranking
+using GenerateWeakOrderExt:
+    WE, decode_weak_order_ext, generate_WE, generate_weak_order_ext
+using JLD2
+using Memoization
+using Poset: subset_lattice
+using Random
+using UnPack
+
+import GenerateWeakOrder, GenerateWeakOrderExt
+
+@memoize function partial_sum(M)
+    filename = joinpath(pkgdir(GenerateWeakOrder), "S", "$M.jld2")
+    if isfile(filename)
+        return load_object(filename)::Vector{PartialSumType}
+    end
+    S = generate_partial_sum(M)
+    save_object(filename, S)
+    return S
+end
+
+@memoize function weak_order_ext_graph(M)
+    filename = joinpath(pkgdir(GenerateWeakOrderExt), "WE", "$M.jld2")
+    return jldopen(filename, "a") do file
+        if isempty(file)
+            @unpack labels, nb_paths = generate_WE(M)
+            @pack! file = labels, nb_paths
+        end
+
+        WE(file)
+    end
+end
+
+sample(::Val{:generate_linext}, M) = M |> subset_lattice |> generate_linext!
+sample(::Val{:generate_weak_order}, M) = random_ranking(M, partial_sum(M))
+sample(::Val{:generate_weak_order_ext}, M) =
+    M |> weak_order_ext_graph |> generate_weak_order_ext |> decode_weak_order_ext
+
+# Each request line is "<script> <M> <seed>...", with "-" for no seed.
+# The answer is one line per seed, or a single line starting with "ERROR".
+function @main(args)
+    for line in eachline(stdin)
+        script, M, seeds... = split(line)
+        try
+            results = map(seeds) do seed
+                Random.seed!(seed == "-" ? nothing : parse(UInt, seed))
+                return sample(Val(Symbol(script)), parse(UInt, M))
+            end
+            foreach(println, results)
+        catch e
+            println("ERROR ", replace(sprint(showerror, e), '\n' => ' '))
+        end
+        flush(stdout)
+    end
+
+    return 0
+end
+
+end # module SamplerServer
@@ -1,8 +1,10 @@
 from .args import parse_args
+from .function import use_sampler
 from .script_enum import ScriptEnum
 
 # Parse arguments
 args = vars(parse_args())
+use_sampler(args.pop("sampler"))
 
 
 # Run script
@@ -1,8 +1,16 @@
 import argparse
 
+from .function import SamplerEnum
 from .script_enum import ScriptEnum
 
 parser = argparse.ArgumentParser()
+parser.add_argument(
+    "--sampler",
+    type=SamplerEnum,
+    choices=SamplerEnum,
+    default=SamplerEnum.AUTO,
+    help="Samplers",
+)
 
 subparsers = parser.add_subparsers(dest="script", required=True, help="Julia script")
 
@@ -24,6 +32,14 @@ parser_weak_order_ext = subparsers.add_parser(
 parser_weak_order_ext.add_argument("m", type=int, help="Number of criteria")
 parser_weak_order_ext.add_argument("-s", "--seed", type=int, help="Random seed")
 
+parser_check_uniformity = subparsers.add_parser(
+    ScriptEnum.CHECK_UNIFORMITY.name,
+    help="Check uniformity of generated weak order extensions (p-value)",
+)
+parser_check_uniformity.add_argument("m", type=int, help="Number of criteria")
+parser_check_uniformity.add_argument("n", nargs="?", type=int, help="Number of samples")
+parser_check_uniformity.add_argument("-s", "--seed", type=int, help="Random seed")
+
 
 def parse_args():
     return parser.parse_args()
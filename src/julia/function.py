@@ -1,10 +1,24 @@
 import ast
+import atexit
+import os
+from collections.abc import Sequence
+from enum import auto
 from itertools import chain
-from subprocess import run
+from subprocess import PIPE, Popen, run
 from typing import Any
 
+from src.case_insensitive_str_enum import CaseInsensitiveStrEnum
 from src.utils import CustomException
 
+from .native import (
+    NATIVE_MAX_CRIT,
+    native_generate_linext,
+    native_generate_weak_order,
+    native_generate_weak_order_ext,
+)
+
+SAMPLER_SERVER = "sampler_server"
+
 
 def run_julia(scriptname: str, *args: Any, **kwargs: Any):
     return run(
@@ -29,22 +43,161 @@ def python_exec(s: str):
         raise CustomException(f"Julia output : {s}")
 
 
-def generate_linext(m: int, seed: int | None = None) -> list[list[int]]:
-    linext = python_exec(run_julia("generate_linext", m, seed=seed))
+class SamplerServer:
+    """This class runs a long-lived Julia process loading the samplers once.
+
+    Requests are lines ``<script> <m> <seed>...`` written on its standard
+    input, answered with one line per seed on its standard output.
+
+    :param executable:
+    """
+
+    def __init__(self, executable: str = SAMPLER_SERVER):
+        self.pid = os.getpid()
+        self.process = Popen(
+            [executable], stdin=PIPE, stdout=PIPE, text=True, bufsize=1
+        )
+
+    def request(self, scriptname: str, m: int, seeds: Sequence[int | None]):
+        assert self.process.stdin and self.process.stdout
+        if not seeds:
+            return []
+        self.process.stdin.write(
+            " ".join(
+                [scriptname, str(m)] + ["-" if s is None else str(s) for s in seeds]
+            )
+            + "\n"
+        )
+        self.process.stdin.flush()
+
+        lines = [self.process.stdout.readline()]
+        if not lines[0]:
+            raise EOFError("Julia sampler server stopped")
+        if lines[0].startswith("ERROR"):
+            raise CustomException(f"Julia output : {lines[0]}")
+        lines += [self.process.stdout.readline() for _ in range(len(seeds) - 1)]
+        return lines
+
+    def close(self):
+        if self.process.poll() is None:
+            self.process.terminate()
+
+
+_sampler_server: SamplerServer | None = None
+_sampler_server_failed = False
+
+
+def sampler_server():
+    """Return the sampler server of this process, starting it if needed.
+
+    :return: ``None`` if the server cannot be started
+    """
+    global _sampler_server, _sampler_server_failed
+    if _sampler_server_failed:
+        return None
+    if _sampler_server is None or _sampler_server.pid != os.getpid():
+        try:
+            _sampler_server = SamplerServer()
+        except OSError:
+            _sampler_server_failed = True
+            return None
+        atexit.register(_sampler_server.close)
+    return _sampler_server
+
+
+def run_julia_batch(scriptname: str, m: int, seeds: Sequence[int | None]):
+    """Run a Julia sampler for several seeds, through the sampler server if
+    available, otherwise with one process per seed.
+
+    :param scriptname:
+    :param m:
+    :param seeds:
+    :return: outputs of the sampler
+    :raise CustomException: if the sampler fails
+    """
+    global _sampler_server, _sampler_server_failed
+    if server := sampler_server():
+        try:
+            return server.request(scriptname, m, seeds)
+        except (OSError, EOFError):
+            server.close()
+            _sampler_server = None
+            _sampler_server_failed = True
+    return [run_julia(scriptname, m, seed=seed) for seed in seeds]
+
+
+def decode_linext(s: str) -> list[list[int]]:
+    linext = python_exec(s)
     for l in linext:
         for i in range(len(l)):
             l[i] -= 1
     return linext
 
 
-def generate_weak_order(m: int, seed: int | None = None) -> list[int]:
-    return python_exec(run_julia("generate_weak_order", m, seed=seed))
-
-
-def generate_weak_order_ext(m: int, seed: int | None = None) -> list[list[list[int]]]:
-    weak_order = python_exec(run_julia("generate_weak_order_ext", m, seed=seed))
+def decode_weak_order_ext(s: str) -> list[list[list[int]]]:
+    weak_order = python_exec(s)
     for l in weak_order:
         for ll in l:
             for i in range(len(ll)):
                 ll[i] -= 1
     return weak_order
+
+
+def julia_generate_linext(m: int, seed: int | None = None) -> list[list[int]]:
+    return decode_linext(run_julia_batch("generate_linext", m, [seed])[0])
+
+
+def julia_generate_weak_order(m: int, seed: int | None = None) -> list[int]:
+    return python_exec(run_julia_batch("generate_weak_order", m, [seed])[0])
+
+
+def julia_generate_weak_order_ext(
+    m: int, seed: int | None = None
+) -> list[list[list[int]]]:
+    return decode_weak_order_ext(
+        run_julia_batch("generate_weak_order_ext", m, [seed])[0]
+    )
+
+
+class SamplerEnum(CaseInsensitiveStrEnum):
+    AUTO = auto()
+    NATIVE = auto()
+    JULIA = auto()
+
+
+SAMPLER = SamplerEnum.AUTO
+
+
+def use_sampler(sampler: SamplerEnum):
+    """Select the samplers: in-process ones, Julia ones, or in-process ones up to
+    `NATIVE_MAX_CRIT` criteria and Julia ones above (default).
+
+    :param sampler:
+    """
+    global SAMPLER
+    SAMPLER = SamplerEnum(sampler)
+
+
+def use_native(m: int):
+    return SAMPLER is SamplerEnum.NATIVE or (
+        SAMPLER is SamplerEnum.AUTO and m <= NATIVE_MAX_CRIT
+    )
+
+
+def generate_linext(m: int, seed: int | None = None) -> list[list[int]]:
+    if use_native(m):
+        return native_generate_linext(m, seed)
+    return julia_generate_linext(m, seed)
+
+
+def generate_weak_order(m: int, seed: int | None = None) -> list[int]:
+    # The in-process sampler is exact for any number of criteria
+    if SAMPLER is not SamplerEnum.JULIA:
+        return native_generate_weak_order(m, seed)
+    return julia_generate_weak_order(m, seed)
+
+
+def generate_weak_order_ext(m: int, seed: int | None = None) -> list[list[list[int]]]:
+    if use_native(m):
+        return native_generate_weak_order_ext(m, seed)
+    return julia_generate_weak_order_ext(m, seed)
@@ -0,0 +1,177 @@
+"""This module implements in-process versions of the Julia samplers.
+
+Linear extensions and weak order extensions of the subsets lattice are
+uniform chains in the lattice of its down-sets, sampled from the number of
+chains reaching the full down-set. Weak orders are sampled with the number of
+blocks method used by ``GenerateWeakOrder``.
+"""
+
+from collections import Counter
+from functools import cache
+from typing import Any
+
+import numpy as np
+import numpy.typing as npt
+from scipy.stats import chi2  # type: ignore
+
+from src.random import RNGParam, rng_
+from src.utils import int_to_ind_set, tolist
+
+NATIVE_MAX_CRIT = 5
+
+
+@cache
+def ideal_lattice(m: int):
+    """Enumerate the down-sets of the subsets lattice of `m` criteria.
+
+    Down-sets are encoded as bitmasks over the subsets bitmasks.
+
+    :param m:
+    :return:
+        sorted down-sets and, for each one, the subsets that can be added
+        with the index of the resulting down-set
+    """
+    n = 1 << m
+    lower = [
+        sum(1 << (x & ~(1 << b)) for b in range(m) if (x >> b) & 1) for x in range(n)
+    ]
+
+    def addable(ideal: int):
+        return [
+            x
+            for x in range(n)
+            if not (ideal >> x) & 1 and (ideal & lower[x]) == lower[x]
+        ]
+
+    ideals = {0}
+    stack = [0]
+    while stack:
+        ideal = stack.pop()
+        for x in addable(ideal):
+            if (new := ideal | (1 << x)) not in ideals:
+                ideals.add(new)
+                stack.append(new)
+
+    labels = sorted(ideals)
+    index = {ideal: i for i, ideal in enumerate(labels)}
+    covers = [
+        [(x, index[ideal | (1 << x)]) for x in addable(ideal)] for ideal in labels
+    ]
+    return labels, covers
+
+
+@cache
+def nb_linext(m: int) -> npt.NDArray[np.float64]:
+    """Number of maximal chains from each down-set to the full down-set."""
+    labels, covers = ideal_lattice(m)
+    counts = np.ones(len(labels))
+    for i in reversed(range(len(labels) - 1)):
+        counts[i] = sum(counts[j] for _, j in covers[i])
+    return counts
+
+
+@cache
+def nb_weak_order_ext(m: int) -> npt.NDArray[np.float64]:
+    """Number of chains from each down-set to the full down-set."""
+    labels = np.array(ideal_lattice(m)[0], dtype=np.uint64)
+    counts = np.ones(len(labels))
+    for i in reversed(range(len(labels) - 1)):
+        u = labels[i]
+        counts[i] = counts[i + 1 :][(labels[i + 1 :] & u) == u].sum()
+    return counts
+
+
+@cache
+def nb_blocks_distribution(m: int):
+    """Distribution of the number of blocks drawn to generate a weak order.
+
+    The probability of `k` blocks is proportional to k^m / 2^(k+1).
+
+    :param m:
+    :return: numbers of blocks and their probabilities
+    """
+    k = np.arange(1, 8 * m + 65)
+    log_p = m * np.log(k) - (k + 1) * np.log(2)
+    p = np.exp(log_p - log_p.max())
+    return k, p / p.sum()
+
+
+def native_generate_linext(m: int, seed: int | None = None) -> list[list[int]]:
+    rng = rng_(seed)
+    covers = ideal_lattice(m)[1]
+    counts = nb_linext(m)
+
+    result: list[list[int]] = []
+    i = 0
+    while covers[i]:
+        x, j = zip(*covers[i])
+        w = counts[list(j)]
+        ind = rng.choice(len(j), p=w / w.sum())
+        result.append(int_to_ind_set(x[ind]))
+        i = j[ind]
+    return result
+
+
+def native_generate_weak_order(m: int, seed: int | None = None) -> list[int]:
+    rng = rng_(seed)
+    k, p = nb_blocks_distribution(m)
+    nb_blocks = rng.choice(k, p=p)
+    values = rng.integers(nb_blocks, size=m)
+    return tolist(np.unique(values, return_inverse=True)[1] + 1)
+
+
+def native_weak_order_ext_masks(m: int, rng: RNGParam = None) -> list[int]:
+    rng = rng_(rng)
+    labels = np.array(ideal_lattice(m)[0], dtype=np.uint64)
+    counts = nb_weak_order_ext(m)
+
+    result: list[int] = []
+    i = 0
+    while i != len(labels) - 1:
+        u = labels[i]
+        candidates = i + 1 + np.flatnonzero((labels[i + 1 :] & u) == u)
+        w = counts[candidates]
+        j = candidates[rng.choice(len(candidates), p=w / w.sum())]
+        result.append(int(labels[j] & ~u))
+        i = j
+    return result
+
+
+def native_generate_weak_order_ext(
+    m: int, seed: int | None = None
+) -> list[list[list[int]]]:
+    return [
+        [int_to_ind_set(x) for x in int_to_ind_set(block)]
+        for block in native_weak_order_ext_masks(m, seed)
+    ]
+
+
+def uniformity_pvalue(counts: Counter[Any], K: int):
+    """Chi-squared test of the uniformity of samples among `K` outcomes.
+
+    :param counts: number of samples of each outcome drawn
+    :param K: number of outcomes
+    :return: p-value
+    """
+    n = counts.total()
+    T = (K / n) * sum(x**2 for x in counts.values()) - n
+    return float(chi2.sf(T, K - 1))
+
+
+def check_uniformity(m: int, n: int | None = None, seed: int | None = None):
+    """Chi-squared test of the uniformity of weak order extensions,
+    as in ``CheckUniformity.jl``.
+
+    :param m: number of criteria
+    :param n: number of samples (5 times the number of weak order extensions
+        if not supplied)
+    :param seed:
+    :return: p-value
+    """
+    rng = rng_(seed)
+    K = int(nb_weak_order_ext(m)[0])
+    n = n or 5 * K
+
+    c = Counter(tuple(native_weak_order_ext_masks(m, rng)) for _ in range(n))
+
+    return uniformity_pvalue(c, K)
@@ -2,6 +2,7 @@ from enum import Enum, member
 from typing import Any
 
 from .function import generate_linext, generate_weak_order, generate_weak_order_ext
+from .native import check_uniformity
 
 
 class ScriptEnum(Enum):
@@ -17,5 +18,9 @@ class ScriptEnum(Enum):
     def WEAK_ORDER_EXT(self, *args: Any, **kwargs: Any):
         return generate_weak_order_ext(*args, **kwargs)
 
+    @member
+    def CHECK_UNIFORMITY(self, *args: Any, **kwargs: Any):
+        return check_uniformity(*args, **kwargs)
+
     def __call__(self, *args: Any, **kwargs: Any):
         return self.value(self, *args, **kwargs)
@@ -41,7 +41,9 @@ workers: list[Process] = []
 connections: list[Connection] = []
 for i in range(ARGS.jobs):
     worker_connection, manager_connection = WorkerPipe()
-    worker_process = WorkerProcess(worker_connection, logging_queue, DIR)
+    worker_process = WorkerProcess(
+        worker_connection, logging_queue, DIR, ARGS.sample_bank, ARGS.sampler
+    )
     connections.append(manager_connection)
     workers.append(worker_process)
 
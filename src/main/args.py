@@ -2,6 +2,8 @@ import argparse
 from dataclasses import replace
 from pathlib import Path
 
+from src.julia.function import SamplerEnum
+
 from .arguments import ExperimentEnum
 from .experiments.elicitation.arguments import ArgumentsElicitation
 from .experiments.group_decision.arguments import ArgumentsGroupDecision
@@ -19,6 +21,8 @@ parser.add_argument("-s", "--stop-error", action="store_true", help="Stop on err
 parser.add_argument(
     "-e", "--extend", action="store_true", help="Extend previous experiment"
 )
+parser.add_argument("-b", "--sample-bank", type=Path, help="Sample bank directory")
+parser.add_argument("--sampler", type=SamplerEnum, choices=SamplerEnum, help="Samplers")
 
 
 args = vars(parser.parse_args())
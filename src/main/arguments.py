@@ -1,6 +1,9 @@
+from pathlib import Path
+
 from src.case_insensitive_str_enum import CaseInsensitiveStrEnum
 from src.dataclass import Dataclass, dataclass
 from src.default_max_jobs import DEFAULT_MAX_JOBS
+from src.julia.function import SamplerEnum
 
 from .field import DirField
 
@@ -16,3 +19,5 @@ class Arguments(Dataclass, DirField):
     jobs: int = DEFAULT_MAX_JOBS
     stop_error: bool = False
     extend: bool = False
+    sample_bank: Path | None = None
+    sampler: SamplerEnum = SamplerEnum.AUTO
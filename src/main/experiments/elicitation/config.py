@@ -5,6 +5,9 @@ from typing import Any, ClassVar
 from src.constants import DEFAULT_MAX_TIME, EPSILON
 from src.dataclass import FrozenDataclass
 from src.methods import MethodEnum
+from src.mip.matrix import MIPBackendEnum
+from src.sa.cancellation import ClockEnum
+from src.sa.cooling_schedule import CoolingScheduleEnum
 
 
 @dataclass(frozen=True)
@@ -22,6 +25,11 @@ class Config(FrozenDataclass):
 class MIPConfig(Config):
     method = MethodEnum.MIP
     gamma: float = EPSILON
+    backend: MIPBackendEnum = MIPBackendEnum.PULP
+    lex_order_assignment: bool = False
+    presolve_it: int | None = None
+    relaunch_ratio: float | None = None
+    warm_start: bool = False
 
 
 @dataclass(frozen=True)
@@ -32,6 +40,40 @@ class SAConfig(Config):
     amp: float = 0.05
     max_it: int | None = None
     max_it_non_improving: int | None = None
+    schedule: CoolingScheduleEnum = CoolingScheduleEnum.GEOMETRIC
+    beta: float = 0.001
+    L: int = 1
+    L_max: int | None = None
+    reheat: int | None = None
+    reheat_ratio: float = 0.5
+    cache_size: int | None = None
+    clock: ClockEnum = ClockEnum.CPU
+    islands: bool = False
+    migration_interval: int = 100
+    migration_rate: float = 0.5
+
+
+@dataclass(frozen=True)
+class TabuConfig(Config):
+    method = MethodEnum.TABU
+    amp: float = 0.05
+    tenure: int = 10
+    nb_candidates: int = 20
+    max_it: int | None = None
+    max_it_non_improving: int | None = None
+    cache_size: int | None = None
+    clock: ClockEnum = ClockEnum.CPU
+
+
+@dataclass(frozen=True)
+class LAHCConfig(Config):
+    method = MethodEnum.LAHC
+    amp: float = 0.05
+    history: int = 1_000
+    max_it: int | None = None
+    max_it_non_improving: int | None = None
+    cache_size: int | None = None
+    clock: ClockEnum = ClockEnum.CPU
 
 
 def create_config(**kwargs: Any) -> Config:
@@ -47,5 +89,9 @@ def create_config(**kwargs: Any) -> Config:
             return MIPConfig.from_dict(kwargs)
         case MethodEnum.SA:
             return SAConfig.from_dict(kwargs)
+        case MethodEnum.TABU:
+            return TabuConfig.from_dict(kwargs)
+        case MethodEnum.LAHC:
+            return LAHCConfig.from_dict(kwargs)
         case _:
             raise TypeError(f"Unknown method : {method}")
@@ -12,10 +12,19 @@ from ...dir import DIR
 from ...task import FutureTask, Task, TaskException
 from ...threads.task import task_thread
 from .arguments import ArgumentsElicitation
-from .config import MIPConfig, SAConfig, create_config
+from .config import LAHCConfig, MIPConfig, SAConfig, TabuConfig, create_config
 from .directory import DirectoryElicitation
 from .seeds import Seeds
-from .task import ATestTask, ATrainTask, DTask, MIPTask, MoTask, SATask, TestTask
+from .task import (
+    ATestTask,
+    ATrainTask,
+    DTask,
+    LocalSearchTask,
+    MIPTask,
+    MoTask,
+    SATask,
+    TestTask,
+)
 
 
 def main(args: ArgumentsElicitation):
@@ -179,6 +188,29 @@ def main(args: ArgumentsElicitation):
                                                     cast(MIPConfig, config),
                                                     Me_id,
                                                 )
+                                            case MethodEnum.TABU | MethodEnum.LAHC:
+                                                task_Me = LocalSearchTask(
+                                                    m,
+                                                    n_tr,
+                                                    Atr_id,
+                                                    Mo,
+                                                    ko,
+                                                    group_size,
+                                                    args.fixed_lex_order,
+                                                    Mo_id,
+                                                    n_bc,
+                                                    same_alt,
+                                                    error,
+                                                    D_id,
+                                                    Me,
+                                                    ke,
+                                                    method,
+                                                    cast(
+                                                        TabuConfig | LAHCConfig,
+                                                        config,
+                                                    ),
+                                                    Me_id,
+                                                )
                                             case _:
                                                 break
                                         futures[task_Me] = thread_pool.submit(
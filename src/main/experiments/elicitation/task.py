@@ -1,5 +1,7 @@
-from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
 from dataclasses import dataclass, field, replace
+from math import inf
 from operator import attrgetter
 from typing import Any, cast
 
@@ -7,20 +9,22 @@ from mcda.relations import PreferenceStructure
 from pandas import read_csv
 
 from src.methods import MethodEnum
-from src.mip.main import create_mip, mip_result
+from src.mip.main import MIPResult, SenseEnum, create_mip, mip_sweep
 from src.model import GroupModel, Model
 from src.models import GroupModelEnum, model
 from src.performance_table.normal_performance_table import NormalPerformanceTable
 from src.preference_structure.generate import noisy_comparisons, random_comparisons
 from src.preference_structure.io import from_csv, to_csv
 from src.random import SeedLike
+from src.sa.cancellation import ClockEnum, cancellation_token
+from src.sa.island import migration_area
 from src.sa.main import create_sa, sa_result
 from src.test.main import test_consensus, test_distance
 from src.test.test import DistanceRankingEnum
 from src.utils import catchtime, tolist
 
 from ...task import SeedTask
-from .config import Config, MIPConfig, SAConfig
+from .config import Config, LAHCConfig, MIPConfig, SAConfig, TabuConfig
 from .directory import DirectoryElicitation
 
 
@@ -228,21 +232,33 @@ class MIPTask(AbstractElicitationTask):
             self.config.max_time,
             self.lexicographic_order if self.fixed_lex_order else None,
             gamma=self.config.gamma,
+            backend=self.config.backend,
             nb_cpus=self.config.nb_cpus,
+            # A fixed lexicographic order leaves nothing to assign
+            lex_order_assignment=(
+                self.config.lex_order_assignment and not self.fixed_lex_order
+            ),
         )
 
-        with (
-            catchtime() as time,
-            ThreadPoolExecutor(
-                min(len(list(mips)), self.config.nb_cpus)
-            ) as thread_pool,
-        ):
-            results = thread_pool.map(mip_result, mips)
+        # Without inconsistencies, the MIPs have no objective and the sweep
+        # stops at the first model found
+        with catchtime() as time:
+            results, optimal = mip_sweep(
+                mips, sense, self.config.nb_cpus, None, self.config.relaunch_ratio
+            )
 
-        optimal = all(result.optimal for result in results)
+        results = [result for result in results if result.best_model is not None]
+        placeholder = {SenseEnum.MIN: inf, SenseEnum.MAX: -inf}
         best_model, best_fitness, _, _ = sense.value(
-            results, key=attrgetter("best_objective")
+            results,
+            key=lambda x: (
+                x.best_objective if x.best_objective is not None else placeholder[sense]
+            ),
+            default=MIPResult(None, None, 0, False),
         )
+        # A model without objective restores all the comparisons
+        if (best_model is not None) and (best_fitness is None):
+            best_fitness = 1
 
         with self.Me_file(dir).open("w") as f:
             f.write(best_model.to_json() if (best_model and optimal) else "None")
@@ -306,15 +322,31 @@ class SATask(AbstractElicitationTask):
             rng_init=rng_init,
             rng_sa=rng_sa,
             nb_cpus=self.config.nb_cpus,
+            islands=self.config.islands,
+            migration_interval=self.config.migration_interval,
+            migration_rate=self.config.migration_rate,
+            schedule=self.config.schedule,
+            beta=self.config.beta,
+            L=self.config.L,
+            L_max=self.config.L_max,
+            reheat=self.config.reheat,
+            reheat_ratio=self.config.reheat_ratio,
+            cache_size=self.config.cache_size,
+            clock=self.config.clock,
         )
 
         with (
             catchtime() as time,
+            migration_area(sas) if self.config.islands else nullcontext(),
+            cancellation_token(
+                sas,
+                self.config.max_time if self.config.clock is ClockEnum.WALL else None,
+            ),
             ProcessPoolExecutor(self.config.nb_cpus) as process_pool,
         ):
             results = process_pool.map(sa_result, sas)
 
-        best_model, best_objective, _, it = min(
+        best_model, best_objective, _, it, _ = min(
             results, key=attrgetter("best_objective")
         )
 
@@ -345,6 +377,94 @@ class SATask(AbstractElicitationTask):
         )
 
 
+@dataclass(frozen=True)
+class LocalSearchTask(AbstractElicitationTask):
+    name = "LocalSearch"
+    config: TabuConfig | LAHCConfig
+
+    def task(
+        self, dir: DirectoryElicitation, seed: SeedLike, *args: Any, **kwargs: Any
+    ) -> Any:
+        with self.A_train_file(dir).open("r") as f:
+            A = NormalPerformanceTable(read_csv(f, header=None))
+
+        D: list[PreferenceStructure] = []
+        for dm_id in range(self.group_size):
+            with self.D_file(dir, dm_id).open("r") as f:
+                D.append(from_csv(f))
+
+        rng_init, rng_ls = self.rng(seed).spawn(2)
+
+        match self.config:
+            case TabuConfig():
+                method_kwargs = {
+                    "tenure": self.config.tenure,
+                    "nb_candidates": self.config.nb_candidates,
+                }
+            case LAHCConfig():
+                method_kwargs = {"history": self.config.history}
+
+        learners, _ = create_sa(
+            self.Me.value[0],
+            self.ke,
+            A,
+            D,
+            1,  # no cooling schedule
+            self.config.amp,
+            self.lexicographic_order if self.fixed_lex_order else None,
+            max_time=self.config.max_time,
+            max_it=self.config.max_it,
+            max_it_non_improving=self.config.max_it_non_improving,
+            rng_init=rng_init,
+            rng_sa=rng_ls,
+            nb_cpus=self.config.nb_cpus,
+            cache_size=self.config.cache_size,
+            clock=self.config.clock,
+            method=self.method,
+            **method_kwargs,
+        )
+
+        with (
+            catchtime() as time,
+            cancellation_token(
+                learners,
+                self.config.max_time if self.config.clock is ClockEnum.WALL else None,
+            ),
+            ProcessPoolExecutor(self.config.nb_cpus) as process_pool,
+        ):
+            results = process_pool.map(sa_result, learners)
+
+        best_model, best_objective, _, it, _ = min(
+            results, key=attrgetter("best_objective")
+        )
+
+        with self.Me_file(dir).open("w") as f:
+            f.write(best_model.to_json())
+
+        csv_file = dir.csv_files["train"]
+        csv_file.writerow(
+            M=self.m,
+            N_tr=self.ntr,
+            Atr_id=self.Atr_id,
+            Mo=self.Mo,
+            Ko=self.ko,
+            Group_size=self.group_size,
+            Mo_id=self.Mo_id,
+            N_bc=self.nbc,
+            Same_alt=self.same_alt,
+            Error=self.error,
+            D_id=self.D_id,
+            Me=self.Me,
+            Ke=self.ke,
+            Method=self.method,
+            Config=self.config,
+            Me_id=self.Me_id,
+            Time=time(),
+            It=it,
+            Fitness=1 - best_objective,
+        )
+
+
 @dataclass(frozen=True)
 class TestTask(ATestTask, AbstractElicitationTask):
     name = "Test"
@@ -319,6 +319,8 @@ def main(args: ArgumentsGroupDecision):
                                                                                 P_id,
                                                                                 0,
                                                                             )
+                                                                        case _:
+                                                                            continue
                                                                     futures[task] = (
                                                                         thread_pool.submit(
                                                                             collective_thread,
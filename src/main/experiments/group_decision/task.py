@@ -1,6 +1,9 @@
 import csv
-from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+import logging
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
 from dataclasses import dataclass, field, replace
+from functools import partial
 from math import inf
 from multiprocessing.connection import Connection
 from operator import attrgetter
@@ -11,7 +14,14 @@ from mcda.types import Relation
 from pandas import read_csv
 
 from src.methods import MethodEnum
-from src.mip.main import MIPResult, create_mip, mip_result
+from src.mip.main import (
+    LazyMIPs,
+    MIPResult,
+    SenseEnum,
+    create_mip,
+    mip_result,
+    mip_sweep,
+)
 from src.models import GroupModelEnum, ModelEnum
 from src.performance_table.normal_performance_table import NormalPerformanceTable
 from src.preference_path.main import compute_preference_path
@@ -25,7 +35,9 @@ from src.preference_path.neighborhood import (
 from src.preference_structure.generate import random_comparisons
 from src.preference_structure.io import from_csv, to_csv
 from src.random import SeedLike, rng_
-from src.sa.main import create_sa, sa_result
+from src.sa.cancellation import ClockEnum, cancellation_token
+from src.sa.island import migration_area
+from src.sa.main import create_sa, lexicographic_order_presolve, sa_result
 from src.srmp.model import FrozenSRMPModel, SRMPModel
 from src.utils import CustomException, catchtime, tolist
 
@@ -223,33 +235,49 @@ class MieTask(AbstractDTask):
 
         seed_lex, seed_mip = self.seed(seed).spawn(2)
 
-        mips, sense = create_mip(
-            GroupModelEnum.SRMP,
-            self.ko,
-            A,
-            D,
-            seed_lex,
-            seed_mip,
-            min(max_time, self.Mie_config.max_time)
-            if max_time is not None
-            else self.Mie_config.max_time,
-            self.lexicographic_order if self.fixed_lex_order else None,
-            False,
-            True,
-            gamma=self.Mie_config.gamma,
-            nb_cpus=self.Mie_config.nb_cpus,
-        )
+        # The presolve orders the MIPs, which are created when started
+        with catchtime() as time:
+            mips, sense = create_mip(
+                GroupModelEnum.SRMP,
+                self.ko,
+                A,
+                D,
+                seed_lex,
+                seed_mip,
+                min(max_time, self.Mie_config.max_time)
+                if max_time is not None
+                else self.Mie_config.max_time,
+                self.lexicographic_order if self.fixed_lex_order else None,
+                False,
+                True,
+                gamma=self.Mie_config.gamma,
+                backend=self.Mie_config.backend,
+                nb_cpus=self.Mie_config.nb_cpus,
+                lexicographic_order_score=partial(
+                    lexicographic_order_presolve,
+                    k=self.ko,
+                    alternatives=A,
+                    comparisons=D,
+                    max_it=self.Mie_config.presolve_it,
+                    rng=seed_lex,
+                    collective=False,
+                )
+                if self.Mie_config.presolve_it
+                else None,
+            )
 
-        with (
-            catchtime() as time,
-            ThreadPoolExecutor(self.Mie_config.nb_cpus) as thread_pool,
-        ):
-            results = list(thread_pool.map(mip_result, mips))
+            # Distances between the models of the decision makers are at least 0
+            results, optimal = mip_sweep(
+                mips,
+                sense,
+                self.Mie_config.nb_cpus,
+                0,
+                self.Mie_config.relaunch_ratio,
+            )
 
         for i, result in enumerate(results):
             if result.best_objective is None:
                 results[i] = result._replace(best_objective=inf)
-        optimal = all(result.optimal for result in results)
         best_model, best_fitness, _, _ = sense.value(
             results, key=attrgetter("best_objective")
         )
@@ -641,10 +669,12 @@ class CollectiveMIPTask(AbstractCollectiveTask):
 
         seeds_mip = seed_mip.spawn(self.nb_Mcp) if self.nb_Mcp > 1 else [seed_mip]
         seeds_lex = seed_lex.spawn(self.nb_Mcp) if self.nb_Mcp > 1 else [seed_lex]
-        mips: list[Any] = []
-        for Mcp_id in range(self.nb_Mcp):
-            mips.extend(
-                create_mip(
+
+        # The presolve orders the MIPs, which are created when started
+        with catchtime() as time:
+            mips: LazyMIPs[Any] = LazyMIPs([])
+            for Mcp_id in range(self.nb_Mcp):
+                mips += create_mip(
                     GroupModelEnum.SRMP,
                     self.ko,
                     A,
@@ -662,25 +692,50 @@ class CollectiveMIPTask(AbstractCollectiveTask):
                     ACC,
                     DR,
                     reference_models=Mie,
+                    lexicographic_order_score=partial(
+                        lexicographic_order_presolve,
+                        k=self.ko,
+                        alternatives=A,
+                        comparisons=D,
+                        max_it=self.config.presolve_it,
+                        rng=seeds_lex[Mcp_id],
+                        preferences_changes=C,
+                        comparisons_accepted=ACC,
+                        comparisons_refused=R,
+                        comparisons_past=DR,
+                    )
+                    if self.config.presolve_it
+                    else None,
                     gamma=self.config.gamma,
                     nb_cpus=self.config.nb_cpus // self.nb_Mcp,
                     verbose=True,
                     log_path=self.log_file(dir, Mcp_id),
                 )[0]
+
+            # Start from the collective model of the previous iteration
+            if self.config.warm_start and (self.it > 0):
+                if (Mc_file := replace(self, it=self.it - 1).Mc_file(dir)).exists():
+                    with Mc_file.open("r") as f:
+                        Mc = SRMPModel.from_json(f.read())
+                    mips = mips.map(partial(self.warm_start, model=Mc))
+
+            # The minimum number of preferences changes is at least the number
+            # of changes of each decision maker. The best models of all MIPs are
+            # needed for the partial collective models.
+            results, optimal = mip_sweep(
+                mips,
+                SenseEnum.MIN,
+                self.config.nb_cpus,
+                max(C, default=0) if self.nb_Mcp == 1 else None,
+                self.config.relaunch_ratio,
+                self.nb_Mcp == 1,
             )
-        with (
-            catchtime() as time,
-            ThreadPoolExecutor(self.config.nb_cpus) as thread_pool,
-        ):
-            results = list(thread_pool.map(mip_result, mips))
 
         results = cast(
             list[MIPResult[SRMPModel, float | None]],
             list(filter(attrgetter("best_model"), results)),  # pyright: ignore[reportUnknownArgumentType]
         )
 
-        optimal = all(result.optimal for result in results) if results else False
-
         best_model = None
         best_objective = None
         if results:
@@ -754,6 +809,16 @@ class CollectiveMIPTask(AbstractCollectiveTask):
 
         return best_model is not None
 
+    @staticmethod
+    def warm_start(mip: Any, model: SRMPModel):
+        if mip.warm_startable:
+            mip.warm_start(model)
+        else:
+            logging.getLogger("log").info(
+                f"{'skip':5} warm start of {type(mip).__name__}"
+            )
+        return mip
+
     def Mie_file(self, dir: DirectoryGroupDecision, dm_id: int):
         assert self.Mie_config
         return dir.Mie(
@@ -919,10 +984,26 @@ class CollectiveSATask(AbstractCollectiveTask):
             rng_init=rng_init,
             rng_sa=rng_sa,
             nb_cpus=max(self.config.nb_cpus, self.nb_Mcp),
+            islands=self.config.islands,
+            migration_interval=self.config.migration_interval,
+            migration_rate=self.config.migration_rate,
+            schedule=self.config.schedule,
+            beta=self.config.beta,
+            L=self.config.L,
+            L_max=self.config.L_max,
+            reheat=self.config.reheat,
+            reheat_ratio=self.config.reheat_ratio,
+            cache_size=self.config.cache_size,
+            clock=self.config.clock,
         )
 
         with (
             catchtime() as time,
+            migration_area(sas) if self.config.islands else nullcontext(),
+            cancellation_token(
+                sas,
+                sas[0].max_time if self.config.clock is ClockEnum.WALL else None,
+            ),
             ProcessPoolExecutor(self.config.nb_cpus) as process_pool,
         ):
             results = list(process_pool.map(sa_result, sas))
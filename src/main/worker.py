@@ -1,8 +1,11 @@
 import logging
 import logging.handlers
 from multiprocessing import Process
+from pathlib import Path
 
 from src.constants import SENTINEL
+from src.julia.function import SamplerEnum, use_sampler
+from src.sample_bank.bank import use_sample_bank
 
 from .connection import ProcessEndWorkerConnection, WorkerResult
 from .directory import Directory
@@ -15,12 +18,16 @@ class WorkerProcess(Process):
         connection: ProcessEndWorkerConnection,
         logging_queue: LoggingQueue,
         dir: Directory,
+        sample_bank: Path | None = None,
+        sampler: SamplerEnum = SamplerEnum.AUTO,
     ):
         super().__init__()
 
         self.connection = connection
         self.dir = dir
         self.logging_queue = logging_queue
+        self.sample_bank = sample_bank
+        self.sampler = sampler
 
         self.name = self.name.replace("WorkerProcess", "Worker")
 
@@ -34,6 +41,10 @@ class WorkerProcess(Process):
         logging_root.addHandler(logging_qh)
         self.logger = logging.getLogger("log")
 
+        # Random samples
+        use_sample_bank(self.sample_bank)
+        use_sampler(self.sampler)
+
         # Main
         self.logger.info("Start")
 
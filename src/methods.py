@@ -6,3 +6,5 @@ from .case_insensitive_str_enum import CaseInsensitiveStrEnum
 class MethodEnum(CaseInsensitiveStrEnum):
     MIP = auto()
     SA = auto()
+    TABU = auto()
+    LAHC = auto()
@@ -1,5 +1,4 @@
 import csv
-from concurrent.futures import ThreadPoolExecutor
 from functools import reduce
 from math import inf
 from operator import attrgetter
@@ -16,7 +15,7 @@ from src.srmp.model import SRMPModel, SRMPParamFlag
 
 from ..utils import catchtime, file_or_stdout
 from .args import ARGS
-from .main import MIPResult, SenseEnum, create_mip, mip_result
+from .main import MIPResult, SenseEnum, create_mip, mip_sweep
 
 # Import data
 A = NormalPerformanceTable(read_csv(ARGS.A, header=None))
@@ -75,22 +74,24 @@ mips, sense = create_mip(
     weights_amp=ARGS.weight_amp,
     reference_models=refs,
     gamma=ARGS.gamma,
+    backend=ARGS.backend,
     inconsistencies=not ARGS.no_inconsistencies,
     verbose=ARGS.verbose,
     log_path=ARGS.log_path,
     nb_cpus=ARGS.nb_cpus,
+    lex_order_assignment=ARGS.lex_order_assignment,
 )
 
-with catchtime() as time, ThreadPoolExecutor(ARGS.nb_cpus) as thread_pool:
-    results = list(thread_pool.map(mip_result, mips))
+with catchtime() as time:
+    results, optimal = mip_sweep(
+        mips, sense, ARGS.nb_cpus, relaunch_ratio=ARGS.relaunch_ratio
+    )
 
 results = cast(
     list[MIPResult[SRMPModel, float | None]],
     list(filter(attrgetter("best_model"), results)),  # pyright: ignore[reportUnknownArgumentType]
 )
 
-optimal = all(result.optimal for result in results) if results else False
-
 placeholder = {SenseEnum.MIN: inf, SenseEnum.MAX: -inf}
 best_model, best_objective, _, _ = sense.value(
     results,
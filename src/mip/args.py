@@ -3,6 +3,7 @@ from dataclasses import dataclass, field
 from pathlib import Path
 
 from src.constants import DEFAULT_MAX_TIME, EPSILON
+from src.mip.matrix import MIPBackendEnum
 from src.models import ModelEnum
 from src.srmp.model import SRMPParamFlag
 
@@ -53,12 +54,30 @@ parser.add_argument(
     action="store_true",
     help="Inconsistent comparisons will not be taken into account",
 )
+parser.add_argument(
+    "--lex-order-assignment",
+    action="store_true",
+    help="Solve a single MIP with the lexicographic orders as variables",
+)
+parser.add_argument(
+    "--backend",
+    type=MIPBackendEnum,
+    choices=MIPBackendEnum,
+    default=MIPBackendEnum.PULP,
+    help="Build the program in matrix form for this solver API if available",
+)
 parser.add_argument("-o", "--output", type=Path, help="Output file")
 parser.add_argument("-r", "--result", type=Path, help="Result file")
 parser.add_argument("-s", "--seed", type=int, help="Random seed")
 parser.add_argument("-v", "--verbose", action="store_true", help="Verbose")
 parser.add_argument("--log-path", type=Path, help="Log file")
 parser.add_argument("--nb-cpus", default=1, type=int, help="Number of CPUs")
+parser.add_argument(
+    "--relaunch-ratio",
+    type=float,
+    help="Relaunch the MIPs not solved after this ratio of the time limit with "
+    "the threads freed by the others",
+)
 
 
 @dataclass(init=False)
@@ -70,8 +89,10 @@ class Arguments(Dataclass):
     shared: list[SRMPParamFlag] = field(default_factory=list)
     max_time: int
     gamma: float
+    backend: MIPBackendEnum
     nb_cpus: int
     no_inconsistencies: bool = False
+    lex_order_assignment: bool = False
     lex_order: list[int] | None = None
     collective: bool = False
     group: bool = False
@@ -87,6 +108,7 @@ class Arguments(Dataclass):
     seed: int | None = None
     verbose: bool = False
     log_path: Path | None = None
+    relaunch_ratio: float | None = None
 
 
 ARGS = parser.parse_args(namespace=Arguments())
@@ -0,0 +1,86 @@
+"""Benchmark of the build time of the SRMP elicitation MIP with PuLP expressions
+and in matrix form, versus the number of alternatives.
+
+    python -m src.mip.benchmark 50 100 200 --nb-crit 5 -k 3
+"""
+
+import argparse
+import csv
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+
+from src.performance_table.normal_performance_table import NormalPerformanceTable
+from src.preference_structure.generate import random_comparisons
+from src.preference_structure.utils import divide_preferences
+from src.random import rng_
+from src.srmp.model import SRMPModel
+from src.utils import catchtime, file_or_stdout, midpoints
+
+from ..dataclass import Dataclass
+from .formulation.srmp import MIPSRMP, relations_indices, srmp_program
+from .matrix import MIPBackendEnum
+
+parser = argparse.ArgumentParser()
+parser.add_argument("nb_alt", nargs="+", type=int, help="Numbers of alternatives")
+parser.add_argument("--nb-crit", default=5, type=int, help="Number of criteria")
+parser.add_argument("-k", default=3, type=int, help="Number of profiles")
+parser.add_argument(
+    "--nb-bc", type=int, help="Number of comparisons (all pairs if not supplied)"
+)
+parser.add_argument("--repeat", default=3, type=int, help="Number of repetitions")
+parser.add_argument("-s", "--seed", type=int, help="Random seed")
+parser.add_argument("-o", "--output", type=Path, help="Output file")
+
+
+@dataclass(init=False)
+class Arguments(Dataclass):
+    nb_alt: list[int]
+    nb_crit: int
+    k: int
+    repeat: int
+    nb_bc: int | None = None
+    seed: int | None = None
+    output: Path | None = None
+
+
+ARGS = parser.parse_args(namespace=Arguments())
+
+rng = rng_(ARGS.seed)
+
+with file_or_stdout(ARGS.output, "w", "") as f:
+    writer = csv.writer(f, "unix")
+    writer.writerow(["N_alt", "N_crit", "K", "N_bc", "Builder", "Time"])
+    for nb_alt in ARGS.nb_alt:
+        A = NormalPerformanceTable.random(nb_alt, ARGS.nb_crit, rng)
+        model = SRMPModel.random(
+            nb_profiles=ARGS.k,
+            nb_crit=ARGS.nb_crit,
+            rng=rng,
+            profiles_values=midpoints(A),
+        )
+        D = random_comparisons(A, model, ARGS.nb_bc, rng=rng)
+        preference_relations, indifference_relations = divide_preferences(D)
+        nb_bc = len(preference_relations) + len(indifference_relations)
+
+        for _ in range(ARGS.repeat):
+            with catchtime() as time:
+                MIPSRMP(
+                    alternatives=A,
+                    preference_relations=preference_relations,
+                    indifference_relations=indifference_relations,
+                    lexicographic_order=model.lexicographic_order,
+                    backend=MIPBackendEnum.PULP,
+                )
+            writer.writerow([nb_alt, ARGS.nb_crit, ARGS.k, nb_bc, "pulp", time()])
+
+            with catchtime() as time:
+                program, _ = srmp_program(
+                    A.data.to_numpy(dtype=np.float64),
+                    relations_indices(A.alternatives, preference_relations),
+                    relations_indices(A.alternatives, indifference_relations),
+                    [0] + [h + 1 for h in model.lexicographic_order],
+                )
+                program.matrix.tocsc()
+            writer.writerow([nb_alt, ARGS.nb_crit, ARGS.k, nb_bc, "matrix", time()])
@@ -8,6 +8,7 @@ from dataclasses import InitVar, dataclass, field
 from typing import Any, cast
 
 import numpy as np
+import numpy.typing as npt
 from mcda.relations import I, P
 from pulp import (  # type: ignore
     LpBinary,
@@ -48,6 +49,7 @@ from src.constants import EPSILON
 from src.performance_table.normal_performance_table import NormalPerformanceTable
 from src.srmp.model import SRMPModel
 
+from ..matrix import MatrixProgram, MIPBackendEnum
 from ..mip import MIP, D, MIPParams, MIPVars, value
 
 # class _MIPSRMP(AbstractModel):
@@ -219,6 +221,177 @@ from ..mip import MIP, D, MIPParams, MIPVars, value
 #     return M
 
 
+def relations_indices(alternatives: Sequence[Any], relations: Sequence[P | I]):
+    """Return the indices of the alternatives of relations.
+
+    :param alternatives:
+    :param relations:
+    :return: array of shape (r, 2)
+    """
+    index = {a: i for i, a in enumerate(alternatives)}
+    return np.array(
+        [[index[r.a], index[r.b]] for r in relations], dtype=np.int_
+    ).reshape(-1, 2)
+
+
+def srmp_program(
+    performances: npt.NDArray[np.float64],
+    preferences: npt.NDArray[np.int_],
+    indifferences: npt.NDArray[np.int_],
+    sigma: Sequence[int],
+    gamma: float = EPSILON,
+    inconsistencies: bool = True,
+    best_fitness: float | None = None,
+):
+    """Build the SRMP elicitation program of :class:`MIPSRMP` in matrix form.
+
+    :param performances: array of shape (n, m)
+    :param preferences: alternatives indices of the preferences, of shape (r, 2)
+    :param indifferences: alternatives indices of the indifferences, of shape
+        (i, 2)
+    :param sigma: extended lexicographic order (profiles numbered from 1)
+    :param gamma:
+    :param inconsistencies:
+    :param best_fitness:
+    :return: program and variables indices
+    """
+    n, m = performances.shape
+    k = len(sigma) - 1
+    program = MatrixProgram(maximize=True)
+
+    w = program.add_variables(m)
+    p = program.add_variables((k, m))
+    delta = program.add_variables((n, k, m), integer=True)
+    omega = program.add_variables((n, k, m))
+    s = program.add_variables((len(preferences), k + 1), integer=True)
+    s_star = program.add_variables(
+        len(indifferences) if inconsistencies else 0, integer=True
+    )
+
+    if inconsistencies:
+        program.add_objective(np.concatenate([s[:, 0], s_star]))
+
+    # Normalized weights
+    program.add_constraints(w[None], 1, 1, 1)
+
+    # Dominance between the reference profiles
+    program.add_constraints(np.stack([p[1:], p[:-1]], -1).reshape(-1, 2), [1, -1], 0)
+
+    # Constraints on the local concordances
+    profiles = np.broadcast_to(p, (n, k, m))
+    perfs = np.broadcast_to(performances[:, None], (n, k, m)).ravel()
+    cols = np.stack([profiles, delta], -1).reshape(-1, 2)
+    program.add_constraints(cols, 1, upper=perfs + 1)
+    program.add_constraints(cols, 1, lower=perfs + gamma)
+
+    # Constraints on the weighted local concordances
+    weights = np.broadcast_to(w, (n, k, m))
+    program.add_constraints(
+        np.stack([omega, weights], -1).reshape(-1, 2), [1, -1], upper=0
+    )
+    program.add_constraints(
+        np.stack([omega, delta], -1).reshape(-1, 2), [1, -1], upper=0
+    )
+    program.add_constraints(
+        np.stack([omega, delta, weights], -1).reshape(-1, 3), [1, -1, -1], lower=-1
+    )
+
+    # Constraints on the preference ranking variables
+    if not inconsistencies:
+        program.add_constraints(s[:, [sigma[0]]], 1, 1, 1)
+    program.add_constraints(s[:, [sigma[k]]], 1, 0, 0)
+
+    # Weighted sums of the concordances of each profile in lexicographic order
+    x = np.array(sigma[1:])
+    y = np.array(sigma[:-1])
+    ones = np.ones(m)
+
+    # Constraints on the preferences
+    a, b = preferences.reshape(-1, 2).T
+    cols = np.concatenate(
+        [omega[a][:, x - 1], omega[b][:, x - 1], s[:, x, None], s[:, y, None]], -1
+    ).reshape(-1, 2 * m + 2)
+    program.add_constraints(
+        cols, np.concatenate([ones, -ones, [1 + gamma, -1]]), lower=gamma - 1
+    )
+    program.add_constraints(cols, np.concatenate([ones, -ones, [-1, -1]]), lower=-2)
+    program.add_constraints(cols, np.concatenate([ones, -ones, [1, 1]]), upper=2)
+
+    # Constraints on the indifferences
+    a, b = indifferences.reshape(-1, 2).T
+    cols = np.concatenate([omega[a][:, x - 1], omega[b][:, x - 1]], -1)
+    if not inconsistencies:
+        program.add_constraints(
+            cols.reshape(-1, 2 * m), np.concatenate([ones, -ones]), 0, 0
+        )
+    else:
+        cols = np.concatenate(
+            [cols, np.broadcast_to(s_star[:, None, None], (len(a), k, 1))], -1
+        ).reshape(-1, 2 * m + 1)
+        program.add_constraints(cols, np.concatenate([ones, -ones, [-1]]), upper=-1)
+        program.add_constraints(cols, np.concatenate([-ones, ones, [-1]]), upper=-1)
+
+        if best_fitness is not None:
+            program.add_constraints(
+                np.concatenate([s[:, 0], s_star])[None], 1, lower=best_fitness + gamma
+            )
+
+    return program, {
+        "w": w,
+        "p": p,
+        "delta": delta,
+        "omega": omega,
+        "s": s,
+        "s_star": s_star,
+    }
+
+
+def srmp_start(
+    performances: npt.NDArray[np.float64],
+    preferences: npt.NDArray[np.int_],
+    indifferences: npt.NDArray[np.int_],
+    sigma: Sequence[int],
+    model: SRMPModel,
+) -> dict[str, npt.NDArray[np.float64]]:
+    """Values of the variables of :func:`srmp_program` given by a SRMP model.
+
+    The preference ranking variables follow the extended lexicographic order
+    `sigma`, which may differ from the order of the model.
+
+    :param performances: array of shape (n, m)
+    :param preferences: alternatives indices of the preferences, of shape (r, 2)
+    :param indifferences: alternatives indices of the indifferences, of shape
+        (i, 2)
+    :param sigma: extended lexicographic order (profiles numbered from 1)
+    :param model:
+    :return: values of the variables, by name
+    """
+    k = len(sigma) - 1
+    w = np.asarray(model.weights, dtype=np.float64)
+    p = model.profiles.data.to_numpy(dtype=np.float64)
+    delta = (performances[:, None] >= p).astype(np.float64)
+    omega = delta * w
+
+    # Weighted sums of the concordances of each profile in lexicographic order
+    scores = omega.sum(2)[:, np.array(sigma[1:], dtype=np.int_) - 1]
+
+    a, b = preferences.reshape(-1, 2).T
+    diff = scores[a] - scores[b]
+    tied = np.isclose(diff, 0)
+    # Position of the first profile discriminating each preference
+    first = np.where(tied.all(1), k, (~tied).argmax(1))
+    satisfied = (first < k) & (
+        np.take_along_axis(diff, np.minimum(first, k - 1)[:, None], 1)[:, 0] > 0
+    )
+    s = np.empty((len(a), k + 1))
+    s[:, sigma] = satisfied[:, None] & (np.arange(k + 1) <= first[:, None])
+
+    a, b = indifferences.reshape(-1, 2).T
+    s_star = np.isclose(scores[a], scores[b]).all(1).astype(np.float64)
+
+    return {"w": w, "p": p, "delta": delta, "omega": omega, "s": s, "s_star": s_star}
+
+
 class MIPSRMPVars(MIPVars):
     w: D[LpVariable]
     p: D[D[LpVariable]]
@@ -252,6 +425,8 @@ class MIPSRMP(MIP[SRMPModel, MIPSRMPVars, MIPSRMPParams]):
     gamma: float = EPSILON
     inconsistencies: bool = True
     best_fitness: float | None = None
+    matrix_form = True
+    warm_startable = True
 
     def create_parameters(self):
         self.params = MIPSRMPParams(
@@ -350,7 +525,7 @@ class MIPSRMP(MIP[SRMPModel, MIPSRMPVars, MIPSRMPParams]):
                     )
 
         # Constraints on the preference ranking variables
-        for s in self.vars["s"]:
+        for s in self.vars["s"].values():
             if not self.inconsistencies:
                 self.prob += s[self.params.sigma[0]] == 1
             self.prob += s[self.params.sigma[self.params.k]] == 0
@@ -438,14 +613,42 @@ class MIPSRMP(MIP[SRMPModel, MIPSRMPVars, MIPSRMPParams]):
                 >= self.best_fitness + self.gamma
             )
 
+    def create_matrix_problem(self):
+        self.program, self.indices = srmp_program(
+            self.alternatives.data.to_numpy(dtype=np.float64),
+            relations_indices(self.params.A, self.preference_relations),
+            relations_indices(self.params.A, self.indifference_relations),
+            self.params.sigma,
+            self.gamma,
+            self.inconsistencies,
+            self.best_fitness,
+        )
+
+    def start_values(self, model: SRMPModel):
+        values = srmp_start(
+            self.alternatives.data.to_numpy(dtype=np.float64),
+            relations_indices(self.params.A, self.preference_relations),
+            relations_indices(self.params.A, self.indifference_relations),
+            self.params.sigma,
+            model,
+        )
+        if not self.inconsistencies:
+            del values["s_star"]
+        return values
+
     def create_solution(self):
-        weights = np.array([
-            cast(float, value(self.vars["w"][j])) for j in self.params.M
-        ])
-        profiles = NormalPerformanceTable([
-            [value(self.vars["p"][h][j]) for j in self.params.M]
-            for h in self.params.profile_indices
-        ])
+        if self.backend is not MIPBackendEnum.PULP:
+            x = self.program_values()
+            weights = x[self.indices["w"]]
+            profiles = NormalPerformanceTable(x[self.indices["p"]])
+        else:
+            weights = np.array([
+                cast(float, value(self.vars["w"][j])) for j in self.params.M
+            ])
+            profiles = NormalPerformanceTable([
+                [value(self.vars["p"][h][j]) for j in self.params.M]
+                for h in self.params.profile_indices
+            ])
 
         self.sol = SRMPModel(
             profiles=profiles,
@@ -20,6 +20,53 @@ from src.srmp.model import SRMPModel
 
 from ...preference_structure.utils import complementary_preference, divide_preferences
 from ..mip import MIP, D, MIPParams, MIPVars, value
+from .srmp import relations_indices, srmp_start
+
+
+def srmp_collective_start(
+    alternatives: NormalPerformanceTable,
+    preference_relations_union: list[P],
+    indifference_relations_union: list[I],
+    sigma: Sequence[int],
+    model: SRMPModel,
+    preference_relations: list[list[P]],
+    indifference_relations: list[list[I]],
+    preferences_changed: list[int],
+) -> dict[str, Any]:
+    """Values of the variables shared by the collective formulations given by a
+    SRMP model.
+
+    The ranking variables are set when the comparisons are changed, unlike in
+    :func:`src.mip.formulation.srmp.srmp_start`.
+
+    :param alternatives:
+    :param preference_relations_union:
+    :param indifference_relations_union:
+    :param sigma: extended lexicographic order (profiles numbered from 1)
+    :param model:
+    :param preference_relations: preferences of each decision maker
+    :param indifference_relations: indifferences of each decision maker
+    :param preferences_changed: previous changes of each decision maker
+    :return: values of the variables, by name
+    """
+    values: dict[str, Any] = srmp_start(
+        alternatives.data.to_numpy(dtype=np.float64),
+        relations_indices(alternatives.alternatives, preference_relations_union),  # type: ignore
+        relations_indices(alternatives.alternatives, indifference_relations_union),  # type: ignore
+        sigma,
+        model,
+    )
+    s = values["s"] = 1 - values["s"]
+    s_star = values["s_star"] = 1 - values["s_star"]
+    values["S"] = max(
+        preferences_changed[dm]
+        + sum(s[preference_relations_union.index(r), 0] for r in preferences)
+        + sum(s_star[indifference_relations_union.index(r)] for r in indifferences)
+        for dm, (preferences, indifferences) in enumerate(
+            zip(preference_relations, indifference_relations)
+        )
+    )
+    return values
 
 
 class MIPSRMPCollectiveVars(MIPVars):
@@ -63,6 +110,7 @@ class MIPSRMPCollective(MIP[SRMPModel, MIPSRMPCollectiveVars, MIPSRMPCollectiveP
     comparisons_past: list[PreferenceStructure]
     gamma: float = EPSILON
     best_objective: float | None = None
+    warm_startable = True
 
     def create_parameters(self):
         self.params = MIPSRMPCollectiveParams(
@@ -375,6 +423,37 @@ class MIPSRMPCollective(MIP[SRMPModel, MIPSRMPCollectiveVars, MIPSRMPCollectiveP
         if self.best_objective is not None:
             self.prob += self.vars["S"] <= self.best_objective - 1
 
+    def start_values(self, model: SRMPModel):
+        values = srmp_collective_start(
+            self.alternatives,
+            self.preference_relations_union,
+            self.indifference_relations_union,
+            self.params.sigma,
+            model,
+            self.preference_relations,
+            self.indifference_relations,
+            self.preferences_changed,
+        )
+        s, s_star = values["s"], values["s_star"]
+        values["R"] = [
+            max(
+                s[self.preference_relations_union.index(P(r.b, r.a)), 0]
+                + s_star[self.indifference_relations_union.index(I(r.a, r.b))]
+                - 1,
+                0,
+            )
+            for r in self.preference_refused
+        ] + [
+            max(
+                s[self.preference_relations_union.index(P(r.a, r.b)), 0]
+                + s[self.preference_relations_union.index(P(r.b, r.a)), 0]
+                - 1,
+                0,
+            )
+            for r in self.indifference_refused
+        ]
+        return values
+
     def create_solution(self):
         weights = np.array([
             cast(float, value(self.vars["w"][j])) for j in self.params.M
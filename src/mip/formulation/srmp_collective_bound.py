@@ -19,6 +19,7 @@ from src.performance_table.normal_performance_table import NormalPerformanceTabl
 from src.srmp.model import SRMPModel
 
 from ..mip import MIP, D, MIPParams, MIPVars, value
+from .srmp_collective import srmp_collective_start
 
 
 class MIPSRMPCollectiveBoundVars(MIPVars):
@@ -63,6 +64,7 @@ class MIPSRMPCollectiveBound(
     models: list[SRMPModel]
     gamma: float = EPSILON
     best_objective: float | None = None
+    warm_startable = True
 
     def create_parameters(self):
         self.params = MIPSRMPCollectiveBoundParams(
@@ -317,6 +319,18 @@ class MIPSRMPCollectiveBound(
                     self.prob += self.vars["p"][h][j] >= profiles_min[h - 1, j]
                     self.prob += self.vars["p"][h][j] <= profiles_max[h - 1, j]
 
+    def start_values(self, model: SRMPModel):
+        return srmp_collective_start(
+            self.alternatives,
+            self.preference_relations_union,
+            self.indifference_relations_union,
+            self.params.sigma,
+            model,
+            self.preference_relations,
+            self.indifference_relations,
+            self.preferences_changed,
+        )
+
     def create_solution(self):
         weights = np.array([
             cast(float, value(self.vars["w"][j])) for j in self.params.M
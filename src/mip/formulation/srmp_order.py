@@ -0,0 +1,308 @@
+"""This module implements the elicitation of SRMP models with the lexicographic
+orders as variables, in a single MIP instead of one MIP per lexicographic
+order.
+
+The lexicographic order of a decision maker is modelled with binary
+assignment variables `z[h, l]`, set when profile `h` is at position `l`. The
+difference of weighted concordances of a comparison at position `l` is a
+variable `d[l]`, linked with big-M constraints to the difference at the
+profile assigned to `l`. Indifferences hold at every profile, whatever the
+order.
+"""
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+import numpy.typing as npt
+from mcda.relations import I, P
+
+from src.constants import EPSILON
+from src.performance_table.normal_performance_table import NormalPerformanceTable
+from src.srmp.model import (
+    SRMPGroupModel,
+    SRMPGroupModelProfiles,
+    SRMPGroupModelWeights,
+    SRMPGroupModelWeightsProfiles,
+    SRMPModel,
+    SRMPParamFlag,
+    srmp_group_model,
+)
+
+from ..matrix import MatrixProgram
+from ..mip import MIP, MIPParams, MIPVars
+from .srmp import relations_indices
+
+
+def srmp_order_program(
+    performances: npt.NDArray[np.float64],
+    preferences: Sequence[npt.NDArray[np.int_]],
+    indifferences: Sequence[npt.NDArray[np.int_]],
+    k: int,
+    shared_params: SRMPParamFlag = SRMPParamFlag.NONE,
+    gamma: float = EPSILON,
+    inconsistencies: bool = True,
+    best_fitness: float | None = None,
+):
+    """Build the elicitation program of SRMP models with lexicographic order
+    assignment variables in matrix form.
+
+    :param performances: array of shape (n, m)
+    :param preferences: alternatives indices of the preferences of each
+        decision maker, of shape (r, 2)
+    :param indifferences: alternatives indices of the indifferences of each
+        decision maker, of shape (i, 2)
+    :param k: number of profiles
+    :param shared_params: parameters shared between decision makers
+    :param gamma:
+    :param inconsistencies:
+    :param best_fitness:
+    :return: program and variables indices
+    """
+    n, m = performances.shape
+    nb_dm = len(preferences)
+
+    def nb_shared(param: SRMPParamFlag):
+        return 1 if param in shared_params else nb_dm
+
+    program = MatrixProgram(maximize=True)
+
+    w = program.add_variables((nb_shared(SRMPParamFlag.WEIGHTS), m))
+    p = program.add_variables((nb_shared(SRMPParamFlag.PROFILES), k, m))
+    z = program.add_variables(
+        (nb_shared(SRMPParamFlag.LEXICOGRAPHIC_ORDER), k, k), integer=True
+    )
+    delta = program.add_variables((nb_dm, n, k, m), integer=True)
+    omega = program.add_variables((nb_dm, n, k, m))
+
+    # Comparisons of all decision makers, with their decision maker
+    pref = np.concatenate([
+        np.column_stack([np.full(len(r), dm), r.reshape(-1, 2)])
+        for dm, r in enumerate(preferences)
+    ]).astype(np.int_)
+    indif = np.concatenate([
+        np.column_stack([np.full(len(r), dm), r.reshape(-1, 2)])
+        for dm, r in enumerate(indifferences)
+    ]).astype(np.int_)
+
+    s = program.add_variables((len(pref), k + 1), integer=True)
+    s_star = program.add_variables(len(indif) if inconsistencies else 0, integer=True)
+    d = program.add_variables((len(pref), k), lb=-1)
+
+    if inconsistencies:
+        program.add_objective(np.concatenate([s[:, 0], s_star]))
+
+    # Normalized weights
+    program.add_constraints(w, 1, 1, 1)
+
+    # Dominance between the reference profiles
+    program.add_constraints(
+        np.stack([p[:, 1:], p[:, :-1]], -1).reshape(-1, 2), [1, -1], 0
+    )
+
+    # Assignment of the profiles to the lexicographic positions
+    program.add_constraints(z.reshape(-1, k), 1, 1, 1)
+    program.add_constraints(z.transpose(0, 2, 1).reshape(-1, k), 1, 1, 1)
+
+    # Constraints on the local concordances
+    profiles = np.broadcast_to(p[:, None], (nb_dm, n, k, m))
+    perfs = np.broadcast_to(performances[:, None], (nb_dm, n, k, m)).ravel()
+    cols = np.stack([profiles, delta], -1).reshape(-1, 2)
+    program.add_constraints(cols, 1, upper=perfs + 1)
+    program.add_constraints(cols, 1, lower=perfs + gamma)
+
+    # Constraints on the weighted local concordances
+    weights = np.broadcast_to(w[:, None, None], (nb_dm, n, k, m))
+    program.add_constraints(
+        np.stack([omega, weights], -1).reshape(-1, 2), [1, -1], upper=0
+    )
+    program.add_constraints(
+        np.stack([omega, delta], -1).reshape(-1, 2), [1, -1], upper=0
+    )
+    program.add_constraints(
+        np.stack([omega, delta, weights], -1).reshape(-1, 3), [1, -1, -1], lower=-1
+    )
+
+    ones = np.ones(m)
+
+    # Differences of weighted concordances at each position
+    # |d[l] - (omega_a[h] - omega_b[h])| <= 2 (1 - z[h, l])
+    dm, a, b = pref.T
+    orders = np.broadcast_to(z, (nb_dm, k, k))[dm]
+    cols = np.concatenate(
+        [
+            np.broadcast_to(d[:, :, None, None], (len(pref), k, k, 1)),
+            np.broadcast_to(omega[dm, a][:, None], (len(pref), k, k, m)),
+            np.broadcast_to(omega[dm, b][:, None], (len(pref), k, k, m)),
+            orders.transpose(0, 2, 1)[..., None],
+        ],
+        -1,
+    ).reshape(-1, 2 * m + 2)
+    program.add_constraints(cols, np.concatenate([[1], -ones, ones, [2]]), upper=2)
+    program.add_constraints(cols, np.concatenate([[1], -ones, ones, [-2]]), lower=-2)
+
+    # Constraints on the preference ranking variables
+    if not inconsistencies:
+        program.add_constraints(s[:, [0]], 1, 1, 1)
+    program.add_constraints(s[:, [k]], 1, 0, 0)
+
+    # Constraints on the preferences
+    cols = np.stack([d, s[:, 1:], s[:, :-1]], -1).reshape(-1, 3)
+    program.add_constraints(cols, [1, 1 + gamma, -1], lower=gamma - 1)
+    program.add_constraints(cols, [1, -1, -1], lower=-2)
+    program.add_constraints(cols, [1, 1, 1], upper=2)
+
+    # Constraints on the indifferences
+    dm, a, b = indif.T
+    cols = np.concatenate([omega[dm, a], omega[dm, b]], -1)
+    if not inconsistencies:
+        program.add_constraints(
+            cols.reshape(-1, 2 * m), np.concatenate([ones, -ones]), 0, 0
+        )
+    else:
+        cols = np.concatenate(
+            [cols, np.broadcast_to(s_star[:, None, None], (len(indif), k, 1))], -1
+        ).reshape(-1, 2 * m + 1)
+        program.add_constraints(cols, np.concatenate([ones, -ones, [-1]]), upper=-1)
+        program.add_constraints(cols, np.concatenate([-ones, ones, [-1]]), upper=-1)
+
+        if best_fitness is not None:
+            program.add_constraints(
+                np.concatenate([s[:, 0], s_star])[None], 1, lower=best_fitness + gamma
+            )
+
+    return program, {"w": w, "p": p, "z": z}
+
+
+def assigned_orders(z: npt.NDArray[np.float64]) -> list[list[int]]:
+    """Decode lexicographic orders from assignment variables values.
+
+    :param z: array of shape (g, k, k)
+    :return: profile at each position, for each order
+    """
+    return z.argmax(1).tolist()
+
+
+@dataclass
+class MIPSRMPOrderParams(MIPParams):
+    A: list[Any]
+    M: list[Any]
+    k: int
+
+
+@dataclass(kw_only=True)
+class MIPSRMPOrder(MIP[SRMPModel, MIPVars, MIPSRMPOrderParams]):
+    """This class implements the elicitation of a SRMP model with its
+    lexicographic order as variables.
+    """
+
+    alternatives: NormalPerformanceTable
+    preference_relations: list[P]
+    indifference_relations: list[I]
+    k: int
+    gamma: float = EPSILON
+    inconsistencies: bool = True
+    best_fitness: float | None = None
+    matrix_form = True
+
+    def create_parameters(self):
+        self.params = MIPSRMPOrderParams(
+            A=self.alternatives.alternatives,  # type: ignore
+            M=self.alternatives.criteria,  # type: ignore
+            k=self.k,
+        )
+
+    def create_variables(self):
+        self.vars = MIPVars()
+
+    def create_problem(self):
+        self.create_matrix_problem()
+        self.prob, self.program_vars = self.program.to_pulp("SRMP_Elicitation")
+
+    def create_matrix_problem(self):
+        self.program, self.indices = srmp_order_program(
+            self.alternatives.data.to_numpy(dtype=np.float64),
+            [relations_indices(self.params.A, self.preference_relations)],
+            [relations_indices(self.params.A, self.indifference_relations)],
+            self.params.k,
+            gamma=self.gamma,
+            inconsistencies=self.inconsistencies,
+            best_fitness=self.best_fitness,
+        )
+
+    def create_solution(self):
+        x = self.program_values()
+        self.sol = SRMPModel(
+            profiles=NormalPerformanceTable(x[self.indices["p"][0]]),
+            weights=x[self.indices["w"][0]],
+            lexicographic_order=assigned_orders(x[self.indices["z"]])[0],
+        )
+
+
+@dataclass(kw_only=True)
+class MIPSRMPGroupOrder(
+    MIP[
+        SRMPGroupModelWeightsProfiles
+        | SRMPGroupModelWeights
+        | SRMPGroupModelProfiles
+        | SRMPGroupModel,
+        MIPVars,
+        MIPSRMPOrderParams,
+    ]
+):
+    """This class implements the elicitation of SRMP group models with their
+    lexicographic orders as variables.
+    """
+
+    alternatives: NormalPerformanceTable
+    preference_relations: list[list[P]]
+    indifference_relations: list[list[I]]
+    k: int
+    shared_params: SRMPParamFlag = SRMPParamFlag.NONE
+    gamma: float = EPSILON
+    inconsistencies: bool = True
+    best_fitness: float | None = None
+    matrix_form = True
+
+    def create_parameters(self):
+        self.params = MIPSRMPOrderParams(
+            A=self.alternatives.alternatives,  # type: ignore
+            M=self.alternatives.criteria,  # type: ignore
+            k=self.k,
+        )
+
+    def create_variables(self):
+        self.vars = MIPVars()
+
+    def create_problem(self):
+        self.create_matrix_problem()
+        self.prob, self.program_vars = self.program.to_pulp("SRMP_Elicitation")
+
+    def create_matrix_problem(self):
+        self.program, self.indices = srmp_order_program(
+            self.alternatives.data.to_numpy(dtype=np.float64),
+            [relations_indices(self.params.A, r) for r in self.preference_relations],
+            [relations_indices(self.params.A, r) for r in self.indifference_relations],
+            self.params.k,
+            self.shared_params,
+            self.gamma,
+            self.inconsistencies,
+            self.best_fitness,
+        )
+
+    def create_solution(self):
+        x = self.program_values()
+        weights = list(x[self.indices["w"]])
+        profiles = [NormalPerformanceTable(p) for p in x[self.indices["p"]]]
+        orders = assigned_orders(x[self.indices["z"]])
+
+        def shared[T](param: SRMPParamFlag, values: list[T]):
+            return values[0] if param in self.shared_params else values
+
+        self.sol = srmp_group_model(self.shared_params)(
+            group_size=len(self.preference_relations),
+            profiles=shared(SRMPParamFlag.PROFILES, profiles),
+            weights=shared(SRMPParamFlag.WEIGHTS, weights),
+            lexicographic_order=shared(SRMPParamFlag.LEXICOGRAPHIC_ORDER, orders),
+        )
@@ -1,11 +1,13 @@
+from collections import deque
+from collections.abc import Callable, Sequence
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from enum import Enum, member
 from functools import partial
 from itertools import permutations, product
-from typing import Any, NamedTuple, cast
+from typing import Any, NamedTuple, overload
 
 import numpy as np
 from mcda.relations import I, P, PreferenceStructure
-from pulp import value  # type: ignore
 
 from src.constants import DEFAULT_MAX_TIME
 from src.models import GroupModelEnum
@@ -16,7 +18,7 @@ from src.rmp.permutation import all_max_adjacent_distance
 from src.srmp.model import SRMPModel, SRMPParamFlag
 
 from ..model import Model
-from ..utils import add_filename_suffix
+from ..utils import add_filename_suffix, catchtime
 from .formulation.srmp import MIPSRMP
 from .formulation.srmp_accept import MIPSRMPAccept
 from .formulation.srmp_collective import MIPSRMPCollective
@@ -25,6 +27,7 @@ from .formulation.srmp_collective_distance import MIPSRMPCollectiveDistance
 from .formulation.srmp_group import MIPSRMPGroup
 from .formulation.srmp_group_close import MIPSRMPGroupClose
 from .formulation.srmp_group_lexicographic import MIPSRMPGroupLexicographicOrder
+from .formulation.srmp_order import MIPSRMPGroupOrder, MIPSRMPOrder
 from .mip import MIP
 
 
@@ -40,6 +43,45 @@ class MIPResult[M, O](NamedTuple):
     optimal: bool
 
 
+class LazyMIPs[T](Sequence[T]):
+    """This class implements a sequence of MIPs, each one created when accessed,
+    so that the MIPs are only held in memory while in use.
+
+    :param factories: functions creating the MIPs
+    """
+
+    def __init__(self, factories: Sequence[Callable[[], T]]):
+        self.factories = factories
+
+    def __len__(self):
+        return len(self.factories)
+
+    @overload
+    def __getitem__(self, index: int) -> T: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "LazyMIPs[T]": ...
+
+    def __getitem__(self, index: int | slice):
+        if isinstance(index, slice):
+            return LazyMIPs(self.factories[index])
+        return self.factories[index]()
+
+    def __add__(self, other: "LazyMIPs[T]"):
+        return LazyMIPs([*self.factories, *other.factories])
+
+    def map(self, function: Callable[[T], T]):
+        """Apply a function to each MIP when created.
+
+        :param function:
+        :return:
+        """
+        return LazyMIPs([
+            partial(lambda factory: function(factory()), factory)
+            for factory in self.factories
+        ])
+
+
 def create_mip(
     model_type: GroupModelEnum,
     k: int,
@@ -62,6 +104,8 @@ def create_mip(
     lexicographic_order_distance: int = 0,
     inconsistencies: bool = False,
     nb_cpus: int = 1,
+    lex_order_assignment: bool = False,
+    lexicographic_order_score: Callable[[Any], float] | None = None,
     *args: Any,
     **kwargs: Any,
 ):
@@ -105,6 +149,43 @@ def create_mip(
         preference_relations = preference_relations_list[0]
         indifference_relations = indifference_relations_list[0]
 
+    # Single MIP with the lexicographic orders as assignment variables
+    if lex_order_assignment:
+        if lex_order or reference_model or collective or close:
+            raise ValueError(
+                "Lexicographic order assignment cannot be combined with a "
+                "lexicographic order, a reference model, collective or close MIPs"
+            )
+        order_mip = (
+            partial(
+                MIPSRMPOrder,
+                preference_relations=preference_relations,
+                indifference_relations=indifference_relations,
+            )
+            if NB_DM == 1
+            else partial(
+                MIPSRMPGroupOrder,
+                preference_relations=preference_relations_list,
+                indifference_relations=indifference_relations_list,
+                shared_params=shared_params,
+            )
+        )
+        return (
+            LazyMIPs([
+                partial(
+                    order_mip,
+                    alternatives=alternatives,
+                    k=k,
+                    inconsistencies=inconsistencies,
+                    time_limit=max_time,
+                    seed=seed_mip,
+                    nb_cpus=nb_cpus,
+                    **kwargs,
+                )
+            ]),
+            SenseEnum.MAX,
+        )
+
     if lex_order:
         lexicographic_orders_array = np.array([lex_order], dtype=np.int_)
     elif lex_order_shared:
@@ -129,6 +210,11 @@ def create_mip(
 
     lexicographic_orders: list[Any] = lexicographic_orders_array.tolist()
 
+    # Most promising orders first, ties in random order
+    if lexicographic_order_score:
+        lexicographic_orders.sort(key=lexicographic_order_score)
+
+    # Threads of each MIP when started at once, reallocated by `mip_sweep`
     NB_CPUS_MIP = max(nb_cpus // len(lexicographic_orders), 1)
 
     sense = SenseEnum.MIN
@@ -272,18 +358,18 @@ def create_mip(
         )
         sense = SenseEnum.MAX
 
-    mips = (
+    mips = [
         partial(mip, lexicographic_order=lexicographic_order)
         for lexicographic_order in lexicographic_orders
-    )
+    ]
 
     if log_path := kwargs.pop("log_path", None):
-        mips = (
+        mips = [
             partial(mip, log_path=add_filename_suffix(log_path, f"_{i}"))
             for i, mip in enumerate(mips)
-        )
+        ]
 
-    return ((mip(**kwargs) for mip in mips), sense)
+    return (LazyMIPs([partial(mip, **kwargs) for mip in mips]), sense)
 
     # with ThreadPoolExecutor(NB_WORKERS) as thread_pool:
     #     tic = monotonic()
@@ -305,47 +391,140 @@ def create_mip(
 
 
 def mip_result[M: Model](mip: MIP[M, Any, Any]):
-    best_sol = mip.learn()
-    best_objective = (
-        cast(float, value(objective))
-        if (objective := mip.prob.objective) is not None
-        else None
-    )
+    # Wall-clock time, as the time limit of the solvers
+    with catchtime() as time:
+        best_sol = mip.learn()
     return MIPResult(
         best_sol,
-        best_objective,
-        mip.prob.solutionCpuTime,
-        mip.prob.sol_status == 1,
+        mip.objective_value() if best_sol is not None else None,
+        time(),
+        # Infeasible under a cutoff: nothing better than the cutoff
+        mip.optimal() or (mip.cutoff is not None and mip.infeasible()),
     )
 
-    #         model = mip.learn()
-
-    #         time += mip.prob.solutionCpuTime
-    #         time_left = max_time - time
-    #         status = mip.prob.status
-    #         objective = mip.prob.objective
-
-    #         if model is not None:
-    #             if collective:
-    #                 best_model = model
-    #                 best_objective = cast(int, value(objective))
-
-    #                 if best_objective == sum(preferences_changes):
-    #                     break
-    #             else:
-    #                 best_model = model
-    #                 best_objective = (
-    #                     (
-    #                         cast(int, value(objective))
-    #                         / sum(len(comparisons[dm]) for dm in DMS)
-    #                         if status > 0
-    #                         else 0
-    #                     )
-    #                     if objective
-    #                     else 1
-    #                 )
-
-    #                 if best_objective == 1:
-    #                     break
-
-    # return MIPResult(best_model, best_objective, time)
+
+def mip_sweep[M: Model](
+    mips: Sequence[MIP[M, Any, Any]],
+    sense: SenseEnum,
+    nb_cpus: int = 1,
+    optimum: float | None = None,
+    relaunch_ratio: float | None = None,
+    cutoff: bool = True,
+):
+    """Solve MIPs of the same problem concurrently, sharing the best objective
+    found so far and the solver threads.
+
+    Each MIP is started with the best objective found so far as cutoff (if
+    `cutoff`), and with its share of the threads left free by the running MIPs,
+    the MIPs waiting to start sharing them equally. Once a MIP reaches
+    `optimum`, or finds a model of a MIP without objective to optimize, no other
+    MIP is started and the running ones are interrupted (with the matrix form
+    only).
+
+    Threads freed while MIPs are running cannot be handed to their solvers.
+    With `relaunch_ratio`, MIPs are first started with this ratio of their time
+    limit, and those not solved to optimality are relaunched with the rest of
+    their time limit, largest gaps first (in the order their first run ended
+    with PuLP, which reports no gap), to get the threads freed by the
+    others, from the model of their first run if they can be warm started.
+
+    :param mips: MIPs, most promising first, each one accessed once when started
+        (see :class:`LazyMIPs`)
+    :param sense: sense of the objectives
+    :param nb_cpus: number of threads shared by the solvers
+    :param optimum: best possible objective, if known
+    :param relaunch_ratio: ratio of the time limit of the first run of the MIPs
+    :param cutoff: whether to cut off the MIPs with the best objective found so
+        far, otherwise all of them find their own best model
+    :return: results of the MIPs started, and whether the best of them is
+        optimal (`optimum` reached, or all MIPs solved)
+    """
+    queue = deque(range(len(mips)))
+    started: dict[int, MIP[M, Any, Any]] = {}
+    time_limits: dict[int, float] = {}
+    relaunch: list[int] = []
+    results: dict[int, MIPResult[M | None, float | None]] = {}
+    solved: dict[int, bool] = {}
+    running: dict[Future[MIPResult[M | None, float | None]], tuple[int, int]] = {}
+    free = nb_cpus
+    best_objective: float | None = None
+    stop = False
+    with ThreadPoolExecutor(nb_cpus) as thread_pool:
+        while True:
+            while (not stop) and (free > 0) and (queue or relaunch):
+                # Ceiling of an equal share of the free threads
+                threads = -(-free // (len(queue) + len(relaunch)))
+                if queue:
+                    i = queue.popleft()
+                    mip = started[i] = mips[i]
+                    time_limits[i] = mip.solver_options["time_limit"]
+                    options: dict[str, Any] = (
+                        {"time_limit": time_limits[i] * relaunch_ratio}
+                        if relaunch_ratio
+                        else {}
+                    )
+                else:
+                    # Stable sort: first ended first among equal gaps
+                    relaunch.sort(key=lambda i: started[i].gap(), reverse=True)
+                    i = relaunch.pop(0)
+                    mip = started[i]
+                    options = {"time_limit": time_limits[i] - results[i].time}
+                    if mip.warm_startable and (
+                        (model := results[i].best_model) is not None
+                    ):
+                        mip.warm_start(model)
+                mip.update_solver(threads=threads, **options)
+                if cutoff and (best_objective is not None):
+                    mip.set_cutoff(best_objective)
+                running[thread_pool.submit(mip_result, mip)] = (i, threads)
+                free -= threads
+            if not running:
+                break
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            stopped = stop
+            for future in done:
+                i, threads = running.pop(future)
+                free += threads
+                result = future.result()
+                if (first := results.get(i)) is not None:
+                    # Keep the model of the first run if the relaunch found none
+                    result = (
+                        result
+                        if result.best_model is not None
+                        else first._replace(optimal=result.optimal)
+                    )._replace(time=first.time + result.time)
+                elif (
+                    relaunch_ratio
+                    and (not result.optimal)
+                    and (time_limits[i] > result.time)
+                ):
+                    relaunch.append(i)
+                results[i] = result
+                solved[i] = result.optimal or started[i].infeasible()
+                if i not in relaunch:
+                    del started[i]
+
+                if result.best_model is None:
+                    continue
+                if result.best_objective is None:
+                    stop = True
+                    continue
+                best_objective = (
+                    result.best_objective
+                    if best_objective is None
+                    else sense.value(best_objective, result.best_objective)
+                )
+                if (optimum is not None) and (
+                    sense.value(best_objective, optimum) == best_objective
+                ):
+                    stop = True
+
+            # Running MIPs cannot improve on the models found
+            if stop and not stopped:
+                for i, _ in running.values():
+                    started[i].cancel()
+
+    # Without stopping, all MIPs ran, proving their optimum or infeasibility
+    optimal = stop or (bool(solved) and all(solved.values()))
+    return list(results.values()), optimal
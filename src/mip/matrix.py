@@ -0,0 +1,405 @@
+"""This module implements mixed integer linear programs in matrix form.
+
+Constraints are added by blocks of rows built from NumPy arrays and stored as
+a sparse matrix, which is handed directly to the matrix API of an in-process
+solver (HiGHS or Gurobi) instead of building one PuLP expression per
+constraint.
+"""
+
+from collections.abc import Callable
+from enum import auto
+from importlib.util import find_spec
+from math import inf
+from pathlib import Path
+from typing import Any, NamedTuple
+
+import numpy as np
+import numpy.typing as npt
+from pulp import (  # type: ignore
+    LpAffineExpression,
+    LpContinuous,
+    LpInteger,
+    LpMaximize,
+    LpMinimize,
+    LpProblem,
+    LpVariable,
+)
+from scipy.sparse import csr_array  # type: ignore
+
+from src.case_insensitive_str_enum import CaseInsensitiveStrEnum
+
+
+class MIPBackendEnum(CaseInsensitiveStrEnum):
+    PULP = auto()
+    HIGHS = auto()
+    GUROBI = auto()
+
+    @property
+    def available(self):
+        match self:
+            case MIPBackendEnum.PULP:
+                return True
+            case MIPBackendEnum.HIGHS:
+                return find_spec("highspy") is not None
+            case MIPBackendEnum.GUROBI:
+                return find_spec("gurobipy") is not None
+
+
+class MatrixSolution(NamedTuple):
+    x: npt.NDArray[np.float64] | None
+    objective: float | None
+    time: float
+    optimal: bool
+    infeasible: bool = False
+    gap: float = inf
+
+
+class MatrixProgram:
+    """This class implements a mixed integer linear program in matrix form.
+
+    Each row of the constraint matrix is bounded by `lower` and `upper`.
+
+    :param maximize:
+    """
+
+    def __init__(self, maximize: bool = False):
+        self.maximize = maximize
+        self.nb_vars = 0
+        self.nb_rows = 0
+        self._lb: list[npt.NDArray[np.float64]] = []
+        self._ub: list[npt.NDArray[np.float64]] = []
+        self._integer: list[npt.NDArray[np.bool]] = []
+        self._rows: list[npt.NDArray[np.int_]] = []
+        self._cols: list[npt.NDArray[np.int_]] = []
+        self._vals: list[npt.NDArray[np.float64]] = []
+        self._lower: list[npt.NDArray[np.float64]] = []
+        self._upper: list[npt.NDArray[np.float64]] = []
+        self._objective: list[tuple[npt.NDArray[np.int_], npt.NDArray[np.float64]]] = []
+        self.cancelled = False
+        self.interrupt: Callable[[], Any] | None = None
+
+    def add_variables(
+        self,
+        shape: int | tuple[int, ...],
+        lb: float = 0,
+        ub: float = 1,
+        integer: bool = False,
+    ) -> npt.NDArray[np.int_]:
+        """Add a block of variables.
+
+        :param shape:
+        :param lb: lower bound
+        :param ub: upper bound
+        :param integer:
+        :return: indices of the variables, of shape `shape`
+        """
+        indices = np.arange(self.nb_vars, self.nb_vars + np.prod(shape, dtype=int))
+        self._lb.append(np.full(len(indices), lb, dtype=np.float64))
+        self._ub.append(np.full(len(indices), ub, dtype=np.float64))
+        self._integer.append(np.full(len(indices), integer))
+        self.nb_vars += len(indices)
+        return indices.reshape(shape)
+
+    def add_constraints(
+        self,
+        cols: npt.ArrayLike,
+        vals: npt.ArrayLike = 1,
+        lower: npt.ArrayLike = -np.inf,
+        upper: npt.ArrayLike = np.inf,
+    ):
+        """Add a block of rows ``lower <= vals . x[cols] <= upper``.
+
+        :param cols: variables indices, of shape (r, t)
+        :param vals: coefficients, broadcastable to shape (r, t)
+        :param lower: broadcastable to shape (r,)
+        :param upper: broadcastable to shape (r,)
+        """
+        cols = np.asarray(cols, dtype=np.int_)
+        r, t = cols.shape
+        self._rows.append(np.repeat(np.arange(self.nb_rows, self.nb_rows + r), t))
+        self._cols.append(cols.ravel())
+        self._vals.append(np.broadcast_to(vals, (r, t)).ravel().astype(np.float64))
+        self._lower.append(np.broadcast_to(lower, r).astype(np.float64))
+        self._upper.append(np.broadcast_to(upper, r).astype(np.float64))
+        self.nb_rows += r
+
+    def add_cutoff(self, bound: float):
+        """Add a row restricting the objective to values at least as good as
+        `bound`.
+
+        :param bound:
+        """
+        cost = self.cost
+        cols = np.flatnonzero(cost)
+        if self.maximize:
+            self.add_constraints(cols[None], cost[cols], lower=bound)
+        else:
+            self.add_constraints(cols[None], cost[cols], upper=bound)
+
+    def add_objective(self, cols: npt.ArrayLike, vals: npt.ArrayLike = 1):
+        """Add terms to the objective.
+
+        :param cols: variables indices
+        :param vals: coefficients, broadcastable to the shape of `cols`
+        """
+        cols = np.asarray(cols, dtype=np.int_).ravel()
+        self._objective.append(
+            (cols, np.broadcast_to(vals, cols.shape).astype(np.float64))
+        )
+
+    @property
+    def has_objective(self):
+        return bool(self._objective)
+
+    @property
+    def lb(self):
+        return np.concatenate(self._lb) if self._lb else np.empty(0)
+
+    @property
+    def ub(self):
+        return np.concatenate(self._ub) if self._ub else np.empty(0)
+
+    @property
+    def integer(self):
+        return np.concatenate(self._integer) if self._integer else np.empty(0, bool)
+
+    @property
+    def lower(self):
+        return np.concatenate(self._lower) if self._lower else np.empty(0)
+
+    @property
+    def upper(self):
+        return np.concatenate(self._upper) if self._upper else np.empty(0)
+
+    @property
+    def cost(self):
+        cost = np.zeros(self.nb_vars)
+        for cols, vals in self._objective:
+            np.add.at(cost, cols, vals)
+        return cost
+
+    @property
+    def matrix(self) -> csr_array:
+        """Constraint matrix, duplicate entries being summed."""
+        if not self._rows:
+            return csr_array((self.nb_rows, self.nb_vars))
+        return csr_array(
+            (
+                np.concatenate(self._vals),
+                (np.concatenate(self._rows), np.concatenate(self._cols)),
+            ),
+            shape=(self.nb_rows, self.nb_vars),
+        )
+
+    def to_pulp(self, name: str = "NoName") -> tuple[LpProblem, list[LpVariable]]:
+        """Convert to a PuLP problem, for solvers without a matrix API.
+
+        :param name:
+        :return: problem and its variables
+        """
+        variables = [
+            LpVariable(
+                f"x_{i}", float(lb), float(ub), LpInteger if integer else LpContinuous
+            )
+            for i, (lb, ub, integer) in enumerate(zip(self.lb, self.ub, self.integer))
+        ]
+        prob = LpProblem(name, LpMaximize if self.maximize else LpMinimize)
+
+        if self.has_objective:
+            cost = self.cost
+            prob += LpAffineExpression([
+                (variables[i], float(cost[i])) for i in np.flatnonzero(cost)
+            ])
+
+        matrix = self.matrix
+        for i, (lower, upper) in enumerate(zip(self.lower, self.upper)):
+            row = slice(matrix.indptr[i], matrix.indptr[i + 1])
+            expr = LpAffineExpression([
+                (variables[j], float(v))
+                for j, v in zip(matrix.indices[row], matrix.data[row])
+            ])
+            if lower == upper:
+                prob += expr == float(lower)
+            else:
+                if np.isfinite(lower):
+                    prob += expr >= float(lower)
+                if np.isfinite(upper):
+                    prob += expr <= float(upper)
+        return prob, variables
+
+    def cancel(self):
+        """Interrupt the running solve, from another thread, or skip the next
+        one if not started.
+
+        Gurobi polls `cancelled` during the solve, HiGHS is interrupted.
+        """
+        self.cancelled = True
+        if (interrupt := self.interrupt) is not None:
+            interrupt()
+
+    def solve(
+        self,
+        backend: MIPBackendEnum,
+        time_limit: float,
+        seed: int,
+        verbose: bool = False,
+        threads: int = 1,
+        log_path: Path | None = None,
+        cutoff: float | None = None,
+        start: npt.NDArray[np.float64] | None = None,
+    ) -> MatrixSolution:
+        """Solve with the matrix API of a solver.
+
+        :param cutoff: objective bound given to the solver, Gurobi only
+            (see :meth:`add_cutoff` for the other solvers)
+        :param start: values of the variables to start from
+        """
+        if self.cancelled:
+            time_limit = 0
+        match backend:
+            case MIPBackendEnum.HIGHS:
+                return solve_highs(
+                    self, time_limit, seed, verbose, threads, log_path, start
+                )
+            case MIPBackendEnum.GUROBI:
+                return solve_gurobi(
+                    self, time_limit, seed, verbose, threads, log_path, cutoff, start
+                )
+            case _:
+                raise ValueError(f"{backend} backend has no matrix API")
+
+
+def solve_highs(
+    program: MatrixProgram,
+    time_limit: float,
+    seed: int,
+    verbose: bool = False,
+    threads: int = 1,
+    log_path: Path | None = None,
+    start: npt.NDArray[np.float64] | None = None,
+):
+    import highspy  # type: ignore
+
+    matrix = program.matrix.tocsc()
+
+    lp: Any = highspy.HighsLp()
+    lp.num_col_ = program.nb_vars
+    lp.num_row_ = program.nb_rows
+    lp.col_cost_ = program.cost
+    lp.col_lower_ = program.lb
+    lp.col_upper_ = program.ub
+    lp.row_lower_ = program.lower
+    lp.row_upper_ = program.upper
+    lp.sense_ = (
+        highspy.ObjSense.kMaximize if program.maximize else highspy.ObjSense.kMinimize
+    )
+    lp.a_matrix_.format_ = highspy.MatrixFormat.kColwise
+    lp.a_matrix_.num_col_ = program.nb_vars
+    lp.a_matrix_.num_row_ = program.nb_rows
+    lp.a_matrix_.start_ = matrix.indptr
+    lp.a_matrix_.index_ = matrix.indices
+    lp.a_matrix_.value_ = matrix.data
+    lp.integrality_ = [
+        highspy.HighsVarType.kInteger if integer else highspy.HighsVarType.kContinuous
+        for integer in program.integer
+    ]
+
+    h: Any = highspy.Highs()
+    h.setOptionValue("output_flag", verbose)
+    h.setOptionValue("time_limit", float(time_limit))
+    h.setOptionValue("threads", threads)
+    h.setOptionValue("random_seed", seed)
+    if log_path:
+        h.setOptionValue("log_file", str(log_path))
+    h.passModel(lp)
+    if start is not None:
+        solution: Any = highspy.HighsSolution()
+        solution.col_value = start
+        h.setSolution(solution)
+    program.interrupt = h.cancelSolve
+    try:
+        # Cancelled while the model was built
+        if program.cancelled:
+            h.setOptionValue("time_limit", 0.0)
+        h.run()
+    finally:
+        program.interrupt = None
+
+    info = h.getInfo()
+    # Status 2 is kSolutionStatusFeasible
+    feasible = info.primal_solution_status == 2
+    return MatrixSolution(
+        np.array(h.getSolution().col_value) if feasible else None,
+        info.objective_function_value if feasible and program.has_objective else None,
+        h.getRunTime(),
+        h.getModelStatus() == highspy.HighsModelStatus.kOptimal,
+        h.getModelStatus() == highspy.HighsModelStatus.kInfeasible,
+        info.mip_gap,
+    )
+
+
+def solve_gurobi(
+    program: MatrixProgram,
+    time_limit: float,
+    seed: int,
+    verbose: bool = False,
+    threads: int = 1,
+    log_path: Path | None = None,
+    cutoff: float | None = None,
+    start: npt.NDArray[np.float64] | None = None,
+):
+    import gurobipy as gp  # type: ignore
+    from gurobipy import GRB  # type: ignore
+
+    matrix = program.matrix
+    lower, upper = program.lower, program.upper
+    equal = lower == upper
+
+    with gp.Env(empty=True) as env:
+        env.setParam("OutputFlag", int(verbose))
+        if log_path:
+            env.setParam("LogFile", str(log_path))
+        env.start()
+        with gp.Model(env=env) as model:
+            model.Params.TimeLimit = time_limit
+            model.Params.Threads = threads
+            model.Params.Seed = seed
+            if cutoff is not None:
+                model.Params.Cutoff = cutoff
+
+            x = model.addMVar(
+                program.nb_vars,
+                lb=program.lb,
+                ub=program.ub,
+                vtype=np.where(program.integer, GRB.INTEGER, GRB.CONTINUOUS),
+            )
+            if start is not None:
+                x.Start = start
+            for rows, sense, rhs in (
+                (equal, GRB.EQUAL, lower),
+                (~equal & np.isfinite(lower), GRB.GREATER_EQUAL, lower),
+                (~equal & np.isfinite(upper), GRB.LESS_EQUAL, upper),
+            ):
+                if rows.any():
+                    rows = np.flatnonzero(rows)
+                    model.addMConstr(matrix[rows], x, sense, rhs[rows])
+            model.setMObjective(
+                None,
+                program.cost,
+                0.0,
+                sense=GRB.MAXIMIZE if program.maximize else GRB.MINIMIZE,
+            )
+            # Polled by the solver, so that no cancellation is lost
+            model.optimize(
+                lambda model, where: model.terminate() if program.cancelled else None
+            )
+
+            feasible = model.SolCount > 0
+            return MatrixSolution(
+                np.array(x.X) if feasible else None,
+                model.ObjVal if feasible and program.has_objective else None,
+                model.Runtime,
+                model.Status == GRB.OPTIMAL,
+                model.Status in (GRB.INFEASIBLE, GRB.CUTOFF),
+                model.MIPGap if model.IsMIP and feasible else inf,
+            )
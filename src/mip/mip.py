@@ -1,11 +1,16 @@
 from abc import abstractmethod
+from math import inf
 from pathlib import Path
-from typing import Any, TypedDict
+from typing import Any, ClassVar, TypedDict, cast
 
+import numpy as np
+import numpy.typing as npt
 from mcda.internal.core.interfaces import Learner
 from pulp import (  # pyright: ignore[reportMissingTypeStubs]
+    LpMinimize,
     LpProblem,
     LpSolver,
+    LpStatusInfeasible,
     LpVariable,
     getSolver,
     listSolvers,
@@ -16,6 +21,8 @@ from src.constants import DEFAULT_MAX_TIME
 from src.dataclass import Dataclass, InitVar, dataclass, field
 from src.random import SeedLike, int_
 
+from .matrix import MatrixProgram, MatrixSolution, MIPBackendEnum
+
 
 def value(x: Any):
     if (v := value_pulp(x)) is None:
@@ -26,6 +33,20 @@ def value(x: Any):
 type D[T: LpVariable | D] = dict[Any, T]
 
 
+def set_initial_values(variables: LpVariable | D[Any], values: Any):
+    """Set the initial values of nested dicts of variables, in the order of
+    their keys.
+
+    :param variables:
+    :param values: array with one axis per level of dicts
+    """
+    if isinstance(variables, LpVariable):
+        variables.setInitialValue(float(values))
+    else:
+        for variable, v in zip(variables.values(), values):
+            set_initial_values(variable, v)
+
+
 class MIPVars(TypedDict): ...
 
 
@@ -40,11 +61,19 @@ class MIP[T, Vars: MIPVars, Params: MIPParams](Learner[T | None], Dataclass):
     prob: LpProblem = field(init=False)
     solver: LpSolver = field(init=False)
     sol: T = field(init=False)
+    program: MatrixProgram = field(init=False)
+    program_vars: list[LpVariable] = field(init=False)
+    indices: dict[str, npt.NDArray[np.int_]] = field(init=False)
+    solution: MatrixSolution = field(init=False)
+    cutoff: float | None = field(default=None, init=False)
+    backend: MIPBackendEnum = MIPBackendEnum.PULP
     time_limit: InitVar[float] = DEFAULT_MAX_TIME
     seed: InitVar[SeedLike | None] = None
     verbose: InitVar[bool] = False
     log_path: InitVar[Path | None] = None
     nb_cpus: InitVar[int] = 1
+    matrix_form: ClassVar[bool] = False
+    warm_startable: ClassVar[bool] = False
 
     def __post_init__(  # pyright: ignore[reportGeneralTypeIssues]
         self,
@@ -54,13 +83,32 @@ class MIP[T, Vars: MIPVars, Params: MIPParams](Learner[T | None], Dataclass):
         log_path: Path,
         nb_cpus: int,
     ):
-        self.create_solver(time_limit, int_(seed), verbose, nb_cpus, log_path)
-        self.create_parameters()
-        self.create_variables()
-        self.create_problem()
+        # Fall back to PuLP without a matrix form or without the solver
+        if not (self.matrix_form and self.backend.available):
+            self.backend = MIPBackendEnum.PULP
+
+        self.solver_options: dict[str, Any] = {
+            "time_limit": time_limit,
+            "seed": int_(seed) % 2_000_000_000,
+            "verbose": verbose,
+            "threads": nb_cpus,
+            "log_path": log_path,
+        }
+
+        if self.backend is MIPBackendEnum.PULP:
+            self.create_solver(time_limit, int_(seed), verbose, nb_cpus, log_path)
+            self.create_parameters()
+            self.create_variables()
+            self.create_problem()
+        else:
+            self.create_parameters()
+            self.create_matrix_problem()
 
     def learn(self):
-        self.prob.solve(self.solver)
+        if self.backend is MIPBackendEnum.PULP:
+            self.prob.solve(self.solver)
+        else:
+            self.solution = self.program.solve(self.backend, **self.solver_options)
         try:
             self.create_solution()
         except ValueError:
@@ -69,7 +117,13 @@ class MIP[T, Vars: MIPVars, Params: MIPParams](Learner[T | None], Dataclass):
             return self.sol
 
     def create_solver(
-        self, time_limit: float, seed: int, verbose: bool, nb_cpus: int, log_path: Path
+        self,
+        time_limit: float,
+        seed: int,
+        verbose: bool,
+        nb_cpus: int,
+        log_path: Path,
+        warm_start: bool = False,
     ):
         kwargs: dict[str, Any] = {
             "msg": verbose,
@@ -82,6 +136,7 @@ class MIP[T, Vars: MIPVars, Params: MIPParams](Learner[T | None], Dataclass):
             kwargs["solver"] = "GUROBI"
             kwargs["seed"] = seed
             kwargs["logPath"] = str(log_path)
+            kwargs["warmStart"] = warm_start
         elif "HiGHS" in listSolvers(True):
             kwargs["solver"] = "HiGHS"
             kwargs["random_seed"] = seed
@@ -90,9 +145,123 @@ class MIP[T, Vars: MIPVars, Params: MIPParams](Learner[T | None], Dataclass):
             kwargs["solver"] = "PULP_CBC_CMD"
             kwargs["options"] = [f"RandomS {seed}"]
             kwargs["logPath"] = str(log_path)
+            kwargs["warmStart"] = warm_start
 
         self.solver = getSolver(**kwargs)
 
+    def update_solver(self, **options: Any):
+        """Update the options of the solver before `learn`, e.g. to solve
+        again with more threads or a new time limit.
+
+        :param options: among `time_limit`, `threads`, `verbose`, `log_path`,
+            and the warm start (`warm_start` with PuLP, `start` otherwise)
+        """
+        self.solver_options.update(options)
+        if self.backend is MIPBackendEnum.PULP:
+            self.create_solver(
+                self.solver_options["time_limit"],
+                self.solver_options["seed"],
+                self.solver_options["verbose"],
+                self.solver_options["threads"],
+                self.solver_options["log_path"],
+                self.solver_options.get("warm_start", False),
+            )
+
+    def warm_start(self, model: T):
+        """Start the solver from the values of the variables given by a model,
+        before `learn`, if `warm_startable`.
+
+        HiGHS only takes it with the matrix form.
+
+        :param model:
+        :raise ValueError: if not `warm_startable`
+        """
+        if not self.warm_startable:
+            raise ValueError(f"{type(self).__name__} cannot be warm started")
+        values = self.start_values(model)
+        if self.backend is MIPBackendEnum.PULP:
+            for name, v in values.items():
+                set_initial_values(self.vars[name], v)  # type: ignore
+            self.update_solver(warm_start=True)
+        else:
+            x = np.zeros(self.program.nb_vars)
+            for name, v in values.items():
+                x[self.indices[name]] = v
+            self.update_solver(start=x)
+
+    def cancel(self):
+        """Interrupt `learn` from another thread, with the matrix form only."""
+        if self.backend is not MIPBackendEnum.PULP:
+            self.program.cancel()
+
+    def program_values(self):
+        """Values of the variables of `program`, solved with any backend."""
+        if self.backend is MIPBackendEnum.PULP:
+            x = np.array([v.varValue for v in self.program_vars], dtype=np.float64)
+        elif (x := self.solution.x) is None:
+            raise ValueError("None value")
+        if np.isnan(x).any():
+            raise ValueError("None value")
+        return x
+
+    def objective_value(self) -> float | None:
+        if self.backend is not MIPBackendEnum.PULP:
+            return self.solution.objective
+        if (objective := self.prob.objective) is None:
+            return None
+        return cast(float, value_pulp(objective))
+
+    def solution_time(self) -> float:
+        if self.backend is not MIPBackendEnum.PULP:
+            return self.solution.time
+        return self.prob.solutionCpuTime
+
+    def optimal(self) -> bool:
+        if self.backend is not MIPBackendEnum.PULP:
+            return self.solution.optimal
+        return self.prob.sol_status == 1
+
+    def gap(self) -> float:
+        """Relative MIP gap, infinite if unknown (with PuLP unless optimal)."""
+        if self.backend is not MIPBackendEnum.PULP:
+            return self.solution.gap
+        return 0.0 if self.optimal() else inf
+
+    def infeasible(self) -> bool:
+        if self.backend is not MIPBackendEnum.PULP:
+            return self.solution.infeasible
+        return self.prob.status == LpStatusInfeasible
+
+    def set_cutoff(self, bound: float):
+        """Only search solutions with an objective at least as good as `bound`,
+        before `learn`.
+
+        Gurobi takes it as its cutoff parameter, the other solvers as a
+        constraint on the objective. An infeasible problem then proves that no
+        solution is better than `bound`.
+
+        :param bound:
+        """
+        match self.backend:
+            case MIPBackendEnum.PULP:
+                if (objective := self.prob.objective) is None:
+                    return
+                self.prob.constraints.pop("Cutoff", None)
+                self.prob += (
+                    objective <= bound
+                    if self.prob.sense == LpMinimize
+                    else objective >= bound
+                ), "Cutoff"
+            case MIPBackendEnum.GUROBI:
+                if not self.program.has_objective:
+                    return
+                self.solver_options["cutoff"] = bound
+            case _:
+                if not self.program.has_objective:
+                    return
+                self.program.add_cutoff(bound)
+        self.cutoff = bound
+
     @abstractmethod
     def create_parameters(self): ...
 
@@ -102,5 +271,18 @@ class MIP[T, Vars: MIPVars, Params: MIPParams](Learner[T | None], Dataclass):
     @abstractmethod
     def create_problem(self): ...
 
+    def create_matrix_problem(self):
+        """Create the program in matrix form, if `matrix_form`."""
+        raise NotImplementedError(f"{type(self).__name__} has no matrix form")
+
+    def start_values(self, model: T) -> dict[str, Any]:
+        """Values of the variables given by a model, by name of variables,
+        consistent with the constraints of the problem.
+
+        :param model:
+        :return: arrays with one axis per level of dicts of variables
+        """
+        raise NotImplementedError(f"{type(self).__name__} cannot be warm started")
+
     @abstractmethod
     def create_solution(self): ...
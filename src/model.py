@@ -2,7 +2,7 @@ from abc import abstractmethod
 from collections.abc import Sequence
 from copy import deepcopy
 from dataclasses import dataclass, field
-from enum import Flag
+from enum import Flag, auto
 from typing import Any, ClassVar, Self, SupportsIndex, overload
 
 import numpy as np
@@ -13,6 +13,7 @@ from mcda.relations import PreferenceStructure
 from pandas import Series
 
 from .aggregator import agg_float, agg_rank
+from .case_insensitive_str_enum import CaseInsensitiveStrEnum
 from .dataclass import RandomDataclass, RandomFrozenDataclass
 from .performance_table.type import PerformanceTableType
 from .preference_structure.fitness import fitness_comparisons_ranking
@@ -23,25 +24,50 @@ from .utils import list_replace, tolist
 class ParamFlag(Flag): ...
 
 
+class ExploitationEnum(CaseInsensitiveStrEnum):
+    OUTRANKING = auto()
+    SORT = auto()
+
+
 @dataclass
 class Model(RandomDataclass):
     @abstractmethod
     def rank_numpy(
-        self, performance_table: PerformanceTableType
+        self,
+        performance_table: PerformanceTableType,
+        exploitation: ExploitationEnum = ExploitationEnum.OUTRANKING,
     ) -> npt.NDArray[np.int_]: ...
 
-    def rank_list(self, performance_table: PerformanceTableType):
-        return tolist(self.rank_numpy(performance_table))
+    @classmethod
+    def rank_numpy_batch(
+        cls, models: Sequence[Self], performance_table: PerformanceTableType
+    ) -> npt.NDArray[np.int_]:
+        return np.stack([model.rank_numpy(performance_table) for model in models])
+
+    def rank_list(
+        self,
+        performance_table: PerformanceTableType,
+        exploitation: ExploitationEnum = ExploitationEnum.OUTRANKING,
+    ):
+        return tolist(self.rank_numpy(performance_table, exploitation))
 
-    def rank_series(self, performance_table: PerformanceTableType):
+    def rank_series(
+        self,
+        performance_table: PerformanceTableType,
+        exploitation: ExploitationEnum = ExploitationEnum.OUTRANKING,
+    ):
         return Series(
-            self.rank_list(performance_table),
+            self.rank_list(performance_table, exploitation),
             performance_table.alternatives,  # type: ignore
             dtype=int,
         )
 
-    def rank(self, performance_table: PerformanceTableType) -> Ranking:
-        ranking = self.rank_series(performance_table)
+    def rank(
+        self,
+        performance_table: PerformanceTableType,
+        exploitation: ExploitationEnum = ExploitationEnum.OUTRANKING,
+    ) -> Ranking:
+        ranking = self.rank_series(performance_table, exploitation)
         return CommensurableValues(
             ranking,
             scale=DiscreteQuantitativeScale(
@@ -50,6 +76,9 @@ class Model(RandomDataclass):
             ),
         )
 
+    def incremental_ranking(self, performance_table: PerformanceTableType) -> Any:
+        raise TypeError(f"{self.__class__.__name__} has no incremental ranking")
+
     def fitness(
         self, performance_table: PerformanceTableType, comparisons: PreferenceStructure
     ):
@@ -75,8 +104,14 @@ class FrozenModel[M: Model](RandomFrozenDataclass):
 class AggModel(Model):
     models: list[Model]
 
-    def rank_numpy(self, performance_table: PerformanceTableType):
-        return agg_rank(model.rank_numpy(performance_table) for model in self.models)
+    def rank_numpy(
+        self,
+        performance_table: PerformanceTableType,
+        exploitation: ExploitationEnum = ExploitationEnum.OUTRANKING,
+    ):
+        return agg_rank(
+            model.rank_numpy(performance_table, exploitation) for model in self.models
+        )
 
 
 @dataclass
@@ -109,8 +144,12 @@ class GroupModel[M: Model](Model, Sequence[M]):
     def __len__(self):
         return self.group_size
 
-    def rank_numpy(self, performance_table: PerformanceTableType):
-        return self.collective_model.rank_numpy(performance_table)
+    def rank_numpy(
+        self,
+        performance_table: PerformanceTableType,
+        exploitation: ExploitationEnum = ExploitationEnum.OUTRANKING,
+    ):
+        return self.collective_model.rank_numpy(performance_table, exploitation)
 
     def fitness(
         self,
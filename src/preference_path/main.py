@@ -6,6 +6,7 @@ from src.constants import DEFAULT_MAX_TIME
 from src.model import FrozenModel, Model
 from src.performance_table.type import PerformanceTableType
 from src.preference_structure.fitness import (
+    CompiledComparisons,
     fitness_comparisons_ranking,
 )
 from src.random import RNGParam
@@ -42,9 +43,14 @@ def compute_model_paths(
 
     neighborhood = NeighborhoodCombined(neighborhoods, rng)
 
+    compiled_preferences = CompiledComparisons(
+        target_preferences,
+        alternatives.alternatives,  # type: ignore
+    )
+
     def heuristic(model: FrozenSRMPModel):
         return 1 - fitness_comparisons_ranking(
-            target_preferences, model.model.rank_series(alternatives)
+            compiled_preferences, model.array.rank_numpy(alternatives)
         )
 
     gbfs = GBFS(neighborhood, heuristic, max_time)
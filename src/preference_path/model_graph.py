@@ -3,12 +3,17 @@ from collections import defaultdict, deque
 from typing import NamedTuple
 
 from mcda.relations import PreferenceStructure
+from pandas import Series
 
 from src.dataclass import Dataclass, dataclass
 from src.model import FrozenModel, Model
 from src.performance_table.type import PerformanceTableType
-from src.preference_structure.fitness import fitness_comparisons_ranking
+from src.preference_structure.fitness import (
+    CompiledComparisons,
+    fitness_comparisons_ranking,
+)
 from src.preference_structure.utils import RankingSeries
+from src.utils import tolist
 
 from .neighborhood import Neighborhood
 
@@ -38,22 +43,40 @@ class ModelGraph[S: FrozenModel[Model]](Dataclass):
         distances: dict[S, int] = {source: 0}
         dm_models: defaultdict[int, list[S]] = defaultdict(list)
         distances_max: list[float] = [math.inf] * len(targets)
+        compiled_targets = [
+            CompiledComparisons(target, alternatives.alternatives)  # type: ignore
+            for target in targets
+        ]
 
         while Q:
             v = Q.popleft()
-            for dm, target in enumerate(targets):
-                if (fitness_comparisons_ranking(target, rankings[v]) == 1) and (
+            ranks = rankings[v].to_numpy()
+            for dm, target in enumerate(compiled_targets):
+                if (fitness_comparisons_ranking(target, ranks) == 1) and (
                     distances[v] <= distances_max[dm]
                 ):
                     dm_models[dm].append(v)
                     distances_max[dm] = distances[v]
 
             if distances[v] < max(distances_max):
-                for w in self.neighborhood(v):
-                    if w not in rankings:
-                        rankings[w] = w.model.rank_series(alternatives)
+                neighbors = self.neighborhood(v)
+                new_neighbors = list(
+                    dict.fromkeys(w for w in neighbors if w not in rankings)
+                )
+                if new_neighbors:
+                    models = [w.model for w in new_neighbors]
+                    for w, ranking in zip(
+                        new_neighbors,
+                        type(models[0]).rank_numpy_batch(models, alternatives),
+                    ):
+                        rankings[w] = Series(
+                            tolist(ranking),
+                            alternatives.alternatives,  # type: ignore
+                            dtype=int,
+                        )
                         distances[w] = distances[v] + 1
                         Q.append(w)
+                for w in neighbors:
                     if distances[w] == distances[v] + 1:
                         parents[w].append(v)
 
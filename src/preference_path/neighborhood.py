@@ -10,7 +10,7 @@ from pandas import Series
 
 from src.dataclass import Dataclass, dataclass, field, replace
 from src.performance_table.type import PerformanceTableType
-from src.preference_structure.fitness import comparisons_ranking
+from src.preference_structure.fitness import CompiledComparisons
 from src.random import RNGParam, rng_
 from src.rmp.permutation import adjacent_swap
 from src.sa.neighbor import weights_local_change
@@ -46,27 +46,25 @@ class NeighborhoodProfile(Neighborhood[FrozenSRMPModel], Dataclass):
     midpoints: PerformanceTableType = field(init=False)
     alternatives: PerformanceTableType
     target_preferences: PreferenceStructure
+    comparisons: CompiledComparisons = field(init=False)
+    values: npt.NDArray[np.float64] = field(init=False)
 
     def __post_init__(self):
         self.midpoints = midpoints(self.alternatives)
+        self.comparisons = CompiledComparisons(
+            self.target_preferences,
+            self.alternatives.alternatives,  # type: ignore
+        )
+        self.values = self.alternatives.data.to_numpy()
 
     def __call__(self, sol: FrozenSRMPModel):
         result: list[FrozenSRMPModel] = []
 
-        relevant_values = np.sort(
-            cast(
-                npt.NDArray[np.float64],
-                self.alternatives.subtable(
-                    PreferenceStructure(
-                        comparisons_ranking(
-                            self.target_preferences,
-                            sol.model.rank_series(self.alternatives).to_dict(),
-                        )
-                    ).elements
-                ).data.to_numpy(),
-            ),
-            0,
+        violated = self.comparisons.violated(sol.array.rank_numpy(self.alternatives))
+        relevant = np.union1d(
+            self.comparisons.a[violated], self.comparisons.b[violated]
         )
+        relevant_values = np.sort(self.values[relevant], 0)
         # if any(
         #     np.any(
         #         np.equal.outer(
@@ -1,4 +1,4 @@
-from collections.abc import Mapping
+from collections.abc import Mapping, Sequence
 from typing import Any
 
 import numpy as np
@@ -9,6 +9,99 @@ from mcda.relations import I, P, PreferenceStructure
 
 from .utils import OutrankingMatrixClass, RankingSeries, outranking_numpy
 
+PREFERENCE = 0
+INDIFFERENCE = 1
+
+type RankingNumpy = npt.NDArray[np.int_]
+
+
+class CompiledComparisons:
+    """This class stores a preference structure as an array of comparisons.
+
+    Each row holds the indices of the compared alternatives in `alternatives`
+    and the relation type (:data:`PREFERENCE` or :data:`INDIFFERENCE`).
+    Other relations are never violated and only count in the length.
+
+    :param C:
+    :param alternatives: alternatives labels, in the order of the rankings
+    """
+
+    def __init__(self, C: PreferenceStructure, alternatives: Sequence[Any]):
+        index = {a: i for i, a in enumerate(alternatives)}
+        self.alternatives = list(alternatives)
+        self.data = np.array(
+            [
+                (
+                    index[r.a],
+                    index[r.b],
+                    PREFERENCE if isinstance(r, P) else INDIFFERENCE,
+                )
+                for r in C
+                if isinstance(r, P | I)
+            ],
+            dtype=np.int_,
+        ).reshape(-1, 3)
+        self.size = len(C)
+
+    def __len__(self):
+        return self.size
+
+    @property
+    def a(self):
+        return self.data[:, 0]
+
+    @property
+    def b(self):
+        return self.data[:, 1]
+
+    @property
+    def indifference(self):
+        return self.data[:, 2] == INDIFFERENCE
+
+    def ranks(self, R: RankingSeries | RankingNumpy) -> RankingNumpy:
+        if isinstance(R, np.ndarray):
+            return R
+        return R[self.alternatives].to_numpy()
+
+    def violated(self, R: RankingNumpy) -> npt.NDArray[np.bool]:
+        Ra, Rb = R[self.a], R[self.b]
+        return np.where(self.indifference, Ra != Rb, Ra >= Rb)
+
+    def nb_violated(self, R: RankingNumpy) -> int:
+        return int(np.count_nonzero(self.violated(R)))
+
+
+class StackedComparisons(CompiledComparisons):
+    """This class stacks several arrays of comparisons to evaluate them in a
+    single pass, keeping the group of each comparison.
+
+    :param groups: comparisons of each group, on the same alternatives
+    """
+
+    def __init__(self, groups: Sequence[CompiledComparisons]):
+        self.alternatives = groups[0].alternatives if groups else []
+        self.data = np.concatenate(
+            [C.data for C in groups] + [np.empty((0, 3), dtype=np.int_)]
+        )
+        self.group = np.repeat(np.arange(len(groups)), [len(C.data) for C in groups])
+        self.sizes = np.array([len(C) for C in groups], dtype=np.int_)
+        self.size = int(self.sizes.sum())
+
+    @property
+    def nb_groups(self):
+        return len(self.sizes)
+
+    def group_counts(self, violated: npt.NDArray[Any]) -> npt.NDArray[np.int_]:
+        """Count violated comparisons per group.
+
+        :param violated: mask or indices of the violated comparisons
+        :return:
+        """
+        return np.bincount(self.group[violated], minlength=self.nb_groups)
+
+    def nb_violated_groups(self, R: RankingNumpy) -> npt.NDArray[np.int_]:
+        return self.group_counts(self.violated(R))
+
 
 def comparisons_ranking(C: PreferenceStructure, R: Mapping[Any, int | float]):
     result: list[Relation] = []
@@ -46,8 +139,13 @@ def fitness_comparisons(Co: PreferenceStructure, Ce: PreferenceStructure):
     return sum(r in Ce for r in Co) / len(Co)
 
 
-def fitness_comparisons_ranking(Co: PreferenceStructure, Re: RankingSeries):
-    Re_dict = Re.to_dict()
+def fitness_comparisons_ranking(
+    Co: PreferenceStructure | CompiledComparisons, Re: RankingSeries | RankingNumpy
+):
+    if isinstance(Co, CompiledComparisons):
+        return 1 - (Co.nb_violated(Co.ranks(Re)) / len(Co))
+
+    Re_dict = Re.to_dict()  # type: ignore
 
     return 1 - (len(comparisons_ranking(Co, Re_dict)) / len(Co))
 
@@ -56,9 +154,15 @@ def fitness_comparisons_outranking(Co: PreferenceStructure, Oe: OutrankingMatrix
     return 1 - (len(comparisons_outranking(Co, Oe)) / len(Co))
 
 
-def fitness_ranking_comparisons(Ro: RankingSeries, Ce: PreferenceStructure):
+def fitness_ranking_comparisons(
+    Ro: RankingSeries | RankingNumpy, Ce: PreferenceStructure | CompiledComparisons
+):
     n = len(Ro)
-    Ro_dict = Ro.to_dict()
+
+    if isinstance(Ce, CompiledComparisons):
+        return 1 - (Ce.nb_violated(Ce.ranks(Ro)) / (n * (n - 1) / 2))
+
+    Ro_dict = Ro.to_dict()  # type: ignore
 
     return 1 - (len(comparisons_ranking(Ce, Ro_dict)) / (n * (n - 1) / 2))
 
@@ -87,10 +191,14 @@ def fitness_outranking(
 
 
 def fitness(
-    o: PreferenceStructure | OutrankingMatrix | RankingSeries,
-    e: PreferenceStructure | OutrankingMatrix | RankingSeries,
+    o: PreferenceStructure | CompiledComparisons | OutrankingMatrix | RankingSeries,
+    e: PreferenceStructure | CompiledComparisons | OutrankingMatrix | RankingSeries,
 ):
-    if isinstance(o, PreferenceStructure):
+    if isinstance(o, CompiledComparisons):
+        return fitness_comparisons_ranking(o, e)  # type: ignore
+    elif isinstance(e, CompiledComparisons):
+        return fitness_ranking_comparisons(o, e)  # type: ignore
+    elif isinstance(o, PreferenceStructure):
         if isinstance(e, PreferenceStructure):
             return fitness_comparisons(o, e)
         elif isinstance(e, OutrankingMatrixClass):
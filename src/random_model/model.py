@@ -3,7 +3,7 @@ from dataclasses import dataclass
 import numpy as np
 
 from src.dataclass import RandomDataclass
-from src.model import Group, Model
+from src.model import ExploitationEnum, Group, Model
 from src.performance_table.type import PerformanceTableType
 from src.preference_structure.generate import random_preference_relation
 from src.random import SeedMixin
@@ -13,7 +13,11 @@ from .field import SeedField
 
 @dataclass
 class RandomModel(Model, RandomDataclass, SeedField, SeedMixin):
-    def rank_numpy(self, performance_table: PerformanceTableType):
+    def rank_numpy(
+        self,
+        performance_table: PerformanceTableType,
+        exploitation: ExploitationEnum = ExploitationEnum.OUTRANKING,
+    ):
         return (
             random_preference_relation(performance_table, self.rng())
             .ranking.data.to_numpy()
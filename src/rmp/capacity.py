@@ -5,13 +5,21 @@ from more_itertools import powerset
 
 from src.julia.function import generate_linext
 from src.random import RNGParam, int_, rng_
-from src.utils import tolist
+from src.sample_bank.bank import SampleEnum, draw_sample
+from src.utils import int_to_ind_set, tolist
 
 type Capacity[T: float] = dict[frozenset[Any], T]
 
 
+def random_linext(nb_crit: int, rng: RNGParam = None) -> list[list[int]]:
+    masks = draw_sample(SampleEnum.LINEXT, nb_crit, rng)
+    if masks is not None:
+        return [int_to_ind_set(int(mask)) for mask in masks]
+    return generate_linext(nb_crit, int_(rng))
+
+
 def random_capacity(nb_crit: int, rng: RNGParam = None) -> Capacity[float]:
-    linext = generate_linext(nb_crit, int_(rng))
+    linext = random_linext(nb_crit, rng)
 
     crits = np.arange(nb_crit)
     return dict(
@@ -27,7 +35,7 @@ def balanced_capacity(nb_crit: int) -> Capacity[float]:
 
 
 def random_capacity_int(nb_crit: int, rng: RNGParam = None) -> Capacity[int]:
-    linext = generate_linext(nb_crit, int_(rng))
+    linext = random_linext(nb_crit, rng)
 
     crits = np.arange(nb_crit)
     return dict(
@@ -1,41 +1,138 @@
+from collections.abc import Iterable, Sequence
+from functools import cache
+from typing import Any, Self
+
 import numpy as np
+import numpy.typing as npt
 
 from src.julia.function import generate_weak_order_ext
 from src.random import RNGParam, int_
-from src.utils import tolist
+from src.sample_bank.bank import SampleEnum, draw_sample
+from src.utils import int_to_ind_set, tolist
 from src.weak_order import WeakOrder
 
 
+def coalition_mask(coalition: Iterable[int]) -> int:
+    return sum(1 << c for c in coalition)
+
+
+def coalition_codes(concordances: npt.NDArray[np.bool]) -> npt.NDArray[np.int_]:
+    """Encode coalitions of criteria as bitmasks.
+
+    :param concordances: array of shape (..., m), ``True`` for criteria in the
+        coalition
+    :return: array of shape (...)
+    """
+    return concordances @ (1 << np.arange(concordances.shape[-1]))
+
+
+@cache
+def coalition_lattices(nb_crit: int):
+    """Compute the strict subsets and supersets of every coalition.
+
+    :param nb_crit:
+    :return: lists of bitmasks arrays indexed by coalition bitmask
+    """
+    masks = np.arange(1 << nb_crit)
+    subsets: list[npt.NDArray[np.int_]] = []
+    supersets: list[npt.NDArray[np.int_]] = []
+    for mask in masks:
+        subsets.append(masks[((masks & mask) == masks) & (masks != mask)])
+        supersets.append(masks[((masks & mask) == mask) & (masks != mask)])
+    return subsets, supersets
+
+
 class ImportanceRelation(WeakOrder[frozenset[int]]):
-    @classmethod
-    def random(cls, nb_crit: int, rng: RNGParam = None):
-        weak_order_ext = generate_weak_order_ext(nb_crit, int_(rng))
+    """This class implements an importance relation over coalitions of criteria.
+
+    Scores are stored in an array indexed by coalition bitmask.
 
-        labels = np.arange(nb_crit)
-        dct: dict[frozenset[int], int] = {}
+    :param scores:
+    :param labels: coalitions of the scores
+    """
+
+    def __init__(
+        self,
+        scores: Sequence[int] | None = None,
+        labels: list[frozenset[int]] | None = None,
+    ) -> None:
+        self.scores = np.zeros(len(labels) if labels else 1, dtype=np.int_)
+        if scores and labels:
+            for coalition, score in zip(labels, scores):
+                self.scores[coalition_mask(coalition)] = score
+
+    @classmethod
+    def from_numpy(cls, scores: npt.NDArray[np.int_]) -> Self:
+        importance_relation = cls()
+        importance_relation.scores = np.array(scores, dtype=np.int_)
+        return importance_relation
 
+    @classmethod
+    def from_weak_order_ext(
+        cls, nb_crit: int, weak_order_ext: list[list[list[int]]]
+    ) -> Self:
+        scores = np.zeros(1 << nb_crit, dtype=np.int_)
         for i, block in enumerate(weak_order_ext):
             for subset in block:
-                dct[frozenset(tolist(labels[subset]))] = i
+                scores[coalition_mask(tolist(np.arange(nb_crit)[subset]))] = i
+
+        return cls.from_numpy(scores)
+
+    @classmethod
+    def random(cls, nb_crit: int, rng: RNGParam = None):
+        scores = draw_sample(SampleEnum.WEAK_ORDER_EXT, nb_crit, rng)
+        if scores is not None:
+            return cls.from_numpy(scores)
+        return cls.from_weak_order_ext(
+            nb_crit, generate_weak_order_ext(nb_crit, int_(rng))
+        )
+
+    @property
+    def nb_crit(self):
+        return len(self.scores).bit_length() - 1
+
+    @property
+    def dict(self):
+        return dict(self.items())
+
+    def __getitem__(self, key: frozenset[int]):
+        return int(self.scores[coalition_mask(key)])
+
+    def __setitem__(self, key: frozenset[int], value: int):
+        self.scores[coalition_mask(key)] = value
+
+    def __delitem__(self, key: frozenset[int]):
+        raise TypeError("Coalitions cannot be removed from an importance relation")
+
+    def __iter__(self):
+        return (frozenset(int_to_ind_set(mask)) for mask in range(len(self.scores)))
+
+    def __len__(self):
+        return len(self.scores)
+
+    def __eq__(self, other: Any):
+        if isinstance(other, ImportanceRelation):
+            return np.array_equal(self.scores, other.scores)
+        return super().__eq__(other)
+
+    def to_numpy(self):
+        """Return the scores indexed by coalition bitmask."""
+        return self.scores.copy()
+
+    def max_mask(self, mask: int) -> int:
+        supersets = coalition_lattices(self.nb_crit)[1][mask]
+        if len(supersets):
+            return int(self.scores[supersets].min())
+        return int(min(np.delete(self.scores, mask).max() + 1, len(self) - 1))
 
-        we = cls()
-        we.dict = dct
-        return we
+    def min_mask(self, mask: int) -> int:
+        subsets = coalition_lattices(self.nb_crit)[0][mask]
+        if len(subsets):
+            return int(self.scores[subsets].max())
+        return int(max(np.delete(self.scores, mask).min() - 1, 0))
 
     def max(self, key: frozenset[int]):
-        try:
-            return min(v for k, v in self.items() if key < k)
-        except ValueError:
-            return min(
-                max({k: v for k, v in self.items() if k != key}.values()) + 1,
-                len(self) - 1,
-            )
+        return self.max_mask(coalition_mask(key))
 
     def min(self, key: frozenset[int]):
-        try:
-            return max(v for k, v in self.items() if k < key)
-        except ValueError:
-            return max(
-                min({k: v for k, v in self.items() if k != key}.values()) - 1,
-                0,
-            )
+        return self.min_mask(coalition_mask(key))
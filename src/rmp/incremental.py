@@ -0,0 +1,119 @@
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+import numpy.typing as npt
+
+from src.performance_table.normal_performance_table import NormalPerformanceTable
+from src.utils import lexicographic_compare, lexicographic_rank
+
+from .importance_relation import coalition_codes
+
+if TYPE_CHECKING:
+    from .model import RMPModel
+
+
+class IncrementalRanking[M](ABC):
+    """This class ranks alternatives with a profile-based model and updates
+    the ranking incrementally when the model changes.
+
+    For each profile, each alternative is described by the coalition of
+    criteria on which it is at least as good as the profile (as a bitmask),
+    and its score is read from the coalitions scores.
+    When a profile moves, only the alternatives whose coalition changes are
+    updated, and a new lexicographic order only reorders the scores.
+
+    :param performance_table:
+    :param model:
+    """
+
+    table: npt.NDArray[Any]
+
+    def __init__(self, performance_table: NormalPerformanceTable, model: M):
+        self.values = performance_table.data.to_numpy()
+        self.reset(model)
+
+    @staticmethod
+    def model_profiles(model: M) -> npt.NDArray[np.float64]:
+        profiles = model.profiles  # type: ignore
+        if isinstance(profiles, np.ndarray):
+            return profiles  # type: ignore
+        return profiles.data.to_numpy(copy=True)
+
+    @abstractmethod
+    def update_table(self, model: M, force: bool = False) -> bool:
+        """Update the coalitions scores (indexed by bitmask) with the model.
+
+        :param model:
+        :param force: if ``True`` the scores are always recomputed
+        :return: ``True`` if the scores changed
+        """
+
+    def reset(self, model: M):
+        """Compute the ranking from scratch.
+
+        :param model:
+        """
+        self.profiles = self.model_profiles(model)
+        self.lexicographic_order = np.array(model.lexicographic_order)  # type: ignore
+        self.masks = coalition_codes(self.values >= self.profiles[:, None, :])
+        self.update_table(model, True)
+        self.scores = self.table[self.masks]
+
+    def update(self, model: M) -> npt.NDArray[np.bool] | None:
+        """Update the ranking with a new model.
+
+        :param model:
+        :return:
+            alternatives whose scores changed,
+            ``None`` if every comparison between alternatives may have changed
+        """
+        changed = np.zeros(len(self.values), dtype=np.bool)
+
+        profiles = self.model_profiles(model)
+        for h, j in zip(*np.nonzero(profiles != self.profiles)):
+            low, high = sorted((self.profiles[h, j], profiles[h, j]))
+            flipped = (self.values[:, j] >= low) & (self.values[:, j] < high)
+            self.masks[h, flipped] ^= 1 << j
+            changed |= flipped
+        self.profiles = profiles
+
+        lexicographic_order = np.array(model.lexicographic_order)  # type: ignore
+        reordered = not np.array_equal(lexicographic_order, self.lexicographic_order)
+        self.lexicographic_order = lexicographic_order
+
+        if self.update_table(model):
+            self.scores = self.table[self.masks]
+            return None
+
+        self.scores[:, changed] = self.table[self.masks[:, changed]]
+        return None if reordered else changed
+
+    @property
+    def keys(self):
+        """Scores of the alternatives in lexicographic order."""
+        return self.scores[self.lexicographic_order]
+
+    def rank_numpy(self):
+        return lexicographic_rank(self.keys)
+
+    def compare(self, a: npt.NDArray[np.int_], b: npt.NDArray[np.int_]):
+        """Compare pairs of alternatives.
+
+        :param a: indices of the first alternatives
+        :param b: indices of the second alternatives
+        :return: ``1`` if `a` is ranked before `b`, ``-1`` if after, ``0`` if tied
+        """
+        return lexicographic_compare(self.keys, a, b)
+
+
+class IncrementalRMP(IncrementalRanking["RMPModel"]):
+    def update_table(self, model: "RMPModel", force: bool = False):
+        if not force and (
+            model.importance_relation is self.importance_relation
+            or model.importance_relation == self.importance_relation
+        ):
+            return False
+        self.importance_relation = model.importance_relation
+        self.table = self.importance_relation.to_numpy()
+        return True
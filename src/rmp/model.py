@@ -2,7 +2,7 @@ from dataclasses import dataclass
 from enum import auto
 from typing import Self, SupportsIndex
 
-from src.model import GroupModel, Model, ParamFlag
+from src.model import ExploitationEnum, GroupModel, Model, ParamFlag
 from src.performance_table.normal_performance_table import NormalPerformanceTable
 from src.performance_table.type import PerformanceTableType
 from src.random import RNGParam
@@ -16,6 +16,7 @@ from .field import (
     LexicographicOrderField,
     ProfilesField,
 )
+from .incremental import IncrementalRMP
 from .perturbations import PerturbImportanceRelation, PerturbLexOrder, PerturbProfile
 from .rmp import NormalRMP
 
@@ -41,14 +42,24 @@ class RMPModel(
             + self.lexicographic_order.__str__()
         )
 
-    def rank_numpy(self, performance_table: PerformanceTableType):
+    def rank_numpy(
+        self,
+        performance_table: PerformanceTableType,
+        exploitation: ExploitationEnum = ExploitationEnum.OUTRANKING,
+    ):
         if isinstance(performance_table, NormalPerformanceTable):
             return NormalRMP(
                 performance_table,
                 self.importance_relation,
                 self.profiles,
                 self.lexicographic_order,
-            ).rank_numpy()
+            ).rank_numpy(exploitation)
+        else:
+            raise TypeError("Performance table not normalized")
+
+    def incremental_ranking(self, performance_table: PerformanceTableType):
+        if isinstance(performance_table, NormalPerformanceTable):
+            return IncrementalRMP(performance_table, self)
         else:
             raise TypeError("Performance table not normalized")
 
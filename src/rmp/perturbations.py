@@ -38,16 +38,15 @@ class PerturbImportanceRelation(Dataclass):
         importance_relation = deepcopy(importance_relation)
 
         for _ in range(self.nb):
-            keys = list(importance_relation)
             min_score = max_score = 0
 
-            coalition: frozenset[int] = frozenset()
+            coalition = 0
             while min_score >= max_score:
-                coalition = keys[rng.choice(len(importance_relation))]
-                min_score = importance_relation.min(coalition)
-                max_score = importance_relation.max(coalition)
+                coalition = rng.choice(len(importance_relation))
+                min_score = importance_relation.min_mask(coalition)
+                max_score = importance_relation.max_mask(coalition)
 
-            score = importance_relation[coalition]
+            score = importance_relation.scores[coalition]
             available_score: list[int] = []
             if score > min_score:
                 available_score.append(score - 1)
@@ -55,7 +54,7 @@ class PerturbImportanceRelation(Dataclass):
                 available_score.append(score + 1)
 
             score = rng.choice(available_score)
-            importance_relation[coalition] = score
+            importance_relation.scores[coalition] = score
 
         return importance_relation
 
@@ -11,6 +11,7 @@ from collections.abc import Sequence
 from typing import Any
 
 import numpy as np
+import numpy.typing as npt
 from mcda import PerformanceTable
 from mcda.internal.core.interfaces import Ranker
 from mcda.internal.core.matrices import OutrankingMatrix
@@ -33,11 +34,12 @@ from mcda.values import CommensurableValues, Values
 from pandas import DataFrame, Index, Series, concat
 from scipy.stats import rankdata  # type: ignore
 
+from src.model import ExploitationEnum
 from src.performance_table.normal_performance_table import NormalPerformanceTable
 from src.performance_table.type import PerformanceTableType
-from src.utils import tolist
+from src.utils import lexicographic_rank, tolist
 
-from .importance_relation import ImportanceRelation
+from .importance_relation import ImportanceRelation, coalition_codes
 
 
 class ProfileWiseOutranking(Ranker):
@@ -118,17 +120,23 @@ class NormalProfileWiseOutranking(ProfileWiseOutranking):
         self.importance_relation = importance_relation
         self.profile = profile
 
+    def scores(self) -> npt.NDArray[np.int_]:
+        """Compute the importance score of each alternative.
+
+        :return:
+        """
+        codes = coalition_codes(
+            self.performance_table.data.values >= self.profile.data.values
+        )
+
+        return self.importance_relation.scores[codes]
+
     def rank(self, **kwargs: Any):  # type: ignore
         """Construct an outranking matrix.
 
         :return:
         """
-        comp_df = self.performance_table.data >= self.profile.data
-
-        scores = np.array([
-            self.importance_relation[frozenset(np.nonzero(a)[0].tolist())]
-            for a in comp_df.values
-        ])
+        scores = self.scores()
 
         return np.greater_equal.outer(scores, scores).astype(dtype=np.bool)
 
@@ -580,12 +588,19 @@ class NormalRMP(RMP):
             for profile in self.profiles.alternatives
         ]
 
-    def rank_numpy(self, **kwargs: Any):
+    def rank_numpy(
+        self,
+        exploitation: ExploitationEnum = ExploitationEnum.OUTRANKING,
+        **kwargs: Any,
+    ):
         """Compute the RMP algorithm
 
+        :param exploitation: exploitation method of the profile-wise relations
         :return:
             the outranking total order as a ranking
         """
+        if exploitation is ExploitationEnum.SORT:
+            return self.rank_numpy_sort()
         profilewise_outranking_matrices = np.array([
             sub_rmp.rank() for sub_rmp in self.sub_rmp
         ])
@@ -596,3 +611,15 @@ class NormalRMP(RMP):
         outranking_matrix = score - score.transpose() >= 0
         scores = outranking_matrix.sum(1)
         return rankdata(-scores, method="dense").astype(np.int_)
+
+    def rank_numpy_sort(self, **kwargs: Any):
+        """Compute the RMP algorithm by sorting alternatives lexicographically
+        according to their importance scores.
+
+        Equivalent to :meth:`rank_numpy` with O(k.n) memory.
+
+        :return:
+            the outranking total order as a ranking
+        """
+        scores = np.array([sub_rmp.scores() for sub_rmp in self.sub_rmp])
+        return lexicographic_rank(scores[self.lexicographic_order])
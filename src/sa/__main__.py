@@ -1,5 +1,6 @@
 import csv
 from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
 from operator import attrgetter
 
 from mcda.relations import PreferenceStructure
@@ -11,7 +12,10 @@ from src.random import rng_
 
 from ..utils import catchtime, file_or_stdout
 from .args import ARGS
+from .cancellation import cancellation_token
+from .island import migration_area
 from .main import create_sa, sa_result
+from .trace import TraceConfig
 
 # Import data
 A = NormalPerformanceTable(read_csv(ARGS.A, header=None))
@@ -68,14 +72,56 @@ sas, sense = create_sa(
     Accepted,
     Refused,
     Past,
+    rng_init,
     rng_sa,
     ARGS.nb_cpus,
+    incremental=ARGS.incremental,
+    backend=ARGS.backend,
+    array_model=ARGS.array_model,
+    replica_exchange=ARGS.replica_exchange,
+    exchange_interval=ARGS.exchange_interval,
+    ladder_ratio=ARGS.ladder_ratio,
+    islands=ARGS.islands,
+    migration_interval=ARGS.migration_interval,
+    migration_rate=ARGS.migration_rate,
+    trace=(
+        TraceConfig(ARGS.trace, ARGS.trace_every, ARGS.trace_on_improvement)
+        if ARGS.trace
+        else None
+    ),
+    t0_method=ARGS.T0_method,
+    t0_walkers=ARGS.T0_walkers,
+    adaptive_neighbor=ARGS.adaptive_neighbor,
+    schedule=ARGS.schedule,
+    beta=ARGS.beta,
+    L_max=ARGS.L_max,
+    reheat=ARGS.reheat,
+    reheat_ratio=ARGS.reheat_ratio,
+    cache_size=ARGS.cache_size,
+    clock=ARGS.clock,
+    check_interval=ARGS.check_interval,
 )
 
-with catchtime() as time, ProcessPoolExecutor(ARGS.nb_cpus) as process_pool:
-    results = list(process_pool.map(sa_result, sas))
+if ARGS.replica_exchange:
+    # Replicas run in their own processes
+    with (
+        catchtime() as time,
+        cancellation_token(
+            [replica for sa in sas for replica in sa.replicas],  # type: ignore
+            ARGS.deadline,
+        ),
+    ):
+        results = [sa_result(sa) for sa in sas]
+else:
+    with (
+        catchtime() as time,
+        migration_area(sas) if ARGS.islands else nullcontext(),  # type: ignore
+        cancellation_token(sas, ARGS.deadline),
+        ProcessPoolExecutor(ARGS.nb_cpus) as process_pool,
+    ):
+        results = list(process_pool.map(sa_result, sas))
 
-best_model, best_objective, _, it = sense.value(
+best_model, best_objective, _, it, _ = sense.value(
     results, key=attrgetter("best_objective")
 )
 
@@ -86,4 +132,17 @@ with file_or_stdout(ARGS.output, "w") as f:
 # Write results
 with file_or_stdout(ARGS.result, "w", "") as f:
     writer = csv.writer(f, "unix")
+    if (
+        ARGS.replica_exchange
+        or ARGS.islands
+        or ARGS.adaptive_neighbor
+        or ARGS.cache_size
+    ):
+        for result in results:
+            assert result.stats
+            writer.writerow(
+                list(result.stats.values())
+                + [result.best_objective, result.time, result.it]
+            )
+    # Last row read by tuning/target-runner
     writer.writerow([best_objective, time(), it])
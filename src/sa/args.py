@@ -4,6 +4,10 @@ from pathlib import Path
 
 from src.constants import DEFAULT_MAX_TIME
 from src.models import ModelEnum
+from src.sa.cancellation import ClockEnum
+from src.sa.cooling_schedule import CoolingScheduleEnum
+from src.sa.initial_temperature import InitialTemperatureEnum
+from src.sa.objective import ObjectiveBackendEnum
 
 from ..dataclass import Dataclass
 
@@ -21,11 +25,47 @@ init_group.add_argument(
     "--accept", type=float, help="Acceptance rate to determine initial temperature"
 )
 
+parser.add_argument(
+    "--T0-method",
+    type=InitialTemperatureEnum,
+    choices=InitialTemperatureEnum,
+    default=InitialTemperatureEnum.MEAN,
+    help="Initial temperature estimator",
+)
+parser.add_argument(
+    "--T0-walkers",
+    default=1,
+    type=int,
+    help="Number of parallel random walks to estimate the initial temperature",
+)
+
 parser.add_argument("--alpha", type=float, required=True, help="Cooling coefficient")
 parser.add_argument(
     "--amp", type=float, help="Weight neighborhood amplitude", default=2
 )
 parser.add_argument("--L", default=1, type=int, help="Length of Markov chains")
+parser.add_argument(
+    "--schedule",
+    type=CoolingScheduleEnum,
+    choices=CoolingScheduleEnum,
+    default=CoolingScheduleEnum.GEOMETRIC,
+    help="Cooling schedule",
+)
+parser.add_argument(
+    "--beta", type=float, default=0.001, help="Lundy-Mees cooling coefficient"
+)
+parser.add_argument(
+    "--L-max", type=int, help="Max length of Markov chains as acceptance drops"
+)
+parser.add_argument(
+    "--reheat", type=int, help="Number of non improving iterations before reheating"
+)
+parser.add_argument(
+    "--reheat-ratio",
+    type=float,
+    default=0.5,
+    help="Reheating temperature relatively to the initial temperature",
+)
 
 stop_group = parser.add_mutually_exclusive_group(required=True)
 stop_group.add_argument("--Tf", type=float, help="Final temperature")
@@ -37,6 +77,23 @@ stop_group.add_argument(
     "--max-it-non-improving", type=int, help="Max number of non improving iterations"
 )
 
+parser.add_argument(
+    "--clock",
+    type=ClockEnum,
+    choices=ClockEnum,
+    default=ClockEnum.CPU,
+    help="Clock of the time limit of each chain",
+)
+parser.add_argument(
+    "--deadline", type=int, help="Wall-clock time limit of all chains (in seconds)"
+)
+parser.add_argument(
+    "--check-interval",
+    default=100,
+    type=int,
+    help="Number of iterations between checks of the cancellation of chains",
+)
+
 parser.add_argument("-s", "--seed", type=int, help="Random seed")
 parser.add_argument("--seed-init", type=int, help="Initial model random seed")
 parser.add_argument("--seed-sa", type=int, help="Simulated annealing random seed")
@@ -51,6 +108,79 @@ parser.add_argument("--refused", type=Path, help="Refused preferences")
 parser.add_argument("--accepted", type=Path, help="Accepted preferences")
 parser.add_argument("--past", nargs="+", type=Path, help="Past refused preferences")
 parser.add_argument("--nb-cpus", default=1, type=int, help="Number of CPUs")
+parser.add_argument(
+    "--incremental",
+    action="store_true",
+    help="Evaluate neighbors incrementally from the previous solution",
+)
+parser.add_argument(
+    "--backend",
+    type=ObjectiveBackendEnum,
+    choices=ObjectiveBackendEnum,
+    default=ObjectiveBackendEnum.NUMPY,
+    help="Objective backend",
+)
+parser.add_argument(
+    "--array-model",
+    action="store_true",
+    help="Represent SRMP models as arrays during the search",
+)
+parser.add_argument(
+    "--cache-size", type=int, help="Max number of cached objective values"
+)
+parser.add_argument(
+    "--adaptive-neighbor",
+    action="store_true",
+    help="Select neighborhood operators by adaptive pursuit",
+)
+parser.add_argument("--trace", type=Path, help="Binary trace file")
+parser.add_argument(
+    "--trace-every",
+    default=1,
+    type=int,
+    help="Record one iteration out of N in the trace",
+)
+parser.add_argument(
+    "--trace-on-improvement",
+    action=argparse.BooleanOptionalAction,
+    default=True,
+    help="Also record iterations improving the best solution",
+)
+parallel_group = parser.add_mutually_exclusive_group()
+parallel_group.add_argument(
+    "--replica-exchange",
+    action="store_true",
+    help="Run one chain per CPU on a temperature ladder and exchange states",
+)
+parser.add_argument(
+    "--exchange-interval",
+    default=100,
+    type=int,
+    help="Number of iterations between replica exchanges",
+)
+parser.add_argument(
+    "--ladder-ratio",
+    default=0.5,
+    type=float,
+    help="Ratio between consecutive temperatures of the ladder",
+)
+parallel_group.add_argument(
+    "--islands",
+    action="store_true",
+    help="Periodically migrate best solutions between chains",
+)
+parser.add_argument(
+    "--migration-interval",
+    default=100,
+    type=int,
+    help="Number of iterations between migrations",
+)
+parser.add_argument(
+    "--migration-rate",
+    default=0.5,
+    type=float,
+    help="Probability of adopting a better migrant",
+)
 
 
 @dataclass(init=False)
@@ -62,11 +192,29 @@ class Arguments(Dataclass):
     alpha: float
     amp: float
     L: int
+    schedule: CoolingScheduleEnum
+    beta: float
+    reheat_ratio: float
     max_time: int
+    clock: ClockEnum
+    check_interval: int
     nb_cpus: int
+    exchange_interval: int
+    ladder_ratio: float
+    migration_interval: int
+    migration_rate: float
+    trace_every: int
+    trace_on_improvement: bool
+    backend: ObjectiveBackendEnum
+    T0_method: InitialTemperatureEnum
+    T0_walkers: int
     T0: float | None = None
     accept: float | None = None
     Tf: float | None = None
+    L_max: int | None = None
+    reheat: int | None = None
+    cache_size: int | None = None
+    deadline: int | None = None
     max_it: int | None = None
     max_it_non_improving: int | None = None
     seed: int | None = None
@@ -75,11 +223,17 @@ class Arguments(Dataclass):
     output: Path | None = None
     result: Path | None = None
     log_path: Path | None = None
+    trace: Path | None = None
     changes: list[int] | None = None
     refused: Path | None = None
     accepted: Path | None = None
     past: list[Path] | None = None
     verbose: bool = False
+    incremental: bool = False
+    array_model: bool = False
+    replica_exchange: bool = False
+    islands: bool = False
+    adaptive_neighbor: bool = False
 
 
 ARGS = parser.parse_args(namespace=Arguments())
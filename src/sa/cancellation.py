@@ -0,0 +1,86 @@
+"""This module implements the cancellation of searches running in several
+processes.
+
+A cancellation token is a small shared memory block holding a cancellation
+flag and a wall-clock deadline. It is created by the parent process and
+attached by name in the searches processes when unpickled.
+"""
+
+from collections.abc import Callable, Iterator, Sequence
+from contextlib import contextmanager
+from enum import auto
+from math import inf
+from multiprocessing.shared_memory import SharedMemory
+from time import perf_counter, thread_time, time
+from typing import Any
+
+import numpy as np
+import numpy.typing as npt
+
+from src.case_insensitive_str_enum import CaseInsensitiveStrEnum
+
+CANCELLED = 0
+DEADLINE = 1
+
+
+class ClockEnum(CaseInsensitiveStrEnum):
+    CPU = auto()
+    WALL = auto()
+
+    @property
+    def clock(self) -> Callable[[], float]:
+        return thread_time if self is ClockEnum.CPU else perf_counter
+
+
+class CancellationToken:
+    """This class implements a cancellation token shared across processes.
+
+    :param deadline: wall-clock deadline (as given by :func:`time.time`)
+    :param name: name of an existing token to attach
+    """
+
+    def __init__(self, deadline: float | None = None, name: str | None = None):
+        self.shm = SharedMemory(name, name is None, 2 * np.dtype(np.float64).itemsize)
+        self.array: npt.NDArray[np.float64] = np.ndarray(
+            (2,), np.float64, self.shm.buf
+        )
+        if name is None:
+            self.array[CANCELLED] = 0
+            self.array[DEADLINE] = inf if deadline is None else deadline
+
+    def __reduce__(self):
+        return self.__class__, (None, self.shm.name)
+
+    def cancel(self):
+        self.array[CANCELLED] = 1
+
+    def cancelled(self):
+        return bool(self.array[CANCELLED]) or time() >= self.array[DEADLINE]
+
+    def close(self):
+        self.shm.close()
+
+    def unlink(self):
+        self.shm.close()
+        self.shm.unlink()
+
+
+@contextmanager
+def cancellation_token(
+    learners: Sequence[Any], max_time: float | None = None
+) -> Iterator[CancellationToken]:
+    """Share a cancellation token between learners, removed on exit.
+
+    :param learners: learners with a `token` attribute
+    :param max_time: wall-clock time limit of all the learners (in seconds)
+    :return: the cancellation token
+    """
+    token = CancellationToken(None if max_time is None else time() + max_time)
+    for learner in learners:
+        learner.token = token
+    try:
+        yield token
+    finally:
+        for learner in learners:
+            learner.token = None
+        token.unlink()
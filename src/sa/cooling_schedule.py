@@ -1,16 +1,91 @@
 from abc import ABC, abstractmethod
+from enum import auto
+from math import exp, log
+from typing import NamedTuple
 
+from src.case_insensitive_str_enum import CaseInsensitiveStrEnum
 from src.dataclass import Dataclass, dataclass
 
 
+class Chain(NamedTuple):
+    """Statistics of the last Markov chain.
+
+    :param index: number of chains since the start temperature
+    :param acceptance_rate: rate of accepted moves
+    :param start_temp: initial temperature, or temperature of the last reheating
+    """
+
+    index: int = 0
+    acceptance_rate: float = 1
+    start_temp: float = 1
+
+
+class CoolingScheduleEnum(CaseInsensitiveStrEnum):
+    GEOMETRIC = auto()
+    LUNDY_MEES = auto()
+    LOGARITHMIC = auto()
+    ADAPTIVE = auto()
+
+
 class CoolingSchedule(ABC):
     @abstractmethod
-    def __call__(self, temp: float) -> float: ...
+    def __call__(self, temp: float, chain: Chain = Chain()) -> float: ...
 
 
 @dataclass
 class GeometricSchedule(CoolingSchedule, Dataclass):
     alpha: float
 
-    def __call__(self, temp: float):
+    def __call__(self, temp: float, chain: Chain = Chain()):
         return temp * self.alpha
+
+
+@dataclass
+class LundyMeesSchedule(CoolingSchedule, Dataclass):
+    beta: float
+
+    def __call__(self, temp: float, chain: Chain = Chain()):
+        return temp / (1 + self.beta * temp)
+
+
+@dataclass
+class LogarithmicSchedule(CoolingSchedule, Dataclass):
+    def __call__(self, temp: float, chain: Chain = Chain()):
+        return chain.start_temp * log(2) / log(chain.index + 2)
+
+
+@dataclass
+class AdaptiveSchedule(CoolingSchedule, Dataclass):
+    """This class adjusts the temperature so that the acceptance rate follows a
+    target decreasing geometrically.
+
+    :param accept: initial target acceptance rate
+    :param alpha: decrease coefficient of the target
+    :param gain: sensitivity to the gap between the acceptance rate and the
+        target
+    """
+
+    accept: float
+    alpha: float
+    gain: float = 1
+
+    def __call__(self, temp: float, chain: Chain = Chain()):
+        target = self.accept * self.alpha**chain.index
+        return temp * exp(self.gain * (target - chain.acceptance_rate))
+
+
+def create_cooling_schedule(
+    schedule: CoolingScheduleEnum,
+    alpha: float,
+    beta: float,
+    accept: float | None = None,
+) -> CoolingSchedule:
+    match schedule:
+        case CoolingScheduleEnum.GEOMETRIC:
+            return GeometricSchedule(alpha)
+        case CoolingScheduleEnum.LUNDY_MEES:
+            return LundyMeesSchedule(beta)
+        case CoolingScheduleEnum.LOGARITHMIC:
+            return LogarithmicSchedule()
+        case CoolingScheduleEnum.ADAPTIVE:
+            return AdaptiveSchedule(accept or 0.5, alpha)
@@ -0,0 +1,86 @@
+"""This module encodes models as fixed-size arrays."""
+
+from hashlib import blake2b
+
+import numpy as np
+import numpy.typing as npt
+
+from src.performance_table.normal_performance_table import NormalPerformanceTable
+from src.rmp.importance_relation import ImportanceRelation
+from src.rmp.model import RMPModel
+from src.srmp.model import ArraySRMPModel, SRMPModel
+from src.utils import tolist
+
+from ..model import Model
+
+
+def encode_model(model: Model) -> npt.NDArray[np.float64]:
+    """Encode a model as a fixed-size array.
+
+    :param model:
+    :return: profiles, weights or importance scores, and lexicographic order
+    """
+    match model:
+        case ArraySRMPModel():
+            params = [model.profiles, model.weights]
+        case SRMPModel():
+            params = [model.profiles.data.to_numpy(), model.weights]
+        case RMPModel():
+            params = [
+                model.profiles.data.to_numpy(),
+                model.importance_relation.scores,
+            ]
+        case _:
+            raise TypeError(f"{model.__class__.__name__} has no array encoding")
+    return np.concatenate(
+        [np.ravel(x) for x in params] + [np.asarray(model.lexicographic_order)],
+        dtype=np.float64,
+    )
+
+
+def decode_model[M: Model](template: M, encoding: npt.NDArray[np.float64]) -> M:
+    """Decode a model encoded by :func:`encode_model`.
+
+    :param template: model of the same type and dimensions
+    :param encoding:
+    :return:
+    """
+    k = len(template.lexicographic_order)  # type: ignore
+    match template:
+        case ArraySRMPModel():
+            m = len(template.weights)
+        case SRMPModel():
+            m = len(template.weights)
+        case RMPModel():
+            m = template.importance_relation.nb_crit
+        case _:
+            raise TypeError(f"{template.__class__.__name__} has no array encoding")
+    profiles = encoding[: k * m].reshape(k, m)
+    params = encoding[k * m : -k]
+    lexicographic_order = encoding[-k:].astype(np.int_)
+    match template:
+        case ArraySRMPModel():
+            return ArraySRMPModel(profiles, params, lexicographic_order)  # type: ignore
+        case SRMPModel():
+            return SRMPModel(  # type: ignore
+                profiles=NormalPerformanceTable(profiles),
+                weights=params.copy(),
+                lexicographic_order=tolist(lexicographic_order),
+            )
+        case _:
+            return RMPModel(  # type: ignore
+                profiles=NormalPerformanceTable(profiles),
+                importance_relation=ImportanceRelation.from_numpy(
+                    params.astype(np.int_)
+                ),
+                lexicographic_order=tolist(lexicographic_order),
+            )
+
+
+def model_key(model: Model) -> bytes:
+    """Hash a model from its encoding.
+
+    :param model:
+    :return: 16 bytes digest
+    """
+    return blake2b(encode_model(model).tobytes(), digest_size=16).digest()
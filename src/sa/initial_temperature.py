@@ -1,16 +1,92 @@
-import io
-from contextlib import redirect_stdout
+from concurrent.futures import ProcessPoolExecutor
+from enum import auto
+from functools import partial
 from math import log
 
 import numpy as np
-import pandas as pd
+import numpy.typing as npt
 
-from src.random import RNGParam
+from src.case_insensitive_str_enum import CaseInsensitiveStrEnum
+from src.constants import DEFAULT_MAX_TIME
+from src.random import RNGParam, rng_
 
-from ..constants import DEFAULT_MAX_TIME
+from .cancellation import ClockEnum
 from .neighbor import Neighbor
 from .objective import Objective
-from .random_walk import RandomWalk
+
+
+class InitialTemperatureEnum(CaseInsensitiveStrEnum):
+    MEAN = auto()
+    BEN_AMEUR = auto()
+    PERCENTILE = auto()
+
+
+def sample_transitions[S](
+    neighbor: Neighbor[S],
+    objective: Objective[S],
+    init_sol: S,
+    rng: RNGParam = None,
+    max_time: int | None = None,
+    max_it: int | None = None,
+    clock: ClockEnum = ClockEnum.CPU,
+) -> npt.NDArray[np.float64]:
+    """Run a random walk and collect the objectives before and after each move.
+
+    :param neighbor:
+    :param objective:
+    :param init_sol:
+    :param rng:
+    :param max_time: time limit (in seconds, ``DEFAULT_MAX_TIME`` if not
+        supplied)
+    :param max_it: number of moves (until the time limit if not supplied)
+    :param clock: clock measuring the time limit
+    :return: array of shape (n, 2)
+    """
+    rng = rng_(rng)
+    max_time = max_time or DEFAULT_MAX_TIME
+    transitions: list[tuple[float, float]] = []
+    sol = init_sol
+    obj = objective(sol)
+    start_time = clock.clock()
+    while (max_it is None or len(transitions) < max_it) and (
+        clock.clock() - start_time < max_time
+    ):
+        sol = neighbor(sol, rng)
+        next_obj = objective(sol)
+        transitions.append((obj, next_obj))
+        obj = next_obj
+    return np.array(transitions, dtype=np.float64).reshape(-1, 2)
+
+
+def ben_ameur_temperature(
+    transitions: npt.NDArray[np.float64],
+    acceptance_rate: float,
+    T: float,
+    p: float = 1,
+    tol: float = 1e-3,
+    max_it: int = 100,
+):
+    """Compute the temperature reaching an acceptance rate of the positive
+    transitions with the iterative method of Ben-Ameur.
+
+    :param transitions: objectives before and after each move
+    :param acceptance_rate:
+    :param T: first estimate of the temperature
+    :param p:
+    :param tol: tolerance on the acceptance rate
+    :param max_it:
+    :return:
+    """
+    before, after = transitions[transitions[:, 1] > transitions[:, 0]].T
+    if not len(before):
+        return T
+    e_min = before.min()
+    for _ in range(max_it):
+        rate = np.exp(-(after - e_min) / T).sum() / np.exp(-(before - e_min) / T).sum()
+        if abs(rate - acceptance_rate) <= tol or rate <= 0:
+            break
+        T *= (log(rate) / log(acceptance_rate)) ** (1 / p)
+    return float(T)
 
 
 def initial_temperature[S](
@@ -21,22 +97,56 @@ def initial_temperature[S](
     rng: RNGParam = None,
     max_time: int | None = None,
     max_it: int | None = None,
+    method: InitialTemperatureEnum = InitialTemperatureEnum.MEAN,
+    nb_walkers: int = 1,
+    percentile: float = 50,
+    clock: ClockEnum = ClockEnum.CPU,
 ):
-    with redirect_stdout(io.StringIO()) as results:
-        RandomWalk(
-            neighbor,
-            objective,
-            init_sol,
-            rng,
-            max_time or DEFAULT_MAX_TIME,
-            max_it,
-            verbose=True,
-        ).learn()
-
-    results.seek(0)
-
-    energy = pd.read_csv(results, dialect="unix")["Current_obj"]
-    transitions = np.diff(energy)
-    positive_transitions = transitions[transitions >= 0]
-    positive_transitions_mean = np.mean(positive_transitions)
-    return float(positive_transitions_mean / (-log(acceptance_rate)))
+    """Estimate the initial temperature giving an acceptance rate from random
+    walks.
+
+    :param acceptance_rate:
+    :param neighbor:
+    :param objective:
+    :param init_sol:
+    :param rng:
+    :param max_time: time limit of each walker (in seconds)
+    :param max_it: total number of moves
+    :param method: estimator
+    :param nb_walkers: number of walkers run in parallel
+    :param percentile: percentile of the positive transitions used by
+        ``PERCENTILE``
+    :param clock: clock measuring the time limit
+    :return:
+    """
+    rngs = rng_(rng).spawn(nb_walkers)
+    walk = partial(
+        sample_transitions,
+        neighbor,
+        objective,
+        init_sol,
+        max_time=max_time,
+        max_it=max(max_it // nb_walkers, 1) if max_it else None,
+        clock=clock,
+    )
+    if nb_walkers == 1:
+        transitions = walk(rngs[0])
+    else:
+        with ProcessPoolExecutor(nb_walkers) as process_pool:
+            transitions = np.concatenate(list(process_pool.map(walk, rngs)))
+
+    deltas = transitions[:, 1] - transitions[:, 0]
+    positive_deltas = deltas[deltas >= 0]
+    match method:
+        case InitialTemperatureEnum.MEAN:
+            return float(np.mean(positive_deltas) / (-log(acceptance_rate)))
+        case InitialTemperatureEnum.PERCENTILE:
+            return float(
+                np.percentile(positive_deltas, percentile) / (-log(acceptance_rate))
+            )
+        case InitialTemperatureEnum.BEN_AMEUR:
+            return ben_ameur_temperature(
+                transitions,
+                acceptance_rate,
+                float(np.mean(positive_deltas) / (-log(acceptance_rate))),
+            )
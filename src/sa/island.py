@@ -0,0 +1,219 @@
+"""This module implements an island model of simulated annealing.
+
+Islands are :class:`SimulatedAnnealing` chains running in separate processes.
+They periodically publish their best solution, encoded as a fixed-size array,
+into a shared memory area and adopt a better migrant with some probability.
+
+Each island owns one row of the area and is its only writer. Rows are
+protected by a sequence number incremented before and after each write, so
+readers retry instead of taking a lock.
+"""
+
+from collections.abc import Sequence
+from contextlib import contextmanager
+from dataclasses import field
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any
+
+import numpy as np
+import numpy.typing as npt
+
+from src.dataclass import Dataclass, dataclass
+from src.random import RNG, RNGParam
+
+from .encoding import decode_model, encode_model
+from .sa import SimulatedAnnealing
+
+SEQ = 0
+OBJ = 1
+HEADER = 2
+
+
+class MigrationArea:
+    """This class implements the shared memory area where islands publish
+    their best solution.
+
+    It is created by the parent process and attached by name in the islands
+    processes when unpickled.
+
+    :param nb_islands:
+    :param size: size of the model encoding
+    :param name: name of an existing area to attach
+    """
+
+    def __init__(self, nb_islands: int, size: int, name: str | None = None):
+        self.nb_islands = nb_islands
+        self.size = size
+        shape = (nb_islands, HEADER + size)
+        self.shm = SharedMemory(
+            name, name is None, int(np.prod(shape)) * np.dtype(np.float64).itemsize
+        )
+        self.array: npt.NDArray[np.float64] = np.ndarray(
+            shape, np.float64, self.shm.buf
+        )
+        if name is None:
+            self.array[:] = 0
+            self.array[:, OBJ] = np.inf
+
+    def __reduce__(self):
+        return self.__class__, (self.nb_islands, self.size, self.shm.name)
+
+    def publish(
+        self, island: int, objective: float, encoding: npt.NDArray[np.float64]
+    ):
+        row = self.array[island]
+        row[SEQ] += 1
+        row[HEADER:] = encoding
+        row[OBJ] = objective
+        row[SEQ] += 1
+
+    def read(self, island: int):
+        """Read the solution published by an island.
+
+        :param island:
+        :return: objective and encoding of the solution
+        """
+        row = self.array[island]
+        while True:
+            seq = row[SEQ]
+            if seq % 2 == 0:
+                objective = float(row[OBJ])
+                encoding = row[HEADER:].copy()
+                if row[SEQ] == seq:
+                    return objective, encoding
+
+    def best(self, exclude: int | None = None):
+        """Find the island having published the best solution.
+
+        :param exclude: island to ignore
+        :return: index of the island, ``None`` if nothing was published
+        """
+        objectives = self.array[:, OBJ].copy()
+        if exclude is not None:
+            objectives[exclude] = np.inf
+        island = int(np.argmin(objectives))
+        return island if np.isfinite(objectives[island]) else None
+
+    def close(self):
+        self.shm.close()
+
+    def unlink(self):
+        self.shm.close()
+        self.shm.unlink()
+
+
+@dataclass
+class MigrationSchedule(Dataclass):
+    """This class decides when islands exchange solutions.
+
+    :param interval: number of iterations between migrations
+    :param rate: probability of adopting a better migrant
+    """
+
+    interval: int = 100
+    rate: float = 0.5
+
+    def __call__(self, it: int):
+        return it % self.interval == 0
+
+
+@dataclass
+class Island[S](SimulatedAnnealing[S]):
+    """This class implements a simulated annealing chain exchanging its best
+    solution with other islands.
+
+    :param island: index of the island in the migration area
+    :param area:
+    :param schedule:
+    """
+
+    island: int = 0
+    area: MigrationArea | None = None
+    schedule: MigrationSchedule = field(default_factory=MigrationSchedule)
+
+    def __post_init__(self, rng: RNGParam):
+        super().__post_init__(rng)
+        self.stopping_criteria.append(self.stop_migrant_optimum)
+
+    def init(self, initial_sol: S):
+        super().init(initial_sol)
+        self.published_obj = np.inf
+        self.nb_emigrations = 0
+        self.nb_immigrations = 0
+        self.nb_rejected_immigrations = 0
+
+    def stop_migrant_optimum(self):
+        """Stop when another island has reached the optimum."""
+        if self.area is None:
+            return False
+        island = self.area.best(self.island)
+        return (
+            island is not None
+            and self.area.array[island, OBJ] <= self.objective.optimum
+        )
+
+    def migrate(self, rng: RNG):
+        if self.area is None:
+            return
+
+        # Emigration
+        if self.best_obj < self.published_obj:
+            self.area.publish(
+                self.island,
+                self.best_obj,
+                encode_model(self.best_sol),  # type: ignore
+            )
+            self.published_obj = self.best_obj
+            self.nb_emigrations += 1
+
+        # Immigration
+        island = self.area.best(self.island)
+        if island is None:
+            return
+        objective, encoding = self.area.read(island)
+        if objective >= self.current_obj:
+            return
+        if rng.random() >= self.schedule.rate:
+            self.nb_rejected_immigrations += 1
+            return
+        self.current_sol = decode_model(self.current_sol, encoding)  # type: ignore
+        self.current_obj = self.objective(self.current_sol)
+        self.nb_immigrations += 1
+        if self.current_obj < self.best_obj:
+            self.non_improving_it = 0
+            self.best_sol = self.current_sol
+            self.best_obj = self.current_obj
+
+    def step(self, rng: RNG):
+        optimum = super().step(rng)
+        if optimum or self.schedule(self.it):
+            self.migrate(rng)
+        return optimum
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "Island": self.island,
+            "Emigrations": self.nb_emigrations,
+            "Immigrations": self.nb_immigrations,
+            "Rejected_immigrations": self.nb_rejected_immigrations,
+        } | super().stats()
+
+
+@contextmanager
+def migration_area[S](islands: Sequence[Island[S]]):
+    """Create the migration area of islands, removed on exit.
+
+    :param islands:
+    :return: the migration area
+    """
+    size = encode_model(islands[0].init_sol).size  # type: ignore
+    area = MigrationArea(len(islands), size)
+    for i, island in enumerate(islands):
+        island.island = i
+        island.area = area
+    try:
+        yield area
+    finally:
+        for island in islands:
+            island.area = None
+        area.unlink()
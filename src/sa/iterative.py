@@ -1,10 +1,9 @@
 import csv
 from collections.abc import Callable
-from contextlib import contextmanager
-from dataclasses import InitVar
+from contextlib import ExitStack, contextmanager
+from dataclasses import InitVar, field
 from pathlib import Path
-from time import thread_time
-from typing import ClassVar, NotRequired, TypedDict
+from typing import Any, ClassVar, NotRequired, TypedDict
 
 from mcda.internal.core.interfaces import Learner
 
@@ -13,8 +12,10 @@ from src.dataclass import Dataclass, dataclass
 from src.random import RNG, RNGParam, rng_
 from src.utils import file_or_stdout, none_guard
 
+from .cancellation import CancellationToken, ClockEnum
 from .neighbor import Neighbor
 from .objective import Objective
+from .trace import TraceConfig, TraceWriter
 
 
 @dataclass
@@ -28,6 +29,10 @@ class Iterative[S](Learner[S], Dataclass):
     max_it_non_improving: int | None = None
     verbose: bool = False
     log_path: Path | None = None
+    trace: TraceConfig | None = field(default=None, kw_only=True)
+    clock: ClockEnum = field(default=ClockEnum.CPU, kw_only=True)
+    token: CancellationToken | None = field(default=None, kw_only=True)
+    check_interval: int = field(default=100, kw_only=True)
     stopping_criteria_dict: ClassVar[dict[str, str]] = {
         "max_time": "stop_time",
         "max_it": "stop_it",
@@ -50,7 +55,11 @@ class Iterative[S](Learner[S], Dataclass):
         for attr, f in self.stopping_criteria_dict.items():
             if getattr(self, attr) is not None:
                 self.stopping_criteria.append(getattr(self, f))
+        # The token is shared after construction
+        self.stopping_criteria.append(self.stop_cancelled)
         self._rng = rng_(rng)
+        self.log: csv.DictWriter[str] | None = None
+        self.tracer: TraceWriter | None = None
 
     @contextmanager
     def log_writer(self):
@@ -61,9 +70,29 @@ class Iterative[S](Learner[S], Dataclass):
                 dialect="unix",
             )
 
+    @contextmanager
+    def writers(self):
+        """Open the log and the trace once for the whole run."""
+        with ExitStack() as stack:
+            if self.verbose:
+                self.log = stack.enter_context(self.log_writer())
+            if self.trace:
+                self.tracer = stack.enter_context(TraceWriter(self.trace))
+            try:
+                yield
+            finally:
+                self.log = None
+                self.tracer = None
+
     def stop_time(self):
         return self.time >= self.max_time
 
+    def stop_cancelled(self):
+        if self.token is None or self.it < self.next_check:
+            return False
+        self.next_check = self.it + self.check_interval
+        return self.token.cancelled()
+
     def stop_optimum(self):
         return self.best_obj <= self.objective.optimum
 
@@ -80,27 +109,43 @@ class Iterative[S](Learner[S], Dataclass):
             return False
 
     def init(self, initial_sol: S):
+        self.neighbor.reset()
+        self.objective.reset_stats()
         self.current_sol = initial_sol
         self.current_obj = self.objective(self.current_sol)
         self.best_sol = initial_sol
         self.best_obj = self.objective(self.best_sol)
-        self.start_time = thread_time()
-        self.time = thread_time() - self.start_time
+        self.start_time = self.clock.clock()
+        self.time = self.elapsed()
         self.it = 0
         self.non_improving_it = 0
+        self.next_check = 0
 
-        if self.verbose:
-            with self.log_writer() as log_writer:
-                log_writer.writeheader()
+        if self.log:
+            self.log.writeheader()
+
+    def elapsed(self):
+        """Time since the start of the search, measured with `clock`."""
+        return self.clock.clock() - self.start_time
 
     def stop(self):
         return any(f() for f in self.stopping_criteria)
 
     def main_loop(self, rng: RNG) -> S: ...
 
+    def stats(self) -> dict[str, Any]:
+        """Statistics of the search reported with its result."""
+        return self.neighbor.stats() | self.objective.stats()
+
     def learn(self):
-        # Init
-        self.init(self.init_sol)
+        with self.writers():
+            # Init
+            self.init(self.init_sol)
+
+            # Main loop
+            sol = self.main_loop(self._rng)
 
-        # Main loop
-        return self.main_loop(self._rng)
+            # Stop the other searches sharing the token
+            if self.token and self.stop_optimum():
+                self.token.cancel()
+            return sol
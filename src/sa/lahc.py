@@ -0,0 +1,100 @@
+from math import nan
+
+import numpy as np
+
+from src.dataclass import dataclass
+from src.random import RNG
+
+from .iterative import Iterative
+
+
+@dataclass
+class LateAcceptanceHillClimbing[S](Iterative[S]):
+    """This class implements late acceptance hill climbing.
+
+    A neighbor is accepted if it is not worse than the current solution or
+    than the current solution `history` iterations before.
+
+    :param history: length of the history of objectives
+    """
+
+    history: int = 1_000
+
+    def init(self, initial_sol: S):
+        super().init(initial_sol)
+        self.objectives = np.full(self.history, self.current_obj, dtype=np.float64)
+
+    def step(self, rng: RNG):
+        """Run one iteration.
+
+        :param rng:
+        :return: ``True`` if the optimum is reached
+        """
+        # New iteration
+        self.time = self.elapsed()
+        self.it += 1
+        self.non_improving_it += 1
+
+        # Neighbor model
+        neighbor_sol = self.neighbor(self.current_sol, rng)
+        neighbor_obj = self.objective(neighbor_sol)
+
+        if self.log:
+            self.log.writerow(
+                self.LogFields(
+                    It=self.it,
+                    Non_improving_it=self.non_improving_it,
+                    Time=self.time,
+                    Neighbor_sol=neighbor_sol,
+                    Current_sol=self.current_sol,
+                    Best_sol=self.best_sol,
+                    Neighbor_obj=neighbor_obj,
+                    Current_obj=self.current_obj,
+                    Best_obj=self.best_obj,
+                )
+            )
+
+        v = self.it % self.history
+        accepted = (
+            neighbor_obj <= self.objectives[v] or neighbor_obj <= self.current_obj
+        )
+        self.neighbor.feedback(accepted, neighbor_obj < self.current_obj)
+        improved = False
+        if accepted:
+            self.current_sol = neighbor_sol
+            self.current_obj = neighbor_obj
+
+            # New best
+            if self.current_obj < self.best_obj:
+                improved = True
+                self.non_improving_it = 0
+                self.best_sol = self.current_sol
+                self.best_obj = self.current_obj
+        self.objectives[v] = self.current_obj
+
+        if self.tracer:
+            self.tracer.record(
+                self.it,
+                self.time,
+                nan,
+                neighbor_obj,
+                self.current_obj,
+                self.best_obj,
+                self.neighbor.move,
+                bool(accepted),
+                improved,
+            )
+
+        # Stop when optimum reached
+        if improved and self.best_obj <= self.objective.optimum:
+            return True
+
+        # Update time
+        self.time = self.elapsed()
+        return False
+
+    def main_loop(self, rng: RNG):
+        while not self.stop():
+            if self.step(rng):
+                break
+        return self.best_sol
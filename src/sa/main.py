@@ -1,21 +1,28 @@
+from dataclasses import replace
 from enum import Enum, member
 from pathlib import Path
-from typing import NamedTuple
+from typing import Any, NamedTuple
 
 from mcda.relations import PreferenceStructure
 
 from src.constants import DEFAULT_MAX_TIME
+from src.methods import MethodEnum
 from src.models import ModelEnum
 from src.performance_table.normal_performance_table import NormalPerformanceTable
 from src.random import RNGParam, rng_
 from src.rmp.model import RMPModel
-from src.srmp.model import SRMPModel
-from src.utils import midpoints
+from src.srmp.model import ArraySRMPModel, SRMPModel
+from src.utils import add_filename_suffix, midpoints
 
 from ..model import Model
-from .cooling_schedule import GeometricSchedule
-from .initial_temperature import initial_temperature
+from .cancellation import ClockEnum
+from .cooling_schedule import CoolingScheduleEnum, create_cooling_schedule
+from .initial_temperature import InitialTemperatureEnum, initial_temperature
+from .island import Island, MigrationSchedule
+from .iterative import Iterative
+from .lahc import LateAcceptanceHillClimbing
 from .neighbor import (
+    AdaptiveNeighbor,
     Neighbor,
     NeighborImportanceRelation,
     NeighborLexOrder,
@@ -24,8 +31,17 @@ from .neighbor import (
     NeighborWeightAmp,
     RandomNeighbor,
 )
-from .objective import CollectiveObjective, FitnessObjective
+from .objective import (
+    CachedObjective,
+    CollectiveObjective,
+    FitnessObjective,
+    Objective,
+    ObjectiveBackendEnum,
+)
+from .replica_exchange import ReplicaExchange, ladder_temperatures
 from .sa import SimulatedAnnealing
+from .tabu import TabuSearch
+from .trace import TraceConfig
 
 
 class SenseEnum(Enum):
@@ -38,6 +54,7 @@ class SAResult[M, O](NamedTuple):
     best_objective: O
     time: float
     it: int
+    stats: dict[str, Any] | None = None
 
 
 def create_sa(
@@ -64,7 +81,42 @@ def create_sa(
     rng_init: RNGParam = None,
     rng_sa: RNGParam = None,
     nb_cpus: int = 1,
+    incremental: bool = False,
+    backend: ObjectiveBackendEnum = ObjectiveBackendEnum.NUMPY,
+    array_model: bool = False,
+    replica_exchange: bool = False,
+    exchange_interval: int = 100,
+    ladder_ratio: float = 0.5,
+    islands: bool = False,
+    migration_interval: int = 100,
+    migration_rate: float = 0.5,
+    trace: TraceConfig | None = None,
+    t0_method: InitialTemperatureEnum = InitialTemperatureEnum.MEAN,
+    t0_walkers: int = 1,
+    adaptive_neighbor: bool = False,
+    schedule: CoolingScheduleEnum = CoolingScheduleEnum.GEOMETRIC,
+    beta: float = 0.001,
+    L_max: int | None = None,
+    reheat: int | None = None,
+    reheat_ratio: float = 0.5,
+    cache_size: int | None = None,
+    method: MethodEnum = MethodEnum.SA,
+    tenure: int = 10,
+    nb_candidates: int = 20,
+    history: int = 1_000,
+    clock: ClockEnum = ClockEnum.CPU,
+    check_interval: int = 100,
 ):
+    if replica_exchange and islands:
+        raise ValueError("Replica exchange and islands cannot be combined")
+    if backend is ObjectiveBackendEnum.NUMBA:
+        if model is not ModelEnum.SRMP:
+            raise ValueError(f"{model} model has no numba objective")
+        if incremental:
+            raise ValueError("Numba objective cannot be incremental")
+        if len(comparisons) > 1:
+            raise ValueError("Numba objective cannot be collective")
+
     # DMs
     NB_DM = len(comparisons)
     DMS = range(NB_DM)
@@ -110,9 +162,13 @@ def create_sa(
     if lex_order:
         for init_sol in init_sols:
             init_sol.lexicographic_order = lex_order
+    if array_model:
+        if model is not ModelEnum.SRMP:
+            raise ValueError(f"{model} model has no array representation")
+        init_sols = [init_sol.array for init_sol in init_sols]  # type: ignore
 
     # Neighborhood operators
-    neighbors: list[Neighbor[SRMPModel | RMPModel]] = []
+    neighbors: list[Neighbor[SRMPModel | RMPModel | ArraySRMPModel]] = []
     prob: list[int] = []
 
     neighbors.append(
@@ -135,11 +191,15 @@ def create_sa(
         neighbors.append(NeighborLexOrder(False))
         prob.append(k)
 
-    neighbor = RandomNeighbor(neighbors, prob)
+    neighbor = (
+        AdaptiveNeighbor(neighbors, prob)
+        if adaptive_neighbor
+        else RandomNeighbor(neighbors, prob)
+    )
 
     # Objective
-    objective = (
-        FitnessObjective(alternatives, comparisons[0])
+    objective: Objective[Model] = (
+        FitnessObjective(alternatives, comparisons[0], incremental, backend)
         if NB_DM == 1
         else CollectiveObjective(
             alternatives,
@@ -148,11 +208,84 @@ def create_sa(
             comparisons_accepted,
             comparisons_refused,
             comparisons_past,
+            incremental,
         )
     )
+    if cache_size:
+        objective = CachedObjective(objective, cache_size)
+
+    # Traces
+    traces = [
+        (
+            replace(trace, path=add_filename_suffix(trace.path, f"_{i}"))
+            if trace and len(init_sols) > 1
+            else trace
+        )
+        for i in range(len(init_sols))
+    ]
+
+    # Local searches without temperature
+    if method in (MethodEnum.TABU, MethodEnum.LAHC):
+        unsupported = {
+            "replica_exchange": replica_exchange,
+            "islands": islands,
+            "schedule": schedule is not CoolingScheduleEnum.GEOMETRIC,
+            "t0": t0 is not None,
+            "accept": accept is not None,
+            "L": L != 1,
+            "L_max": L_max is not None,
+            "Tf": Tf is not None,
+            "reheat": reheat is not None,
+        }
+        if options := [option for option, used in unsupported.items() if used]:
+            raise ValueError(f"{method} does not support {', '.join(options)}")
+    match method:
+        case MethodEnum.TABU:
+            return [
+                TabuSearch(
+                    neighbor,
+                    objective,
+                    init_sol,
+                    rng,
+                    max_time,
+                    max_it,
+                    max_it_non_improving,
+                    verbose,
+                    log_path,
+                    tenure,
+                    nb_candidates,
+                    trace=chain_trace,
+                    clock=clock,
+                    check_interval=check_interval,
+                )
+                for (init_sol, rng, chain_trace) in zip(
+                    init_sols, rng_(rng_sa).spawn(len(init_sols)), traces
+                )
+            ], SenseEnum.MIN
+        case MethodEnum.LAHC:
+            return [
+                LateAcceptanceHillClimbing(
+                    neighbor,
+                    objective,
+                    init_sol,
+                    rng,
+                    max_time,
+                    max_it,
+                    max_it_non_improving,
+                    verbose,
+                    log_path,
+                    history,
+                    trace=chain_trace,
+                    clock=clock,
+                    check_interval=check_interval,
+                )
+                for (init_sol, rng, chain_trace) in zip(
+                    init_sols, rng_(rng_sa).spawn(len(init_sols)), traces
+                )
+            ], SenseEnum.MIN
 
     # Cooling schedule
-    cooling_schedule = GeometricSchedule(alpha)
+    cooling_schedule = create_cooling_schedule(schedule, alpha, beta, accept)
 
     # Random walk
     if t0 is None:
@@ -165,33 +298,106 @@ def create_sa(
             rng_sa,
             max(max_time // 100, 1) if max_time else None,
             max(max_it // 100, 1) if max_it else None,
+            t0_method,
+            t0_walkers,
+            clock=clock,
         )
 
-    # Simulated Annealing
-    return (
-        [
-            SimulatedAnnealing(
-                neighbor,
-                objective,
-                init_sol,
-                rng,
-                max_time,
-                max_it,
-                max_it_non_improving,
-                verbose,
-                log_path,
-                t0,
-                L,
-                cooling_schedule,
-                Tf,
-            )
-            for (init_sol, rng) in zip(init_sols, rng_(rng_sa).spawn(len(init_sols)))
-        ],
-        SenseEnum.MIN,
+    # Temperature ladder
+    t0s = (
+        ladder_temperatures(t0, ladder_ratio, len(init_sols))
+        if replica_exchange
+        else [t0] * len(init_sols)
     )
 
+    # Islands
+    sa_class, sa_kwargs = (
+        (Island, {"schedule": MigrationSchedule(migration_interval, migration_rate)})
+        if islands
+        else (SimulatedAnnealing, {})
+    )
+
+    # Simulated Annealing
+    rngs = rng_(rng_sa).spawn(len(init_sols) + int(replica_exchange))
+    sas = [
+        sa_class(
+            neighbor,
+            objective,
+            init_sol,
+            rng,
+            max_time,
+            max_it,
+            max_it_non_improving,
+            verbose,
+            log_path,
+            T0,
+            L,
+            cooling_schedule,
+            Tf,
+            L_max,
+            reheat,
+            reheat_ratio,
+            trace=chain_trace,
+            clock=clock,
+            check_interval=check_interval,
+            **sa_kwargs,
+        )
+        for (init_sol, T0, rng, chain_trace) in zip(init_sols, t0s, rngs, traces)
+    ]
+
+    # Replica exchange
+    if replica_exchange:
+        return [ReplicaExchange(sas, exchange_interval, rngs[-1])], SenseEnum.MIN
 
-def sa_result[S: Model](sa: SimulatedAnnealing[S]):
+    return sas, SenseEnum.MIN
+
+
+def sa_result[S: Model](sa: Iterative[S] | ReplicaExchange[S]):
     sa.learn()
 
-    return SAResult(sa.best_sol, sa.best_obj, sa.time, sa.it)
+    return SAResult(sa.best_sol, sa.best_obj, sa.time, sa.it, sa.stats())
+
+
+def lexicographic_order_presolve(
+    lex_order: list[int],
+    k: int,
+    alternatives: NormalPerformanceTable,
+    comparisons: list[PreferenceStructure],
+    max_it: int,
+    rng: RNGParam = None,
+    collective: bool = True,
+    **kwargs: Any,
+) -> float:
+    """Score a lexicographic order with a short simulated annealing with the
+    order fixed, to solve the most promising orders first.
+
+    :param lex_order:
+    :param k: number of profiles
+    :param alternatives:
+    :param comparisons: comparisons of each decision maker
+    :param max_it: number of iterations of each simulated annealing
+    :param rng:
+    :param collective: score a collective model of the decision makers,
+        otherwise the sum of the scores of each decision maker
+    :return: best objective found (the lower the better)
+    """
+    groups = [comparisons] if collective else [[d] for d in comparisons]
+    score = 0.0
+    for group, rng_group in zip(groups, rng_(rng).spawn(len(groups))):
+        rng_init, rng_sa = rng_group.spawn(2)
+        sas, _ = create_sa(
+            ModelEnum.SRMP,
+            k,
+            alternatives,
+            group,
+            alpha=0.99,
+            amp=0.05,
+            lex_order=lex_order,
+            accept=0.5,
+            max_it=max_it,
+            rng_init=rng_init,
+            rng_sa=rng_sa,
+            **kwargs,
+        )
+        score += min(sa_result(sa).best_objective for sa in sas)
+    return score
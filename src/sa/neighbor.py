@@ -1,8 +1,7 @@
 from abc import ABC, abstractmethod
 from collections.abc import Sequence
 from copy import deepcopy
-from functools import reduce
-from typing import cast
+from typing import Any, cast
 
 import numpy as np
 import numpy.typing as npt
@@ -15,13 +14,30 @@ from src.random import RNGParam, rng_
 from src.rmp.importance_relation import ImportanceRelation
 from src.rmp.model import RMPModel
 from src.rmp.permutation import swap
-from src.srmp.model import SRMPModel
+from src.srmp.model import ArraySRMPModel, SRMPModel
+from src.srmp.weight import add_subset_sum, compute_subset_sum
 
 
 class Neighbor[S](ABC):
+    move: int = 0
+    """Index of the type of the last move"""
+
     @abstractmethod
     def __call__(self, sol: S, rng: RNGParam = None) -> S: ...
 
+    def reset(self):
+        """Reset the state learned during a search."""
+
+    def feedback(self, accepted: bool, improved: bool):
+        """Report the outcome of the last move.
+
+        :param accepted: the move was accepted
+        :param improved: the move improved the current solution
+        """
+
+    def stats(self) -> dict[str, Any]:
+        return {}
+
 
 class RandomNeighbor[S](Neighbor[S]):
     def __init__(
@@ -35,11 +51,93 @@ class RandomNeighbor[S](Neighbor[S]):
             self.prob = prob_array / prob_array.sum()
         else:
             self.prob = None
+        self.reset()
 
     def __call__(self, sol: S, rng: RNGParam = None):
         rng = rng_(rng)
-        i = rng.choice(len(self.neighbors), p=self.prob)
-        return self.neighbors[i](sol, rng)
+        self.move = rng.choice(len(self.neighbors), p=self.prob)
+        self.nb_moves[self.move] += 1
+        return self.neighbors[self.move](sol, rng)
+
+    def reset(self):
+        self.nb_moves = np.zeros(len(self.neighbors), dtype=np.int_)
+        self.nb_accepted = np.zeros(len(self.neighbors), dtype=np.int_)
+        self.nb_improving = np.zeros(len(self.neighbors), dtype=np.int_)
+
+    def feedback(self, accepted: bool, improved: bool):
+        self.nb_accepted[self.move] += accepted
+        self.nb_improving[self.move] += improved
+
+    def stats(self):
+        result: dict[str, Any] = {}
+        for i, neighbor in enumerate(self.neighbors):
+            name = neighbor.__class__.__name__
+            result[f"{name}_moves"] = int(self.nb_moves[i])
+            result[f"{name}_accepted"] = int(self.nb_accepted[i])
+            result[f"{name}_improving"] = int(self.nb_improving[i])
+        return result
+
+
+class AdaptiveNeighbor[S](RandomNeighbor[S]):
+    """This class selects neighborhood operators by adaptive pursuit.
+
+    The quality of each operator is an exponential moving average of its
+    rewards, 1 for an improving move, `accept_reward` for another accepted
+    move and 0 otherwise. The probability of the best operator is pursued
+    towards `1 - (K - 1) * p_min`, the others towards `p_min`.
+
+    :param neighbors:
+    :param prob: initial probabilities
+    :param alpha: adaptation rate of the qualities
+    :param beta: adaptation rate of the probabilities
+    :param p_min: minimal probability of an operator
+    :param accept_reward: reward of an accepted non improving move
+    """
+
+    def __init__(
+        self,
+        neighbors: Sequence[Neighbor[S]],
+        prob: Sequence[float] | None = None,
+        alpha: float = 0.1,
+        beta: float = 0.1,
+        p_min: float = 0.05,
+        accept_reward: float = 0.1,
+    ):
+        self.init_prob = prob
+        self.alpha = alpha
+        self.beta = beta
+        self.p_min = min(p_min, 1 / len(neighbors))
+        self.accept_reward = accept_reward
+        super().__init__(neighbors, prob)
+
+    def reset(self):
+        super().reset()
+        K = len(self.neighbors)
+        if self.init_prob:
+            prob_array = np.array(self.init_prob, dtype=np.float64)
+            self.prob = prob_array / prob_array.sum()
+        else:
+            self.prob = np.full(K, 1 / K)
+        self.quality = np.full(K, self.accept_reward)
+
+    def feedback(self, accepted: bool, improved: bool):
+        super().feedback(accepted, improved)
+        assert self.prob is not None
+        reward = 1 if improved else self.accept_reward if accepted else 0
+        self.quality[self.move] += self.alpha * (reward - self.quality[self.move])
+
+        best = np.argmax(self.quality)
+        p_max = 1 - (len(self.neighbors) - 1) * self.p_min
+        self.prob += self.beta * (self.p_min - self.prob)
+        self.prob[best] += self.beta * (p_max - self.p_min)
+        self.prob /= self.prob.sum()
+
+    def stats(self):
+        assert self.prob is not None
+        result = super().stats()
+        for i, neighbor in enumerate(self.neighbors):
+            result[f"{neighbor.__class__.__name__}_prob"] = float(self.prob[i])
+        return result
 
 
 @dataclass
@@ -66,12 +164,40 @@ class NeighborProfile[S: SRMPModel | RMPModel](Neighbor[S], Dataclass):
 
 
 @dataclass
-class NeighborProfileDiscretized[S: SRMPModel | RMPModel](Neighbor[S], Dataclass):
+class NeighborProfileDiscretized[S: SRMPModel | RMPModel | ArraySRMPModel](
+    Neighbor[S], Dataclass
+):
     values: PerformanceTableType
     local: bool = False
 
+    def __post_init__(self):
+        self.values_numpy = self.values.data.to_numpy()
+
+    def available_ind(self, profile_perf_ind: int):
+        if self.local:
+            available_ind: list[int] = []
+            if profile_perf_ind > 0:
+                available_ind.append(profile_perf_ind - 1)
+            if profile_perf_ind < (len(self.values_numpy) - 1):
+                available_ind.append(profile_perf_ind + 1)
+            return available_ind
+        return list(range(len(self.values_numpy)))
+
     def __call__(self, sol: S, rng: RNGParam = None):
         rng = rng_(rng)
+
+        if isinstance(sol, ArraySRMPModel):
+            crit_ind = rng.choice(sol.profiles.shape[1])
+            crit_values = self.values_numpy[:, crit_ind]
+            profile_ind = rng.choice(sol.profiles.shape[0])
+            profile_perf_ind = np.flatnonzero(
+                crit_values == sol.profiles[profile_ind, crit_ind]
+            )[0]
+            profile_perf_ind = rng.choice(self.available_ind(profile_perf_ind))
+            return sol.replace_profile(
+                profile_ind, crit_ind, crit_values[profile_perf_ind]
+            )
+
         profiles = deepcopy(sol.profiles)
 
         crit_ind = rng.choice(len(profiles.criteria))
@@ -83,15 +209,7 @@ class NeighborProfileDiscretized[S: SRMPModel | RMPModel](Neighbor[S], Dataclass
         profile_perf = cast(float, profiles.cell[profile_ind, crit_ind])
         profile_perf_ind = cast(int, crit_values[crit_values == profile_perf].index[0])
 
-        if self.local:
-            available_ind = []
-            if profile_perf_ind > 0:
-                available_ind.append(profile_perf_ind - 1)
-            if profile_perf_ind < (len(self.values.alternatives) - 1):  # type: ignore
-                available_ind.append(profile_perf_ind + 1)
-        else:
-            available_ind = list(range(len(self.values.alternatives)))  # type: ignore
-        profile_perf_ind = rng.choice(available_ind)
+        profile_perf_ind = rng.choice(self.available_ind(profile_perf_ind))
 
         profiles_values[profile_ind] = crit_values[crit_values.index[profile_perf_ind]]
 
@@ -107,7 +225,7 @@ class NeighborProfileDiscretized[S: SRMPModel | RMPModel](Neighbor[S], Dataclass
 
 
 @dataclass
-class NeighborWeightAmp[S: SRMPModel](Neighbor[S], Dataclass):
+class NeighborWeightAmp[S: SRMPModel | ArraySRMPModel](Neighbor[S], Dataclass):
     amp: float = 1
 
     def __call__(self, sol: S, rng: RNGParam = None):
@@ -180,22 +298,6 @@ def weights_local_change(
     return new
 
 
-# def compute_subset_sum(weights: npt.NDArray[np.float64]):
-#     if len(weights) == 1:
-#         return weights
-#     weight = weights[-1]
-#     subset_sums = compute_subset_sum(weights[:-1])
-#     return np.concat((subset_sums, np.array([weight]), subset_sums + weight))
-
-
-def add_subset_sum(subset_sums: npt.NDArray[np.float64], weight: float):
-    return np.concat((subset_sums, np.array([weight]), subset_sums + weight))
-
-
-def compute_subset_sum(weights: npt.NDArray[np.float64]):
-    return np.concat((np.zeros(1), reduce(add_subset_sum, weights, np.empty(0))))
-
-
 @njit(fastmath=True)  # type: ignore
 def compute_alpha_increase(subset_sum: npt.NDArray[np.float64], weight: float):
     N = len(subset_sum)
@@ -267,7 +369,7 @@ def compute_alpha(subset_sum: npt.NDArray[np.float64], weight: float, increase:
 
 
 @dataclass
-class NeighborWeight[S: SRMPModel](Neighbor[S]):
+class NeighborWeight[S: SRMPModel | ArraySRMPModel](Neighbor[S]):
     def __call__(self, sol: S, rng: RNGParam = None):
         if np.any(sol.weights >= 1 - EPSILON):
             new_weights = np.full_like(sol.weights, 1 / len(sol.weights))
@@ -320,17 +422,16 @@ class NeighborImportanceRelation[S: RMPModel](Neighbor[S]):
         rng = rng_(rng)
         importance_relation: ImportanceRelation = deepcopy(sol.importance_relation)
 
-        keys = list(importance_relation)
         min_score = max_score = 0
 
-        coalition = cast(frozenset[int], None)
+        coalition = 0
         while min_score >= max_score:
-            coalition = keys[rng.choice(len(importance_relation))]
-            min_score = importance_relation.min(coalition)
-            max_score = importance_relation.max(coalition)
+            coalition = rng.choice(len(importance_relation))
+            min_score = importance_relation.min_mask(coalition)
+            max_score = importance_relation.max_mask(coalition)
 
         if self.local:
-            score = importance_relation[coalition]
+            score = importance_relation.scores[coalition]
             available_score = []
             if score > min_score:
                 available_score.append(score - 1)
@@ -340,13 +441,15 @@ class NeighborImportanceRelation[S: RMPModel](Neighbor[S]):
             available_score = list(range(min_score, max_score + 1))
 
         score = rng.choice(available_score)
-        importance_relation[coalition] = score
+        importance_relation.scores[coalition] = score
 
         return replace(sol, importance_relation=importance_relation)
 
 
 @dataclass
-class NeighborLexOrder[S: SRMPModel | RMPModel](Neighbor[S], Dataclass):
+class NeighborLexOrder[S: SRMPModel | RMPModel | ArraySRMPModel](
+    Neighbor[S], Dataclass
+):
     local: bool = False
 
     def __call__(self, sol: S, rng: RNGParam = None):
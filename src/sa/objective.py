@@ -1,11 +1,26 @@
 from abc import ABC, abstractmethod
+from collections import OrderedDict
+from enum import auto
+from typing import Any
 
+import numpy as np
+import numpy.typing as npt
 from mcda.relations import PreferenceStructure
 
+from src.case_insensitive_str_enum import CaseInsensitiveStrEnum
 from src.dataclass import Dataclass, dataclass, field
 from src.model import Model
 from src.performance_table.type import PerformanceTableType
-from src.preference_structure.fitness import comparisons_ranking
+from src.preference_structure.fitness import CompiledComparisons, StackedComparisons
+from src.srmp.model import ArraySRMPModel, SRMPModel
+from src.srmp.normal_srmp import srmp_nb_violated
+
+from .encoding import model_key
+
+
+class ObjectiveBackendEnum(CaseInsensitiveStrEnum):
+    NUMPY = auto()
+    NUMBA = auto()
 
 
 class Objective[S](ABC):
@@ -16,14 +31,95 @@ class Objective[S](ABC):
     @abstractmethod
     def optimum(self) -> float: ...
 
+    def reset_stats(self):
+        """Reset the statistics reported with the result of a search."""
+
+    def stats(self) -> dict[str, Any]:
+        return {}
+
 
 @dataclass
 class FitnessObjective(Objective[Model], Dataclass):
     train_data: PerformanceTableType
     target: PreferenceStructure
+    incremental: bool = False
+    backend: ObjectiveBackendEnum = ObjectiveBackendEnum.NUMPY
+
+    def __post_init__(self):
+        if self.incremental and (self.backend is ObjectiveBackendEnum.NUMBA):
+            raise ValueError("Numba objective cannot be incremental")
+        self.comparisons = CompiledComparisons(
+            self.target,
+            self.train_data.alternatives,  # type: ignore
+        )
+        self.values = np.ascontiguousarray(
+            self.train_data.data.to_numpy(), dtype=np.float64
+        )
+        self.ranking: Any = None
+        self.violated = np.zeros(len(self.comparisons.data), dtype=np.bool)
+        self.nb_violated = 0
 
     def __call__(self, sol: Model):
-        return 1 - sol.fitness(self.train_data, self.target)
+        if self.incremental:
+            return self.violations(sol) / len(self.comparisons)
+        if self.backend is ObjectiveBackendEnum.NUMBA:
+            return self.violations_numba(sol) / len(self.comparisons)
+        return self.comparisons.nb_violated(sol.rank_numpy(self.train_data)) / len(
+            self.comparisons
+        )
+
+    def violations_numba(self, sol: Model) -> int:
+        match sol:
+            case ArraySRMPModel():
+                profiles = sol.profiles
+            case SRMPModel():
+                profiles = sol.profiles.data.to_numpy()
+            case _:
+                raise TypeError(f"{sol.__class__.__name__} has no numba objective")
+        return srmp_nb_violated(
+            self.values,
+            self.comparisons.data,
+            sol.weights,
+            profiles,
+            np.asarray(sol.lexicographic_order, dtype=np.int_),
+        )
+
+    def violated_comparisons(self, indices: npt.NDArray[np.int_]):
+        comparison = self.ranking.compare(
+            self.comparisons.a[indices], self.comparisons.b[indices]
+        )
+        return np.where(
+            self.comparisons.indifference[indices], comparison != 0, comparison <= 0
+        )
+
+    def violations(self, sol: Model):
+        """Count violated comparisons, only reevaluating comparisons involving
+        alternatives whose scores changed since the previous call.
+
+        :param sol:
+        :return:
+        """
+        if self.ranking is None:
+            self.ranking = sol.incremental_ranking(self.train_data)
+            changed = None
+        else:
+            changed = self.ranking.update(sol)
+
+        if changed is None:
+            self.violated = self.violated_comparisons(
+                np.arange(len(self.comparisons.data))
+            )
+            self.nb_violated = int(np.count_nonzero(self.violated))
+        else:
+            touched = np.nonzero(
+                changed[self.comparisons.a] | changed[self.comparisons.b]
+            )[0]
+            violated = self.violated_comparisons(touched)
+            self.nb_violated += int(
+                np.count_nonzero(violated) - np.count_nonzero(self.violated[touched])
+            )
+            self.violated[touched] = violated
+        return self.nb_violated
 
     @property
     def optimum(self):
@@ -38,6 +134,7 @@ class CollectiveObjective(Objective[Model], Dataclass):
     comparisons_accepted: PreferenceStructure
     comparisons_refused: PreferenceStructure
     comparisons_past: list[PreferenceStructure]
+    incremental: bool = False
     M: int = field(init=False)
     nb_DM: int = field(init=False)
 
@@ -45,34 +142,124 @@ class CollectiveObjective(Objective[Model], Dataclass):
         self.M = max(len(comp) for comp in self.comparisons)  # type: ignore
         self.nb_DM = len(self.comparisons)
 
+        # Groups: accepted, refused, past refused sets, then DMs comparisons
+        alternatives = self.performance_table.alternatives
+        self.stacked = StackedComparisons([
+            CompiledComparisons(comp, alternatives)  # type: ignore
+            for comp in [
+                self.comparisons_accepted,
+                self.comparisons_refused,
+                *self.comparisons_past,
+            ]
+            + self.comparisons
+        ])
+        self.nb_past = len(self.comparisons_past)
+        self.changes = np.array(self.preferences_changes, dtype=np.int_)
+        self.ranking: Any = None
+        self.violated = np.zeros(len(self.stacked.data), dtype=np.bool)
+        self.counts = np.zeros(self.stacked.nb_groups, dtype=np.int_)
+
     def __call__(self, sol: Model):
-        result = 0
+        counts = (
+            self.violations(sol)
+            if self.incremental
+            else self.stacked.nb_violated_groups(
+                sol.rank_numpy(self.performance_table)
+            )
+        )
+        penalty = self.M**self.nb_DM
 
-        ranks = sol.rank_series(self.performance_table).to_dict()
+        not_accepted = counts[0]
+        still_refused = self.stacked.sizes[1] - counts[1]
+        past_not_refused = np.count_nonzero(counts[2 : 2 + self.nb_past] == 0)
+        result = int(not_accepted + still_refused + past_not_refused) * penalty
 
-        if not_accepted := comparisons_ranking(self.comparisons_accepted, ranks):
-            result += len(not_accepted) * self.M**self.nb_DM
+        tup = np.sort(self.changes + counts[2 + self.nb_past :])
+        result += sum(int(x) * self.M**i for (i, x) in enumerate(tup))
+        return result
 
-        if set(self.comparisons_refused) != set(
-            refused := comparisons_ranking(self.comparisons_refused, ranks)
-        ):
-            result += (
-                len(self.comparisons_refused) - len(refused)
-            ) * self.M**self.nb_DM
+    def violated_comparisons(self, indices: npt.NDArray[np.int_]):
+        comparison = self.ranking.compare(
+            self.stacked.a[indices], self.stacked.b[indices]
+        )
+        return np.where(
+            self.stacked.indifference[indices], comparison != 0, comparison <= 0
+        )
 
-        for refused_set in self.comparisons_past:
-            if not comparisons_ranking(refused_set, ranks):
-                result += self.M**self.nb_DM
+    def violations(self, sol: Model):
+        """Count violated comparisons per group, only reevaluating comparisons
+        involving alternatives whose scores changed since the previous call.
 
-        tup = sorted(
-            self.preferences_changes[dm]
-            + len(comparisons_ranking(self.comparisons[dm], ranks))
-            for dm in range(self.nb_DM)
-        )
-        result += sum(x * self.M**i for (i, x) in enumerate(tup))
-        # result = tup[-1]
-        return result
+        :param sol:
+        :return:
+        """
+        if self.ranking is None:
+            self.ranking = sol.incremental_ranking(self.performance_table)
+            changed = None
+        else:
+            changed = self.ranking.update(sol)
+
+        if changed is None:
+            self.violated = self.violated_comparisons(
+                np.arange(len(self.stacked.data))
+            )
+            self.counts = self.stacked.group_counts(self.violated)
+        else:
+            touched = np.nonzero(changed[self.stacked.a] | changed[self.stacked.b])[0]
+            violated = self.violated_comparisons(touched)
+            self.counts += self.stacked.group_counts(touched[violated])
+            self.counts -= self.stacked.group_counts(touched[self.violated[touched]])
+            self.violated[touched] = violated
+        return self.counts
 
     @property
     def optimum(self):
         return 0
+
+
+@dataclass
+class CachedObjective[S](Objective[S], Dataclass):
+    """This class caches the values of an objective, keyed by a hash of the
+    model arrays.
+
+    The least recently used values are evicted beyond `max_size` entries.
+
+    :param objective:
+    :param max_size: maximum number of cached values
+    """
+
+    objective: Objective[S]
+    max_size: int = 100_000
+
+    def __post_init__(self):
+        self.cache: OrderedDict[bytes, float] = OrderedDict()
+        self.reset_stats()
+
+    def __call__(self, sol: S):
+        key = model_key(sol)  # type: ignore
+        if (value := self.cache.get(key)) is not None:
+            self.hits += 1
+            self.cache.move_to_end(key)
+            return value
+
+        self.misses += 1
+        value = self.objective(sol)
+        self.cache[key] = value
+        if len(self.cache) > self.max_size:
+            self.cache.popitem(last=False)
+        return value
+
+    @property
+    def optimum(self):
+        return self.objective.optimum
+
+    def reset_stats(self):
+        self.hits = 0
+        self.misses = 0
+        self.objective.reset_stats()
+
+    def stats(self):
+        return self.objective.stats() | {
+            "Cache_hits": self.hits,
+            "Cache_misses": self.misses,
+        }
@@ -1,4 +1,4 @@
-from time import thread_time
+from math import nan
 
 from src.dataclass import dataclass
 from src.random import RNG
@@ -11,7 +11,7 @@ class RandomWalk[S](Iterative[S]):
     def main_loop(self, rng: RNG):
         while not self.stop():
             # New iteration
-            self.time = thread_time() - self.start_time
+            self.time = self.elapsed()
             self.it += 1
             self.non_improving_it += 1
 
@@ -19,15 +19,26 @@ class RandomWalk[S](Iterative[S]):
             self.current_sol = self.neighbor(self.current_sol, rng)
             self.current_obj = self.objective(self.current_sol)
 
-            if self.verbose:
-                with self.log_writer() as log_writer:
-                    log_writer.writerow(
-                        self.LogFields(
-                            It=self.it,
-                            Non_improving_it=self.non_improving_it,
-                            Time=self.time,
-                            Current_sol=self.current_sol,
-                            Current_obj=self.current_obj,
-                        )
+            if self.log:
+                self.log.writerow(
+                    self.LogFields(
+                        It=self.it,
+                        Non_improving_it=self.non_improving_it,
+                        Time=self.time,
+                        Current_sol=self.current_sol,
+                        Current_obj=self.current_obj,
                     )
+                )
+
+            if self.tracer:
+                self.tracer.record(
+                    self.it,
+                    self.time,
+                    nan,
+                    self.current_obj,
+                    self.current_obj,
+                    self.best_obj,
+                    self.neighbor.move,
+                    True,
+                )
         return self.current_sol
@@ -0,0 +1,173 @@
+"""This module implements a replica-exchange (parallel tempering) learner.
+
+Each replica is a :class:`SimulatedAnnealing` chain running in its own
+process at one temperature of a ladder. At regular intervals, neighbouring
+replicas exchange their temperatures with the Metropolis criterion, which is
+equivalent to exchanging their states. The statistics of the Markov chains,
+used by the cooling schedules, are exchanged with the temperatures. Only
+temperatures, chains statistics and objective values transit between
+processes during the search, and the best model at the end.
+"""
+
+from dataclasses import InitVar, field
+from math import exp
+from multiprocessing import Pipe, Process
+from multiprocessing.connection import Connection
+from typing import Any, NamedTuple
+
+from mcda.internal.core.interfaces import Learner
+
+from src.dataclass import Dataclass, dataclass
+from src.random import RNGParam, rng_
+
+from .cooling_schedule import Chain
+from .sa import SimulatedAnnealing
+
+
+class ReplicaState(NamedTuple):
+    temp: float
+    chain: Chain
+    current_obj: float
+    best_obj: float
+    it: int
+    time: float
+    stopped: bool
+
+
+def replica_worker[S](
+    replica: SimulatedAnnealing[S], nb_it: int, connection: Connection
+):
+    """Run a replica, waiting for a temperature and the statistics of its
+    Markov chains before each exchange interval.
+
+    After ``None`` is received, the best solution is sent if requested.
+
+    :param replica:
+    :param nb_it: number of iterations between exchanges
+    :param connection:
+    """
+    with replica.writers():
+        replica.init(replica.init_sol)
+        while (received := connection.recv()) is not None:
+            replica.temp, replica.chain = received
+            stopped = replica.anneal(replica._rng, nb_it)  # type: ignore
+            connection.send(
+                ReplicaState(
+                    replica.temp,
+                    replica.chain,
+                    replica.current_obj,
+                    replica.best_obj,
+                    replica.it,
+                    replica.time,
+                    stopped,
+                )
+            )
+    if connection.recv():
+        connection.send(replica.best_sol)
+    connection.close()
+
+
+def ladder_temperatures(T0: float, ratio: float, nb_replicas: int):
+    """Geometric temperature ladder, from the hottest to the coldest."""
+    return [T0 * ratio**i for i in range(nb_replicas)]
+
+
+@dataclass
+class ReplicaExchange[S](Learner[S], Dataclass):
+    """This class runs simulated annealing replicas in parallel, exchanging
+    temperatures between neighbouring replicas.
+
+    The initial temperatures of the replicas define the ladder.
+
+    :param replicas:
+    :param exchange_interval: number of iterations between exchanges
+    :param rng:
+    """
+
+    replicas: list[SimulatedAnnealing[S]]
+    exchange_interval: int = 100
+    rng: InitVar[RNGParam] = None
+    nb_swaps: int = field(default=0, init=False)
+    nb_swaps_attempted: int = field(default=0, init=False)
+
+    def __post_init__(self, rng: RNGParam):
+        self._rng = rng_(rng)
+
+    def swap(self, states: list[ReplicaState], ladder: list[int], parity: int):
+        """Attempt exchanges between neighbouring temperatures of the ladder.
+
+        :param states: states of the replicas
+        :param ladder: replicas sorted by decreasing temperature
+        :param parity: parity of the first ladder position of the pairs
+        :return: temperatures and chains statistics of the replicas
+        """
+        temps = [state.temp for state in states]
+        chains = [state.chain for state in states]
+        for p in range(parity, len(ladder) - 1, 2):
+            i, j = ladder[p], ladder[p + 1]
+            self.nb_swaps_attempted += 1
+            try:
+                prob = exp(
+                    (states[i].current_obj - states[j].current_obj)
+                    * (1 / temps[i] - 1 / temps[j])
+                )
+            except (OverflowError, ZeroDivisionError):
+                prob = 1
+            if prob >= 1 or self._rng.random() < prob:
+                self.nb_swaps += 1
+                temps[i], temps[j] = temps[j], temps[i]
+                chains[i], chains[j] = chains[j], chains[i]
+                ladder[p], ladder[p + 1] = j, i
+        return list(zip(temps, chains))
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "Swaps": self.nb_swaps,
+            "Swaps_attempted": self.nb_swaps_attempted,
+        }
+
+    def learn(self):
+        connections: list[Connection] = []
+        processes: list[Process] = []
+        for replica in self.replicas:
+            parent_connection, child_connection = Pipe()
+            process = Process(
+                target=replica_worker,
+                args=(replica, self.exchange_interval, child_connection),
+                daemon=True,
+            )
+            process.start()
+            child_connection.close()
+            connections.append(parent_connection)
+            processes.append(process)
+
+        temps = [replica.T0 for replica in self.replicas]
+        ladder = sorted(range(len(temps)), key=lambda i: -temps[i])
+        thermostats = [(T0, Chain(start_temp=T0)) for T0 in temps]
+        parity = 0
+        try:
+            while True:
+                for connection, thermostat in zip(connections, thermostats):
+                    connection.send(thermostat)
+                states: list[ReplicaState] = [
+                    connection.recv() for connection in connections
+                ]
+                if any(state.stopped for state in states):
+                    break
+                thermostats = self.swap(states, ladder, parity)
+                parity = 1 - parity
+
+            self.best_obj = min(state.best_obj for state in states)
+            self.time = max(state.time for state in states)
+            self.it = sum(state.it for state in states)
+            best = min(range(len(states)), key=lambda i: states[i].best_obj)
+            for i, connection in enumerate(connections):
+                connection.send(None)
+                connection.send(i == best)
+            self.best_sol: S = connections[best].recv()
+        finally:
+            for connection in connections:
+                connection.close()
+            for process in processes:
+                process.join()
+        return self.best_sol
@@ -1,22 +1,37 @@
 from dataclasses import field
-from math import exp
-from time import thread_time
+from math import ceil, exp
 from typing import ClassVar
 
 from src.dataclass import dataclass
 from src.random import RNG
 from src.utils import none_guard
 
-from .cooling_schedule import CoolingSchedule
+from .cooling_schedule import Chain, CoolingSchedule
 from .iterative import Iterative
 
 
 @dataclass
 class SimulatedAnnealing[S](Iterative[S]):
+    """This class implements simulated annealing.
+
+    :param T0: initial temperature
+    :param L: length of Markov chains
+    :param cooling_schedule:
+    :param Tf: final temperature
+    :param L_max: if supplied, Markov chains grow up to `L_max` as the
+        acceptance rate drops, their length being `L` over the acceptance rate
+    :param reheat: if supplied, number of non improving iterations before
+        reheating
+    :param reheat_ratio: reheating temperature relatively to `T0`
+    """
+
     T0: float = 1
     L: int = 1
     cooling_schedule: CoolingSchedule = field(default_factory=CoolingSchedule)
     Tf: float | None = None
+    L_max: int | None = None
+    reheat: int | None = None
+    reheat_ratio: float = 0.5
     stopping_criteria_dict: ClassVar[dict[str, str]] = (
         Iterative.stopping_criteria_dict | {"Tf": "stop_temp"}
     )
@@ -33,63 +48,144 @@ class SimulatedAnnealing[S](Iterative[S]):
     def init(self, initial_sol: S):
         super().init(initial_sol)
         self.temp = self.T0
+        self.chain = Chain(start_temp=self.T0)
+        self.chain_length = self.L
+        self.nb_accepted = 0
+        self.nb_reheats = 0
+        self.reheat_it = 0
+
+    def step(self, rng: RNG):
+        """Run one iteration of the Metropolis algorithm at the current
+        temperature.
+
+        :param rng:
+        :return: ``True`` if the optimum is reached
+        """
+        # New iteration
+        self.time = self.elapsed()
+        self.it += 1
+        self.non_improving_it += 1
+
+        # Neighbor model
+        neighbor_sol = self.neighbor(self.current_sol, rng)
+        neighbor_obj = self.objective(neighbor_sol)
+
+        if self.log:
+            self.log.writerow(
+                self.LogFields(
+                    It=self.it,
+                    Non_improving_it=self.non_improving_it,
+                    Time=self.time,
+                    Temp=self.temp,
+                    Neighbor_sol=neighbor_sol,
+                    Current_sol=self.current_sol,
+                    Best_sol=self.best_sol,
+                    Neighbor_obj=neighbor_obj,
+                    Current_obj=self.current_obj,
+                    Best_obj=self.best_obj,
+                )
+            )
+
+        prob: float
+        if neighbor_obj <= self.current_obj:
+            prob = 1
+        else:
+            try:
+                prob = exp((self.current_obj - neighbor_obj) / self.temp)
+            except (OverflowError, ZeroDivisionError):
+                prob = 0
+
+        accepted = prob >= 1 or rng.random() < prob
+        self.neighbor.feedback(accepted, neighbor_obj < self.current_obj)
+        improved = False
+        if accepted:
+            self.nb_accepted += 1
+            self.current_sol = neighbor_sol
+            self.current_obj = neighbor_obj
+
+            # New best
+            if self.current_obj < self.best_obj:
+                improved = True
+                self.non_improving_it = 0
+                self.best_sol = self.current_sol
+                self.best_obj = self.current_obj
+
+        if self.tracer:
+            self.tracer.record(
+                self.it,
+                self.time,
+                self.temp,
+                neighbor_obj,
+                self.current_obj,
+                self.best_obj,
+                self.neighbor.move,
+                accepted,
+                improved,
+            )
+
+        # Stop when optimum reached
+        if improved and self.best_obj <= self.objective.optimum:
+            return True
+
+        # Update time
+        self.time = self.elapsed()
+        return False
+
+    def next_chain(self, acceptance_rate: float):
+        """Update the temperature and the length of Markov chains after a
+        chain.
+
+        :param acceptance_rate: acceptance rate of the chain
+        """
+        self.chain = self.chain._replace(
+            index=self.chain.index + 1, acceptance_rate=acceptance_rate
+        )
+        self.temp = self.cooling_schedule(self.temp, self.chain)
+
+        # Reheating
+        if (
+            self.reheat is not None
+            and self.non_improving_it >= self.reheat
+            and self.it - self.reheat_it >= self.reheat
+        ):
+            self.temp = self.reheat_ratio * self.T0
+            self.chain = Chain(start_temp=self.temp)
+            self.nb_reheats += 1
+            self.reheat_it = self.it
+
+        # Chain length
+        if self.L_max is not None:
+            self.chain_length = (
+                min(ceil(self.L / acceptance_rate), self.L_max)
+                if acceptance_rate > 0
+                else self.L_max
+            )
+
+    def anneal(self, rng: RNG, nb_it: int | None = None):
+        """Run Markov chains, updating the temperature after each one, until a
+        stopping criterion is met.
+
+        :param rng:
+        :param nb_it: if supplied, stop after at least `nb_it` iterations
+        :return: ``True`` if a stopping criterion is met
+        """
+        it = 0
+        while not self.stop():
+            if nb_it is not None and it >= nb_it:
+                return False
+            chain_length = self.chain_length
+            nb_accepted = self.nb_accepted
+            for _ in range(chain_length):
+                if self.step(rng):
+                    return True
+            it += chain_length
+
+            self.next_chain((self.nb_accepted - nb_accepted) / chain_length)
+        return True
+
+    def stats(self):
+        return super().stats() | {"Reheats": self.nb_reheats}
 
     def main_loop(self, rng: RNG):
-        while not self.stop():
-            for _ in range(self.L):
-                # New iteration
-                self.time = thread_time() - self.start_time
-                self.it += 1
-                self.non_improving_it += 1
-
-                # Neighbor model
-                neighbor_sol = self.neighbor(self.current_sol, rng)
-                neighbor_obj = self.objective(neighbor_sol)
-
-                if self.verbose:
-                    with self.log_writer() as log_writer:
-                        log_writer.writerow(
-                            self.LogFields(
-                                It=self.it,
-                                Non_improving_it=self.non_improving_it,
-                                Time=self.time,
-                                Temp=self.temp,
-                                Neighbor_sol=neighbor_sol,
-                                Current_sol=self.current_sol,
-                                Best_sol=self.best_sol,
-                                Neighbor_obj=neighbor_obj,
-                                Current_obj=self.current_obj,
-                                Best_obj=self.best_obj,
-                            )
-                        )
-
-                prob: float
-                if neighbor_obj <= self.current_obj:
-                    prob = 1
-                else:
-                    try:
-                        prob = exp((self.current_obj - neighbor_obj) / self.temp)
-                    except (OverflowError, ZeroDivisionError):
-                        prob = 0
-
-                if prob >= 1 or rng.random() < prob:
-                    # Accepted
-                    current_sol = neighbor_sol
-                    current_obj = neighbor_obj
-
-                    # New best
-                    if current_obj < self.best_obj:
-                        self.non_improving_it = 0
-                        self.best_sol = current_sol
-                        self.best_obj = current_obj
-
-                        # Stop when optimum reached
-                        if self.best_obj <= self.objective.optimum:
-                            return self.best_sol
-
-                # Update time
-                self.time = thread_time() - self.start_time
-
-            # Update temperature
-            self.temp = self.cooling_schedule(self.temp)
+        self.anneal(rng)
         return self.best_sol
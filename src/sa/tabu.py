@@ -0,0 +1,145 @@
+from math import nan
+from typing import Any, NamedTuple
+
+import numpy as np
+import numpy.typing as npt
+
+from src.dataclass import dataclass
+from src.random import RNG
+
+from .encoding import encode_model
+from .iterative import Iterative
+
+
+class Candidate(NamedTuple):
+    index: int
+    sol: Any
+    obj: float
+    encoding: npt.NDArray[Any]
+    attribute: frozenset[int]
+
+
+@dataclass
+class TabuSearch[S](Iterative[S]):
+    """This class implements a tabu search over sampled neighborhoods.
+
+    The attribute of a move is the set of positions of the model encoding it
+    changes (a profile value, weights or swapped lexicographic positions).
+    Moves on an attribute are tabu during `tenure` iterations, unless they
+    improve the best solution (aspiration).
+
+    :param tenure: number of iterations a move attribute stays tabu
+    :param nb_candidates: number of neighbors sampled at each iteration
+    """
+
+    tenure: int = 10
+    nb_candidates: int = 20
+
+    def init(self, initial_sol: S):
+        super().init(initial_sol)
+        self.tabu: dict[frozenset[int], int] = {}
+        self.current_encoding = encode_model(initial_sol)  # type: ignore
+
+    def is_tabu(self, attribute: frozenset[int]):
+        return self.tabu.get(attribute, 0) > self.it
+
+    def step(self, rng: RNG):
+        """Move to the best allowed neighbor among sampled candidates.
+
+        :param rng:
+        :return: ``True`` if the optimum is reached
+        """
+        # New iteration
+        self.time = self.elapsed()
+        self.it += 1
+        self.non_improving_it += 1
+
+        # Candidates
+        best: Candidate | None = None
+        moves: list[tuple[int, float]] = []
+        for i in range(self.nb_candidates):
+            neighbor_sol = self.neighbor(self.current_sol, rng)
+            neighbor_obj = self.objective(neighbor_sol)
+            moves.append((self.neighbor.move, neighbor_obj))
+            encoding = encode_model(neighbor_sol)  # type: ignore
+            attribute = frozenset(
+                np.flatnonzero(encoding != self.current_encoding).tolist()
+            )
+            if (self.is_tabu(attribute) and neighbor_obj >= self.best_obj) or (
+                best is not None and neighbor_obj >= best.obj
+            ):
+                continue
+            best = Candidate(i, neighbor_sol, neighbor_obj, encoding, attribute)
+
+        # Only the best allowed candidate is accepted
+        for i, (move, neighbor_obj) in enumerate(moves):
+            self.neighbor.move = move
+            self.neighbor.feedback(
+                best is not None and i == best.index, neighbor_obj < self.current_obj
+            )
+
+        if best is None:
+            self.time = self.elapsed()
+            return False
+
+        _, neighbor_sol, neighbor_obj, encoding, attribute = best
+        move = moves[best.index][0]
+
+        if self.log:
+            self.log.writerow(
+                self.LogFields(
+                    It=self.it,
+                    Non_improving_it=self.non_improving_it,
+                    Time=self.time,
+                    Neighbor_sol=neighbor_sol,
+                    Current_sol=self.current_sol,
+                    Best_sol=self.best_sol,
+                    Neighbor_obj=neighbor_obj,
+                    Current_obj=self.current_obj,
+                    Best_obj=self.best_obj,
+                )
+            )
+
+        # Move
+        self.tabu[attribute] = self.it + self.tenure
+        self.current_sol = neighbor_sol
+        self.current_obj = neighbor_obj
+        self.current_encoding = encoding
+
+        # New best
+        improved = self.current_obj < self.best_obj
+        if improved:
+            self.non_improving_it = 0
+            self.best_sol = self.current_sol
+            self.best_obj = self.current_obj
+
+        if self.tracer:
+            self.tracer.record(
+                self.it,
+                self.time,
+                nan,
+                neighbor_obj,
+                self.current_obj,
+                self.best_obj,
+                move,
+                True,
+                improved,
+            )
+
+        # Forget expired attributes
+        if len(self.tabu) > 2 * self.tenure:
+            self.tabu = {k: v for k, v in self.tabu.items() if v > self.it}
+
+        # Stop when optimum reached
+        if improved and self.best_obj <= self.objective.optimum:
+            return True
+
+        # Update time
+        self.time = self.elapsed()
+        return False
+
+    def main_loop(self, rng: RNG):
+        while not self.stop():
+            if self.step(rng):
+                break
+        return self.best_sol
@@ -0,0 +1,134 @@
+"""This module implements binary traces of iterative searches.
+
+A trace file starts with a magic string and the JSON description of its
+columns. It is followed by chunks, each one made of its number of records
+and of the contiguous values of every column.
+"""
+
+import json
+from pathlib import Path
+from typing import Any, BinaryIO, Self
+
+import numpy as np
+import numpy.typing as npt
+
+from src.dataclass import Dataclass, dataclass
+
+MAGIC = b"SATRACE1"
+
+TRACE_DTYPE = np.dtype([
+    ("it", np.int64),
+    ("time", np.float64),
+    ("temp", np.float64),
+    ("neighbor_obj", np.float64),
+    ("current_obj", np.float64),
+    ("best_obj", np.float64),
+    ("move", np.int8),
+    ("accepted", np.bool),
+])
+
+
+@dataclass
+class TraceConfig(Dataclass):
+    """This class configures the trace of a search.
+
+    :param path: trace file
+    :param every: record one iteration out of `every`
+    :param on_improvement: also record iterations improving the best solution
+    :param chunk_size: number of records buffered before writing
+    """
+
+    path: Path
+    every: int = 1
+    on_improvement: bool = True
+    chunk_size: int = 1 << 16
+
+
+class TraceWriter:
+    """This class writes a trace, opening its file once and writing records
+    by chunks.
+
+    :param config:
+    """
+
+    def __init__(self, config: TraceConfig):
+        self.config = config
+        self.records: list[tuple[Any, ...]] = []
+        self.file: BinaryIO | None = None
+
+    def __enter__(self) -> Self:
+        self.file = self.config.path.open("wb")
+        header = json.dumps(TRACE_DTYPE.descr).encode()
+        self.file.write(MAGIC)
+        self.file.write(np.uint32(len(header)).tobytes())
+        self.file.write(header)
+        return self
+
+    def __exit__(self, *args: Any):
+        self.flush()
+        if self.file:
+            self.file.close()
+            self.file = None
+
+    def record(
+        self,
+        it: int,
+        time: float,
+        temp: float,
+        neighbor_obj: float,
+        current_obj: float,
+        best_obj: float,
+        move: int,
+        accepted: bool,
+        improved: bool = False,
+    ):
+        if it % self.config.every == 0 or (improved and self.config.on_improvement):
+            self.records.append((
+                it,
+                time,
+                temp,
+                neighbor_obj,
+                current_obj,
+                best_obj,
+                move,
+                accepted,
+            ))
+            if len(self.records) >= self.config.chunk_size:
+                self.flush()
+
+    def flush(self):
+        if not self.records or self.file is None:
+            return
+        chunk = np.array(self.records, dtype=TRACE_DTYPE)
+        self.file.write(np.int64(len(chunk)).tobytes())
+        for name in TRACE_DTYPE.names or ():
+            self.file.write(np.ascontiguousarray(chunk[name]).tobytes())
+        self.records.clear()
+
+
+def read_trace(path: Path) -> npt.NDArray[np.void]:
+    """Load a trace.
+
+    :param path:
+    :return: structured array of the records, with one field per column
+    """
+    with path.open("rb") as f:
+        if f.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"{path} is not a trace file")
+        header_size = int(np.frombuffer(f.read(4), np.uint32)[0])
+        dtype = np.dtype([
+            (name, type_) for name, type_ in json.loads(f.read(header_size))
+        ])
+
+        chunks: list[npt.NDArray[np.void]] = []
+        while size_bytes := f.read(8):
+            size = int(np.frombuffer(size_bytes, np.int64)[0])
+            chunk = np.empty(size, dtype)
+            for name in dtype.names or ():
+                column_dtype = dtype[name]
+                chunk[name] = np.frombuffer(
+                    f.read(size * column_dtype.itemsize), column_dtype
+                )
+            chunks.append(chunk)
+
+    return np.concatenate(chunks) if chunks else np.empty(0, dtype)
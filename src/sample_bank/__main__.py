@@ -0,0 +1,10 @@
+from src.random import rng_
+
+from .args import ARGS
+from .bank import SampleBank
+from .generate import generate_sample_bank
+
+bank = SampleBank(ARGS.path)
+
+for m, rng in zip(ARGS.m, rng_(ARGS.seed).spawn(len(ARGS.m))):
+    generate_sample_bank(bank, m, ARGS.n, rng, ARGS.kinds)
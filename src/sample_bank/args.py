@@ -0,0 +1,32 @@
+import argparse
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from ..dataclass import Dataclass
+from .bank import SampleEnum
+
+parser = argparse.ArgumentParser()
+parser.add_argument("path", type=Path, help="Sample bank directory")
+parser.add_argument("m", nargs="+", type=int, help="Numbers of criteria")
+parser.add_argument("-n", type=int, default=10_000, help="Number of samples")
+parser.add_argument(
+    "--kinds",
+    nargs="*",
+    default=[],
+    type=SampleEnum,
+    choices=SampleEnum,
+    help="Pools to generate",
+)
+parser.add_argument("-s", "--seed", type=int, help="Random seed")
+
+
+@dataclass(init=False)
+class Arguments(Dataclass):
+    path: Path
+    m: list[int]
+    n: int
+    kinds: list[SampleEnum] = field(default_factory=list)
+    seed: int | None = None
+
+
+ARGS = parser.parse_args(namespace=Arguments())
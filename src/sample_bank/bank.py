@@ -0,0 +1,97 @@
+from enum import auto
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import numpy.typing as npt
+
+from src.case_insensitive_str_enum import CaseInsensitiveStrEnum
+from src.random import RNGParam, rng_
+
+
+class SampleEnum(CaseInsensitiveStrEnum):
+    LINEXT = auto()
+    WEAK_ORDER_EXT = auto()
+    WEIGHTS = auto()
+
+
+class SampleBank:
+    """This class serves random samples drawn from pre-generated pools.
+
+    Each pool is stored as ``<kind>_<m>.npy``, one sample per row, alongside
+    ``<kind>_<m>_seeds.npy`` holding the seed each row was generated with.
+    Pools are memory-mapped when first used.
+
+    * linear extensions: subsets bitmasks from the least to the most important
+    * weak order extensions: importance scores indexed by subset bitmask
+    * weights: criteria weights
+
+    :param path: directory of the pools
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.pools: dict[tuple[SampleEnum, int], npt.NDArray[Any] | None] = {}
+
+    def filename(self, kind: SampleEnum, m: int):
+        return self.path / f"{kind}_{m}.npy"
+
+    def seeds_filename(self, kind: SampleEnum, m: int):
+        return self.path / f"{kind}_{m}_seeds.npy"
+
+    def pool(self, kind: SampleEnum, m: int):
+        if (kind, m) not in self.pools:
+            filename = self.filename(kind, m)
+            self.pools[kind, m] = (
+                np.load(filename, mmap_mode="r") if filename.exists() else None
+            )
+        return self.pools[kind, m]
+
+    def draw(self, kind: SampleEnum, m: int, rng: RNGParam = None):
+        """Draw a sample from a pool.
+
+        :param kind:
+        :param m: number of criteria
+        :param rng:
+        :return: ``None`` if the bank has no such pool
+        """
+        if (pool := self.pool(kind, m)) is None:
+            return None
+        return np.array(pool[rng_(rng).integers(len(pool))])
+
+    def save(
+        self,
+        kind: SampleEnum,
+        m: int,
+        samples: npt.NDArray[Any],
+        seeds: npt.NDArray[np.int64],
+    ):
+        self.path.mkdir(parents=True, exist_ok=True)
+        np.save(self.filename(kind, m), samples)
+        np.save(self.seeds_filename(kind, m), seeds)
+        self.pools.pop((kind, m), None)
+
+
+SAMPLE_BANK: SampleBank | None = None
+
+
+def use_sample_bank(path: Path | None):
+    """Serve random samples from the bank in `path` (``None`` to disable).
+
+    :param path:
+    """
+    global SAMPLE_BANK
+    SAMPLE_BANK = SampleBank(path) if path else None
+
+
+def draw_sample(kind: SampleEnum, m: int, rng: RNGParam = None):
+    """Draw a sample from the active sample bank.
+
+    :param kind:
+    :param m: number of criteria
+    :param rng:
+    :return: ``None`` if no bank is used or it has no such pool
+    """
+    if SAMPLE_BANK is None:
+        return None
+    return SAMPLE_BANK.draw(kind, m, rng)
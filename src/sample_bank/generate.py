@@ -0,0 +1,48 @@
+import numpy as np
+
+from src.julia.function import generate_linext, generate_weak_order_ext
+from src.random import RNGParam, rng_
+from src.rmp.importance_relation import ImportanceRelation, coalition_mask
+from src.srmp.weight import random_weights
+
+from .bank import SampleBank, SampleEnum
+
+
+def generate_sample(kind: SampleEnum, m: int, seed: int):
+    match kind:
+        case SampleEnum.LINEXT:
+            return np.array([
+                coalition_mask(subset) for subset in generate_linext(m, seed)
+            ])
+        case SampleEnum.WEAK_ORDER_EXT:
+            return ImportanceRelation.from_weak_order_ext(
+                m, generate_weak_order_ext(m, seed)
+            ).scores
+        case SampleEnum.WEIGHTS:
+            return random_weights(m, seed)
+
+
+def generate_sample_bank(
+    bank: SampleBank,
+    m: int,
+    n: int,
+    rng: RNGParam = None,
+    kinds: list[SampleEnum] | None = None,
+):
+    """Generate pools of `n` samples for `m` criteria.
+
+    :param bank:
+    :param m: number of criteria
+    :param n: number of samples per pool
+    :param rng:
+    :param kinds: pools to generate (all if not supplied)
+    """
+    rng = rng_(rng)
+    for kind in kinds or list(SampleEnum):
+        seeds = rng.integers(2**63, size=n, dtype=np.int64)
+        bank.save(
+            kind,
+            m,
+            np.stack([generate_sample(kind, m, int(seed)) for seed in seeds]),
+            seeds,
+        )
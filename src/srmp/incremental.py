@@ -0,0 +1,19 @@
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from src.rmp.incremental import IncrementalRanking
+
+from .weight import compute_subset_sum
+
+if TYPE_CHECKING:
+    from .model import SRMPModel
+
+
+class IncrementalSRMP(IncrementalRanking["SRMPModel"]):
+    def update_table(self, model: "SRMPModel", force: bool = False):
+        if not force and np.array_equal(model.weights, self.weights):
+            return False
+        self.weights = np.array(model.weights)
+        self.table = compute_subset_sum(self.weights)
+        return True
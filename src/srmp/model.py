@@ -1,11 +1,18 @@
+from collections.abc import Sequence
 from dataclasses import dataclass, replace
 from enum import auto
-from typing import Self, SupportsIndex
+from typing import Any, Self, SupportsIndex
 
 import numpy as np
 import numpy.typing as npt
 
-from src.model import FrozenModel, GroupModel, Model, ParamFlag
+from src.model import (
+    ExploitationEnum,
+    FrozenModel,
+    GroupModel,
+    Model,
+    ParamFlag,
+)
 from src.performance_table.normal_performance_table import NormalPerformanceTable
 from src.performance_table.type import PerformanceTableType
 from src.random import RNGParam
@@ -19,10 +26,11 @@ from src.rmp.field import (
 )
 from src.rmp.perturbations import PerturbLexOrder, PerturbProfile
 from src.srmp.perturbations import PerturbWeight
-from src.utils import print_list, tolist
+from src.utils import lexicographic_rank, print_list, tolist
 
 from .field import FrozenWeightsField, GroupWeightsField, WeightsField
-from .normal_srmp import NormalSRMP
+from .incremental import IncrementalSRMP
+from .normal_srmp import NormalSRMP, srmp_rank_batch, srmp_scores_batch
 
 
 class SRMPParamFlag(ParamFlag):
@@ -46,14 +54,38 @@ class SRMPModel(
             # print_list(self.lexicographic_order),
         ])
 
-    def rank_numpy(self, performance_table: PerformanceTableType):
+    def rank_numpy(
+        self,
+        performance_table: PerformanceTableType,
+        exploitation: ExploitationEnum = ExploitationEnum.OUTRANKING,
+    ):
         if isinstance(performance_table, NormalPerformanceTable):
             return NormalSRMP(
                 performance_table,
                 self.weights,
                 self.profiles,
                 self.lexicographic_order,
-            ).rank_numpy()
+            ).rank_numpy(exploitation)
+        else:
+            raise TypeError("Performance table not normalized")
+
+    def incremental_ranking(self, performance_table: PerformanceTableType):
+        if isinstance(performance_table, NormalPerformanceTable):
+            return IncrementalSRMP(performance_table, self)
+        else:
+            raise TypeError("Performance table not normalized")
+
+    @classmethod
+    def rank_numpy_batch(
+        cls, models: Sequence[Self], performance_table: PerformanceTableType
+    ):
+        if isinstance(performance_table, NormalPerformanceTable):
+            return srmp_rank_batch(
+                performance_table.data.to_numpy(),
+                np.stack([model.weights for model in models]),
+                np.stack([model.profiles.data.to_numpy() for model in models]),
+                np.array([model.lexicographic_order for model in models]),
+            )
         else:
             raise TypeError("Performance table not normalized")
 
@@ -83,6 +115,10 @@ class SRMPModel(
             lexicographic_order=tuple(self.lexicographic_order),
         )
 
+    @property
+    def array(self):
+        return ArraySRMPModel.from_model(self)
+
 
 @dataclass(frozen=True)
 class FrozenSRMPModel(
@@ -103,6 +139,131 @@ class FrozenSRMPModel(
         new = replace(self, weights=weights)
         return new
 
+    @property
+    def array(self):
+        return ArraySRMPModel(
+            profiles=np.array(self.profiles),
+            weights=np.array(self.weights),
+            lexicographic_order=np.array(self.lexicographic_order),
+        )
+
+
+@dataclass(slots=True)
+class ArraySRMPModel(Model):
+    """This class implements an SRMP model stored as contiguous arrays.
+
+    The arrays are read-only so that neighbors share the parameters they do
+    not modify (copy-on-write). Its JSON form is the one of :class:`SRMPModel`.
+
+    :param profiles: profiles values (k x m)
+    :param weights: criteria weights (m)
+    :param lexicographic_order: profile indices used sequentially to rank (k)
+    """
+
+    profiles: npt.NDArray[np.float64]
+    weights: npt.NDArray[np.float64]
+    lexicographic_order: npt.NDArray[np.int8]
+
+    def __post_init__(self):
+        self.profiles = np.ascontiguousarray(self.profiles, dtype=np.float64)
+        self.weights = np.ascontiguousarray(self.weights, dtype=np.float64)
+        self.lexicographic_order = np.ascontiguousarray(
+            self.lexicographic_order, dtype=np.int8
+        )
+        for a in (self.profiles, self.weights, self.lexicographic_order):
+            a.flags.writeable = False
+
+    def __str__(self) -> str:
+        return print_list(list(self.weights))
+
+    @classmethod
+    def from_model(cls, model: SRMPModel):
+        return cls(
+            profiles=model.profiles.data.to_numpy(copy=True),
+            weights=np.array(model.weights),
+            lexicographic_order=np.array(model.lexicographic_order),
+        )
+
+    @property
+    def model(self):
+        return SRMPModel(
+            profiles=NormalPerformanceTable(self.profiles),
+            weights=np.array(self.weights),
+            lexicographic_order=tolist(self.lexicographic_order),
+        )
+
+    @property
+    def frozen(self):
+        return FrozenSRMPModel(
+            profiles=tuple(tuple(x) for x in tolist(self.profiles)),  # type: ignore
+            weights=np.array(self.weights),
+            lexicographic_order=tuple(tolist(self.lexicographic_order)),
+        )
+
+    @classmethod
+    def random(cls, *args: Any, **kwargs: Any):
+        return cls.from_model(SRMPModel.random(*args, **kwargs))
+
+    @classmethod
+    def from_reference(cls, other: Self, *args: Any, **kwargs: Any):
+        return cls.from_model(SRMPModel.from_reference(other.model, *args, **kwargs))
+
+    @classmethod
+    def from_json(cls, s: str):
+        return cls.from_model(SRMPModel.from_json(s))
+
+    def to_json(self):
+        return self.model.to_json()
+
+    def replace_profile(self, profile_ind: int, crit_ind: int, value: float):
+        """Return a new model with a profile value changed, the profiles values
+        on this criterion being sorted again.
+
+        :param profile_ind:
+        :param crit_ind:
+        :param value:
+        :return:
+        """
+        profiles = self.profiles.copy()
+        profiles[profile_ind, crit_ind] = value
+        profiles[:, crit_ind].sort()
+        return replace(self, profiles=profiles)
+
+    def rank_numpy(
+        self,
+        performance_table: PerformanceTableType,
+        exploitation: ExploitationEnum = ExploitationEnum.OUTRANKING,
+    ):
+        if isinstance(performance_table, NormalPerformanceTable):
+            scores = srmp_scores_batch(
+                performance_table.data.to_numpy(),
+                self.weights[None],
+                self.profiles[None],
+            )[0]
+            return lexicographic_rank(scores[self.lexicographic_order])
+        else:
+            raise TypeError("Performance table not normalized")
+
+    def incremental_ranking(self, performance_table: PerformanceTableType):
+        if isinstance(performance_table, NormalPerformanceTable):
+            return IncrementalSRMP(performance_table, self)
+        else:
+            raise TypeError("Performance table not normalized")
+
+    @classmethod
+    def rank_numpy_batch(
+        cls, models: Sequence[Self], performance_table: PerformanceTableType
+    ):
+        if isinstance(performance_table, NormalPerformanceTable):
+            return srmp_rank_batch(
+                performance_table.data.to_numpy(),
+                np.stack([model.weights for model in models]),
+                np.stack([model.profiles for model in models]),
+                np.stack([model.lexicographic_order for model in models]),
+            )
+        else:
+            raise TypeError("Performance table not normalized")
+
 
 @dataclass
 class SRMPGroupModelWeightsProfilesLexicographic(
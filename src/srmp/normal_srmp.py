@@ -6,13 +6,101 @@ import numpy.typing as npt
 from mcda.internal.core.scales import NormalScale
 from mcda.outranking.srmp import SRMP, ProfileWiseOutranking
 from mcda.values import Values
+from numba import njit  # type: ignore
 from scipy.stats import rankdata  # pyright: ignore[reportMissingTypeStubs]
 
+from src.model import ExploitationEnum
 from src.performance_table.normal_performance_table import NormalPerformanceTable
+from src.preference_structure.fitness import INDIFFERENCE
+from src.utils import lexicographic_rank
 
 OutrankingMatrix = npt.NDArray[np.bool]
 
 
+def srmp_scores_batch(
+    performance_table: npt.NDArray[np.float64],
+    criteria_weights: npt.NDArray[np.float64],
+    profiles: npt.NDArray[np.float64],
+) -> npt.NDArray[np.float64]:
+    """Compute the concordance scores of several SRMP models at once.
+
+    :param performance_table: alternatives values (n x m)
+    :param criteria_weights: stacked weights (B x m)
+    :param profiles: stacked profiles (B x k x m)
+    :return: concordance scores (B x k x n)
+    """
+    concordances = performance_table >= profiles[:, :, None, :]
+    return np.matmul(concordances, criteria_weights[:, None, :, None])[..., 0]
+
+
+def srmp_rank_batch(
+    performance_table: npt.NDArray[np.float64],
+    criteria_weights: npt.NDArray[np.float64],
+    profiles: npt.NDArray[np.float64],
+    lexicographic_orders: npt.NDArray[np.int_],
+) -> npt.NDArray[np.int_]:
+    """Rank alternatives with several SRMP models at once.
+
+    Alternatives are sorted lexicographically by their concordance scores,
+    without building any outranking matrix.
+
+    :param performance_table: alternatives values (n x m)
+    :param criteria_weights: stacked weights (B x m)
+    :param profiles: stacked profiles (B x k x m)
+    :param lexicographic_orders: stacked lexicographic orders (B x k)
+    :return: dense ranks (B x n)
+    """
+    scores = srmp_scores_batch(performance_table, criteria_weights, profiles)
+    return lexicographic_rank(
+        np.take_along_axis(scores, lexicographic_orders[:, :, None], 1)
+    )
+
+
+@njit(cache=True)  # type: ignore
+def srmp_nb_violated(
+    performance_table: npt.NDArray[np.float64],
+    comparisons: npt.NDArray[np.int_],
+    criteria_weights: npt.NDArray[np.float64],
+    profiles: npt.NDArray[np.float64],
+    lexicographic_order: npt.NDArray[np.int_],
+):
+    """Count the comparisons violated by an SRMP model.
+
+    :param performance_table: alternatives values (n x m)
+    :param comparisons: compiled comparisons (c x 3)
+    :param criteria_weights: weights (m)
+    :param profiles: profiles (k x m)
+    :param lexicographic_order: profile indices used sequentially to rank (k)
+    :return:
+    """
+    n, m = performance_table.shape
+    k = len(lexicographic_order)
+    scores = np.empty((k, n))
+    for h in range(k):
+        profile = profiles[lexicographic_order[h]]
+        for i in range(n):
+            score = 0.0
+            for j in range(m):
+                if performance_table[i, j] >= profile[j]:
+                    score += criteria_weights[j]
+            scores[h, i] = score
+
+    result = 0
+    for c in range(comparisons.shape[0]):
+        a = comparisons[c, 0]
+        b = comparisons[c, 1]
+        comparison = 0
+        for h in range(k):
+            if scores[h, a] != scores[h, b]:
+                comparison = 1 if scores[h, a] > scores[h, b] else -1
+                break
+        if comparisons[c, 2] == INDIFFERENCE:
+            result += comparison != 0
+        else:
+            result += comparison <= 0
+    return result
+
+
 class NormalProfileWiseOutranking(ProfileWiseOutranking):
     """This class infers outranking relations related to a single profile.
 
@@ -36,16 +124,23 @@ class NormalProfileWiseOutranking(ProfileWiseOutranking):
         self.criteria_weights = criteria_weights
         self.profile = profile
 
-    def rank(self, **kwargs: Any):  # type: ignore
-        """Construct an outranking matrix.
+    def scores(self) -> npt.NDArray[np.float64]:
+        """Compute the concordance score of each alternative.
 
         :return:
         """
-        conditional_weighted_sum: npt.NDArray[np.float64] = np.dot(
+        return np.dot(
             self.performance_table.data.values >= self.profile.data.values,
             self.criteria_weights,
         )
 
+    def rank(self, **kwargs: Any):  # type: ignore
+        """Construct an outranking matrix.
+
+        :return:
+        """
+        conditional_weighted_sum = self.scores()
+
         return np.greater_equal.outer(
             conditional_weighted_sum, conditional_weighted_sum
         ).astype(dtype=np.bool)
@@ -87,7 +182,9 @@ class NormalSRMP(SRMP):
             for profile in self.profiles.alternatives
         ]
 
-    def rank_numpy(self):
+    def rank_numpy(self, exploitation: ExploitationEnum = ExploitationEnum.OUTRANKING):
+        if exploitation is ExploitationEnum.SORT:
+            return self.rank_numpy_sort()
         profilewise_outranking_matrices = np.array([
             sub_srmp.rank() for sub_srmp in self.sub_srmp
         ])
@@ -98,3 +195,14 @@ class NormalSRMP(SRMP):
         outranking_matrix = score - score.transpose() >= 0
         scores = outranking_matrix.sum(1)
         return rankdata(-scores, method="dense").astype(np.int_)
+
+    def rank_numpy_sort(self):
+        """Rank alternatives by sorting them lexicographically
+        according to their concordance scores.
+
+        Equivalent to :meth:`rank_numpy` with O(k.n) memory.
+
+        :return:
+        """
+        scores = np.array([sub_srmp.scores() for sub_srmp in self.sub_srmp])
+        return lexicographic_rank(scores[self.lexicographic_order])
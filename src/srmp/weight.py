@@ -1,13 +1,19 @@
+from functools import reduce
+
 import numpy as np
 import numpy.typing as npt
 from more_itertools import powerset
 from scipy.stats import rankdata
 
 from src.random import RNGParam, rng_
+from src.sample_bank.bank import SampleEnum, draw_sample
 from src.utils import tolist
 
 
 def random_weights(nb_crit: int, rng: RNGParam = None):
+    weights = draw_sample(SampleEnum.WEIGHTS, nb_crit, rng)
+    if weights is not None:
+        return weights
     return np.diff(
         np.pad(np.sort(rng_(rng).random(nb_crit - 1)), 1, constant_values=(0, 1))
     )
@@ -18,6 +24,14 @@ def normalize_weights(weights: npt.NDArray[np.float64]):
     return weights
 
 
+def add_subset_sum(subset_sums: npt.NDArray[np.float64], weight: float):
+    return np.concat((subset_sums, np.array([weight]), subset_sums + weight))
+
+
+def compute_subset_sum(weights: npt.NDArray[np.float64]):
+    return np.concat((np.zeros(1), reduce(add_subset_sum, weights, np.empty(0))))
+
+
 def frozen_importance_relation_from_weights(w: npt.NDArray[np.float64]):
     power_sets = powerset(range(len(w)))
     result: list[float] = []
@@ -145,6 +145,36 @@ def tolist(a: npt.NDArray[Any]) -> list[Any]:
     return a.tolist() if a.ndim != 0 else [a.tolist()]
 
 
+def lexicographic_rank(scores: npt.NDArray[Any]) -> npt.NDArray[np.int_]:
+    """Dense ranks of alternatives sorted lexicographically by their scores.
+
+    :param scores: array of shape (..., k, n), keys in decreasing priority
+    :return: array of shape (..., n), rank 1 for the best alternatives
+    """
+    order = np.lexsort(np.moveaxis(-scores, -2, 0)[::-1], axis=-1)
+    scores_sorted = np.take_along_axis(scores, order[..., None, :], -1)
+    new_rank = np.any(scores_sorted[..., 1:] != scores_sorted[..., :-1], axis=-2)
+    ranks_sorted = np.ones(order.shape, dtype=np.int_)
+    ranks_sorted[..., 1:] += np.cumsum(new_rank, axis=-1)
+    ranks = np.empty_like(ranks_sorted)
+    np.put_along_axis(ranks, order, ranks_sorted, -1)
+    return ranks
+
+
+def lexicographic_compare(
+    scores: npt.NDArray[Any], a: npt.NDArray[np.int_], b: npt.NDArray[np.int_]
+) -> npt.NDArray[np.int_]:
+    """Compare alternatives lexicographically by their scores.
+
+    :param scores: array of shape (k, n), keys in decreasing priority
+    :param a: indices of the first alternatives
+    :param b: indices of the second alternatives
+    :return: ``1`` if `a` is ranked before `b`, ``-1`` if after, ``0`` if tied
+    """
+    diff = np.sign(scores[:, a] - scores[:, b]).astype(np.int_)
+    return diff[np.argmax(diff != 0, axis=0), np.arange(diff.shape[1])]
+
+
 def int_to_ind_set(x: int):
     return [i for i in range(x.bit_length()) if (x >> i) & 1]
 
@@ -0,0 +1,25 @@
+import numpy as np
+import pytest
+
+from src.model import ExploitationEnum
+from src.models import GroupModelEnum, ModelEnum, model
+from src.performance_table.normal_performance_table import NormalPerformanceTable
+from src.random import rng_
+
+
+@pytest.mark.parametrize("model_type", [ModelEnum.RMP, ModelEnum.SRMP])
+@pytest.mark.parametrize("k", [1, 3])
+def test_sort_exploitation_matches_outranking(model_type: ModelEnum, k: int):
+    # Few performance values and alternatives drawn with replacement, so that
+    # the rankings contain ties
+    m, n, nb_levels = 4, 12, 4
+    rng = rng_(k)
+    model_class = model(GroupModelEnum[model_type.name], 1)
+    for _ in range(100):
+        M = model_class.random(nb_profiles=k, nb_crit=m, rng=rng)
+        data = rng.integers(0, nb_levels + 1, (n, m)) / nb_levels
+        A = NormalPerformanceTable(data[rng.integers(0, n, n)])
+        assert np.array_equal(
+            M.rank_numpy(A, ExploitationEnum.SORT),
+            M.rank_numpy(A, ExploitationEnum.OUTRANKING),
+        )
@@ -0,0 +1,43 @@
+from collections import Counter
+from math import comb
+
+from src.julia.native import (
+    check_uniformity,
+    nb_linext,
+    native_generate_linext,
+    native_generate_weak_order,
+    uniformity_pvalue,
+)
+
+# Uniform samplers fail with this probability
+ALPHA = 1e-3
+
+
+def nb_weak_orders(m: int) -> int:
+    """Fubini number: weak orders on `m` elements."""
+    a = [1]
+    for n in range(1, m + 1):
+        a.append(sum(comb(n, k) * a[n - k] for k in range(1, n + 1)))
+    return a[m]
+
+
+def test_linext_uniformity():
+    m = 3
+    K = int(nb_linext(m)[0])
+    c = Counter(
+        tuple(map(tuple, native_generate_linext(m, seed))) for seed in range(20 * K)
+    )
+    assert len(c) == K
+    assert uniformity_pvalue(c, K) > ALPHA
+
+
+def test_weak_order_uniformity():
+    m = 3
+    K = nb_weak_orders(m)
+    c = Counter(tuple(native_generate_weak_order(m, seed)) for seed in range(20 * K))
+    assert len(c) == K
+    assert uniformity_pvalue(c, K) > ALPHA
+
+
+def test_weak_order_ext_uniformity():
+    assert check_uniformity(3, seed=0) > ALPHA
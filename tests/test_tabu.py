@@ -0,0 +1,31 @@
+from src.methods import MethodEnum
+from src.models import ModelEnum
+from src.performance_table.normal_performance_table import NormalPerformanceTable
+from src.preference_structure.generate import random_comparisons
+from src.sa.main import create_sa
+from src.srmp.model import SRMPModel
+
+
+def test_tabu_search_several_candidates():
+    A = NormalPerformanceTable.random(20, 4, 0)
+    D = random_comparisons(
+        A, SRMPModel.random(nb_profiles=2, nb_crit=4, rng=1), nb=30, rng=2
+    )
+    (tabu,), _ = create_sa(
+        ModelEnum.SRMP,
+        2,
+        A,
+        [D],
+        1,
+        0.05,
+        max_it=50,
+        rng_init=3,
+        rng_sa=4,
+        method=MethodEnum.TABU,
+        nb_candidates=5,
+    )
+
+    init_obj = tabu.objective(tabu.init_sol)
+    assert tabu.learn() is not None
+    assert tabu.best_obj <= init_obj
+    assert tabu.it > 0 or tabu.best_obj == 0